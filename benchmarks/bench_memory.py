@@ -0,0 +1,72 @@
+"""
+Замер памяти на один объект товара.
+
+Сравнивает текущие классы на __slots__ с раскладкой до перехода на них:
+атрибуты в __dict__ плюс сохраненные аргументы конструктора.
+
+Запуск: python -m benchmarks.bench_memory [количество объектов]
+"""
+import sys
+import tracemalloc
+
+from src.models import Product, Smartphone, LawnGrass, suppress_creation_log
+
+
+class DictLayout:
+    """Прежняя раскладка Product: __dict__ и копии аргументов конструктора."""
+
+    def __init__(self, name, description, price, quantity, *extra):
+        self._init_args = (name, description, price, quantity)
+        self._init_kwargs = {}
+        self._name = name
+        self.description = description
+        self._Product__price = price
+        self.quantity = quantity
+        for index, value in enumerate(extra):
+            setattr(self, f"extra{index}", value)
+
+
+def bytes_per_instance(factory, count: int) -> float:
+    """Средний прирост памяти на один созданный объект."""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    objects = [factory(index) for index in range(count)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del objects
+    return (after - before) / count
+
+
+def run(count: int = 100_000) -> dict:
+    # Строки создаются заранее, чтобы учитывать только сами объекты
+    names = [f"Товар {index}" for index in range(count)]
+    description = "Описание"
+    cases = {
+        'Product': (
+            lambda i: Product(names[i], description, 100.0, 5),
+            lambda i: DictLayout(names[i], description, 100.0, 5),
+        ),
+        'Smartphone': (
+            lambda i: Smartphone(names[i], description, 100.0, 5, 95.5, "Модель", 128, "Черный"),
+            lambda i: DictLayout(names[i], description, 100.0, 5, 95.5, "Модель", 128, "Черный"),
+        ),
+        'LawnGrass': (
+            lambda i: LawnGrass(names[i], description, 100.0, 5, "Россия", "7 дней", "Зеленый"),
+            lambda i: DictLayout(names[i], description, 100.0, 5, "Россия", "7 дней", "Зеленый"),
+        ),
+    }
+
+    results = {}
+    with suppress_creation_log():
+        for class_name, (slots_factory, dict_factory) in cases.items():
+            slots = bytes_per_instance(slots_factory, count)
+            legacy = bytes_per_instance(dict_factory, count)
+            results[class_name] = {'slots': slots, 'dict': legacy, 'saved': legacy - slots}
+    return results
+
+
+if __name__ == '__main__':
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    for class_name, result in run(count).items():
+        print(f"{class_name:<12} __slots__: {result['slots']:7.1f} Б, "
+              f"__dict__: {result['dict']:7.1f} Б, экономия: {result['saved']:7.1f} Б на объект")
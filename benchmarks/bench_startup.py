@@ -0,0 +1,105 @@
+"""
+Замер старта: время импорта модулей (python -X importtime), время от запуска
+интерпретатора до первой загруженной категории и скорость создания товаров.
+
+Каждый замер запускается в новом процессе несколько раз, в отчет идет медиана.
+Результаты пишутся в JSON и сравниваются так же, как в bench_suite.
+
+Запуск:
+    python -m benchmarks.bench_startup --output startup.json
+    python -m benchmarks.bench_startup --compare startup.json
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import timeit
+
+from src.models import Product, suppress_creation_log
+
+MODULES = ('src.models', 'src.data_loader')
+DEFAULT_RUNS = 7
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CATALOG = os.path.join(ROOT, 'products.json')
+
+# Печатает микросекунды от старта процесса до первой загруженной категории
+_FIRST_CATEGORY = """
+import time
+start = time.perf_counter()
+from src.data_loader import load_data_from_json
+category = load_data_from_json({path!r}, silent=True)[0]
+print(int((time.perf_counter() - start) * 1e6))
+"""
+
+
+def _run_python(args) -> subprocess.CompletedProcess:
+    # Без записи .pyc каждый запуск компилировал бы модули заново и замер бы не отражал обычный старт
+    env = dict(os.environ)
+    env.pop('PYTHONDONTWRITEBYTECODE', None)
+    return subprocess.run([sys.executable] + args, cwd=ROOT, env=env, capture_output=True, text=True, check=True)
+
+
+def import_time(module: str) -> int:
+    """Суммарное время импорта модуля с зависимостями в микросекундах по -X importtime."""
+    stderr = _run_python(['-X', 'importtime', '-c', f'import {module}']).stderr
+    for line in stderr.splitlines():
+        if not line.startswith('import time:'):
+            continue
+        _, cumulative_us, name = line[len('import time:'):].split('|')
+        if name.strip() == module:
+            return int(cumulative_us)
+    raise RuntimeError(f"Модуль {module} не найден в выводе -X importtime")
+
+
+def first_category_time(path: str = CATALOG) -> int:
+    """Время от начала импорта до первой загруженной категории в микросекундах."""
+    return int(_run_python(['-c', _FIRST_CATEGORY.format(path=path)]).stdout.strip())
+
+
+def construction_time(number: int = 100_000) -> float:
+    """Время создания одного Product без логирования в наносекундах."""
+    with suppress_creation_log():
+        seconds = min(timeit.repeat(lambda: Product("Товар", "Описание", 100.0, 1), number=number, repeat=5))
+    return seconds / number * 1e9
+
+
+def run_startup(runs: int = DEFAULT_RUNS) -> dict:
+    """Медианы всех замеров старта."""
+    _run_python(['-m', 'compileall', '-q', 'src'])
+    results = {f'import {module}': statistics.median(import_time(module) for _ in range(runs))
+               for module in MODULES}
+    results['first Category'] = statistics.median(first_category_time() for _ in range(runs))
+    return {'us': results, 'product_ns': construction_time()}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--runs', type=int, default=DEFAULT_RUNS, help="число запусков каждого замера")
+    parser.add_argument('--output', help="файл для результатов в JSON")
+    parser.add_argument('--compare', help="JSON прошлого прогона для сравнения")
+    args = parser.parse_args(argv)
+
+    report = run_startup(args.runs)
+    for name, value in report['us'].items():
+        print(f"{name:<24} {value / 1000:10.2f} мс")
+    print(f"{'Product()':<24} {report['product_ns']:10.0f} нс")
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as file:
+            json.dump(report, file, ensure_ascii=False, indent=2)
+
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as file:
+            baseline = json.load(file)
+        print("\nСравнение (старое / новое, больше 1 — быстрее):")
+        for name, value in report['us'].items():
+            if name in baseline['us']:
+                print(f"{name:<24} x{baseline['us'][name] / value:.2f}")
+        print(f"{'Product()':<24} x{baseline['product_ns'] / report['product_ns']:.2f}")
+
+
+if __name__ == '__main__':
+    sys.exit(main())
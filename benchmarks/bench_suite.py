@@ -0,0 +1,199 @@
+"""
+Набор замеров горячих путей models и data_loader на синтетических каталогах.
+
+Для каждого сценария и размера каталога записываются пропускная способность
+(товаров в секунду) и пиковая память (tracemalloc) в JSON, чтобы сравнивать коммиты.
+
+Запуск:
+    python -m benchmarks.bench_suite --sizes 1000,100000 --output bench.json
+    python -m benchmarks.bench_suite --sizes 1000 --compare bench.json
+"""
+import argparse
+import contextlib
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from benchmarks.synthetic import make_records, write_catalog
+from src.data_loader import load_data_from_json
+from src.models import Product, Category, render_cache, suppress_creation_log
+
+DEFAULT_SIZES = (1_000, 10_000, 100_000)
+
+# Минимальная длительность замера: быстрые сценарии повторяются до этого порога
+MIN_SECONDS = 0.2
+
+
+def _setup_records(size):
+    return make_records(size, mixed=False)
+
+
+def _setup_products(size):
+    with suppress_creation_log():
+        return [Product.new_product(record) for record in _setup_records(size)]
+
+
+def _setup_category(size):
+    category = Category("Замер", "Описание")
+    category.add_products(_setup_products(size))
+    return category
+
+
+def _setup_catalog_file(size):
+    file = tempfile.NamedTemporaryFile(suffix='.json', delete=False)
+    file.close()
+    write_catalog(file.name, size, mixed=False)
+    return file.name
+
+
+def _product_init(records):
+    for record in records:
+        Product(record['name'], record['description'], record['price'], record['quantity'])
+
+
+def _new_product(records):
+    for record in records:
+        Product.new_product(record)
+
+
+def _add_product(products):
+    category = Category("Замер", "Описание")
+    for product in products:
+        category.add_product(product)
+    # Отписываем категорию, чтобы повторные прогоны не копили наблюдателей на тех же товарах
+    for product in products:
+        product._watchers = ()
+
+
+def _render_uncached(category):
+    render_cache.clear()
+    return category.products
+
+
+def _product_add(products):
+    for first, second in zip(products[::2], products[1::2]):
+        first + second
+
+
+# Сценарий: (подготовка данных по размеру, замеряемая функция)
+CASES = {
+    'Product.__init__': (_setup_records, _product_init),
+    'Product.new_product': (_setup_records, _new_product),
+    'Category.add_product': (_setup_products, _add_product),
+    'Category.middle_price': (_setup_category, lambda category: category.middle_price()),
+    'Category.products': (_setup_category, lambda category: category.products),
+    'Category.products(uncached)': (_setup_category, _render_uncached),
+    'Category.top_products': (_setup_category, lambda category: category.top_products(10)),
+    'Product.__add__': (_setup_products, _product_add),
+    'load_data_from_json': (_setup_catalog_file, load_data_from_json),
+    'load_data_from_json(silent)': (_setup_catalog_file, lambda path: load_data_from_json(path, silent=True)),
+}
+
+
+def measure(case: str, size: int) -> dict:
+    """Замеряет один сценарий: товаров в секунду и пиковую память одного прогона."""
+    setup, run = CASES[case]
+    data = setup(size)
+
+    # Вывод add_product и логирования создания уходит в /dev/null, но форматирование остается в замере
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        try:
+            iterations = 0
+            start = time.perf_counter()
+            while True:
+                run(data)
+                iterations += 1
+                elapsed = time.perf_counter() - start
+                if elapsed >= MIN_SECONDS:
+                    break
+
+            tracemalloc.start()
+            run(data)
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+        finally:
+            if isinstance(data, str):
+                os.unlink(data)
+
+    return {
+        'items_per_sec': size * iterations / elapsed,
+        'seconds_per_run': elapsed / iterations,
+        'peak_bytes': peak,
+    }
+
+
+def _git_commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True,
+                              check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_suite(sizes=DEFAULT_SIZES, cases=None) -> dict:
+    """Прогоняет выбранные сценарии на всех размерах каталога."""
+    results = {}
+    for case in cases or CASES:
+        results[case] = {str(size): measure(case, size) for size in sizes}
+    return {
+        'meta': {
+            'commit': _git_commit(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        },
+        'results': results,
+    }
+
+
+def compare(current: dict, baseline: dict) -> list:
+    """Строки сравнения с прошлым прогоном: (сценарий, размер, отношение скорости, отношение памяти)."""
+    rows = []
+    for case, by_size in current['results'].items():
+        for size, result in by_size.items():
+            old = baseline.get('results', {}).get(case, {}).get(size)
+            if old is None:
+                continue
+            speed = result['items_per_sec'] / old['items_per_sec']
+            memory = result['peak_bytes'] / old['peak_bytes'] if old['peak_bytes'] else float('inf')
+            rows.append((case, size, speed, memory))
+    return rows
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sizes', default=','.join(map(str, DEFAULT_SIZES)),
+                        help="размеры каталога через запятую (например, 1000,10000000)")
+    parser.add_argument('--cases', help="сценарии через запятую (по умолчанию все)")
+    parser.add_argument('--output', help="файл для результатов в JSON")
+    parser.add_argument('--compare', help="JSON прошлого прогона для сравнения")
+    args = parser.parse_args(argv)
+
+    sizes = [int(size) for size in args.sizes.split(',')]
+    cases = args.cases.split(',') if args.cases else None
+    report = run_suite(sizes, cases)
+
+    for case, by_size in report['results'].items():
+        for size, result in by_size.items():
+            print(f"{case:<28} {size:>10} {result['items_per_sec']:14,.0f} тов./с "
+                  f"{result['peak_bytes'] / 1024:12,.1f} КиБ")
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as file:
+            json.dump(report, file, ensure_ascii=False, indent=2)
+
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as file:
+            baseline = json.load(file)
+        print(f"\nСравнение с {baseline['meta'].get('commit')}:")
+        for case, size, speed, memory in compare(report, baseline):
+            print(f"{case:<28} {size:>10} скорость x{speed:.2f}, память x{memory:.2f}")
+
+
+if __name__ == '__main__':
+    sys.exit(main())
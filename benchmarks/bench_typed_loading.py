@@ -0,0 +1,62 @@
+"""
+Пропускная способность создания товаров нужного класса из записей каталога.
+
+Сравнивает однопроходную диспетчеризацию по полю "type" (product_from_record)
+с прежним подходом: сначала Product.new_product, затем пересоздание объекта
+как Smartphone/LawnGrass с копированием полей.
+
+Запуск: python -m benchmarks.bench_typed_loading [количество записей]
+"""
+import sys
+import time
+
+from benchmarks.synthetic import make_records
+from src.models import Product, Smartphone, LawnGrass, product_from_record, suppress_creation_log
+
+
+def load_then_convert(records: list) -> list:
+    """Прежний подход: базовый Product, затем преобразование в наследника."""
+    products = [Product.new_product(record) for record in records]
+    converted = []
+    for product, record in zip(products, records):
+        kind = record.get("type", "product")
+        if kind == "smartphone":
+            product = Smartphone(product.name, product.description, product.price, product.quantity,
+                                 record["efficiency"], record["model"], record["memory"], record["color"])
+        elif kind == "lawn_grass":
+            product = LawnGrass(product.name, product.description, product.price, product.quantity,
+                                record["country"], record["germination_period"], record["color"])
+        converted.append(product)
+    return converted
+
+
+def single_pass(records: list) -> list:
+    """Диспетчеризация по типу за один проход."""
+    return [product_from_record(record) for record in records]
+
+
+def throughput(loader, records: list, repeat: int = 3) -> float:
+    """Лучшая пропускная способность из нескольких прогонов, записей в секунду."""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        loader(records)
+        best = min(best, time.perf_counter() - start)
+    return len(records) / best
+
+
+def run(count: int = 100_000) -> dict:
+    records = make_records(count)
+    with suppress_creation_log():
+        return {
+            'load_then_convert': throughput(load_then_convert, records),
+            'single_pass': throughput(single_pass, records),
+        }
+
+
+if __name__ == '__main__':
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    results = run(count)
+    for name, value in results.items():
+        print(f"{name:<18} {value:12,.0f} записей/с")
+    print(f"ускорение: {results['single_pass'] / results['load_then_convert']:.2f}x")
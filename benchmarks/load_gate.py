@@ -0,0 +1,213 @@
+"""
+Нагрузочная проверка конвейера каталога на регрессии памяти и скорости.
+
+Генерирует синтетический каталог в формате products.json (Product, Smartphone и
+LawnGrass вперемешку) и прогоняет этапы:
+    load         — load_data_from_json(silent=True) целиком;
+    load_verbose — load_data_from_json с выводом сообщений (stdout уходит в os.devnull);
+    construct    — Category.from_records по уже разобранным записям;
+    add_product  — товары из записей добавляются в пустые категории по одному через add_product;
+    render       — middle_price(), str() и products каждой категории с пустым кэшем строк.
+Для каждого этапа записываются время (лучший из прогонов; быстрый этап внутри прогона
+повторяется не меньше MIN_SECONDS, и берется среднее на повтор) и пиковая память по tracemalloc
+(отдельным прогоном, чтобы трассировка не искажала время). Результат сравнивается с
+сохраненной базой; при превышении допусков процесс завершается с кодом 1. База записывается
+по худшему из BASELINE_PASSES независимых прогонов, чтобы обычный разброс машины в нее укладывался.
+
+Запуск:
+    python -m benchmarks.load_gate
+    python -m benchmarks.load_gate --products 100000 --update-baseline
+"""
+import argparse
+import contextlib
+import gc
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from benchmarks.synthetic import write_catalog
+from src.data_loader import load_data_from_json
+from src.models import Category, product_from_record, render_cache, suppress_creation_log
+
+BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'baselines', 'load_gate.json')
+
+DEFAULT_PRODUCTS = 20_000
+DEFAULT_CATEGORIES = 20
+DEFAULT_RUNS = 5
+
+# Минимальная длительность прогона: короткие этапы (отрисовка) повторяются до этого порога,
+# иначе случайная пауза в несколько миллисекунд выглядит как регрессия
+MIN_SECONDS = 0.2
+
+# Независимых прогонов конвейера при записи базы: в базу идет худший результат каждого этапа,
+# чтобы база не фиксировала случайно быстрый момент машины
+BASELINE_PASSES = 3
+
+# Допустимый рост относительно базы: время шумит сильнее памяти
+TIME_TOLERANCE = 0.5
+MEMORY_TOLERANCE = 0.1
+
+
+def _stage_load(path, _):
+    return load_data_from_json(path, silent=True)
+
+
+def _stage_load_verbose(path, devnull):
+    with contextlib.redirect_stdout(devnull):
+        return load_data_from_json(path)
+
+
+def _stage_construct(_, parsed):
+    return [Category.from_records(data['name'], data['description'], data['products']) for data in parsed]
+
+
+def _stage_add_product(devnull, parsed):
+    categories = []
+    with contextlib.redirect_stdout(devnull):
+        for data in parsed:
+            category = Category(data['name'], data['description'])
+            with suppress_creation_log():
+                products = [product_from_record(record) for record in data['products']]
+            for product in products:
+                category.add_product(product)
+            categories.append(category)
+    return categories
+
+
+def _stage_render(_, categories):
+    render_cache.clear()
+    for category in categories:
+        category.middle_price()
+        str(category)
+        category.products
+
+
+def _measure(stage, path, data, runs: int) -> dict:
+    timings = []
+    for _ in range(runs):
+        gc.collect()
+        iterations = 0
+        start = time.perf_counter()
+        while True:
+            stage(path, data)
+            iterations += 1
+            elapsed = time.perf_counter() - start
+            if elapsed >= MIN_SECONDS:
+                break
+        timings.append(elapsed / iterations)
+
+    gc.collect()
+    tracemalloc.start()
+    stage(path, data)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    # Лучший прогон меньше всего зависит от фоновой нагрузки машины
+    return {'seconds': min(timings), 'peak_bytes': peak}
+
+
+def run_pipeline(n_products: int = DEFAULT_PRODUCTS, n_categories: int = DEFAULT_CATEGORIES,
+                 runs: int = DEFAULT_RUNS) -> dict:
+    """Прогоняет все этапы на синтетическом каталоге и возвращает замеры по этапам."""
+    # Этапы создают категории и товары: после замера счетчики Category возвращаются к прежним
+    counters = Category.category_count, Category.product_count
+    try:
+        with tempfile.TemporaryDirectory() as directory, open(os.devnull, 'w', encoding='utf-8') as devnull:
+            path = os.path.join(directory, 'catalog.json')
+            write_catalog(path, n_products, n_categories, mixed=True)
+            with open(path, encoding='utf-8') as file:
+                parsed = json.load(file)
+
+            results = {
+                'load': _measure(_stage_load, path, None, runs),
+                'load_verbose': _measure(_stage_load_verbose, path, devnull, runs),
+                'construct': _measure(_stage_construct, path, parsed, runs),
+                'add_product': _measure(_stage_add_product, devnull, parsed, runs),
+            }
+            categories = _stage_construct(path, parsed)
+            results['render'] = _measure(_stage_render, path, categories, runs)
+    finally:
+        Category.category_count, Category.product_count = counters
+    return {
+        'meta': {
+            'products': n_products,
+            'categories': n_categories,
+            'python': platform.python_version(),
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        },
+        'stages': results,
+    }
+
+
+def slowest(reports: list) -> dict:
+    """Сводит несколько отчетов run_pipeline в один: худшие время и память каждого этапа."""
+    merged = dict(reports[0], stages={})
+    for stage in reports[0]['stages']:
+        results = [report['stages'][stage] for report in reports]
+        merged['stages'][stage] = {
+            'seconds': max(result['seconds'] for result in results),
+            'peak_bytes': max(result['peak_bytes'] for result in results),
+        }
+    return merged
+
+
+def check(report: dict, baseline: dict, time_tolerance: float = TIME_TOLERANCE,
+          memory_tolerance: float = MEMORY_TOLERANCE) -> list:
+    """Список сообщений о регрессиях относительно базы (пустой — регрессий нет)."""
+    problems = []
+    for stage, result in report['stages'].items():
+        old = baseline['stages'].get(stage)
+        if old is None:
+            continue
+        if result['seconds'] > old['seconds'] * (1 + time_tolerance):
+            problems.append(f"{stage}: время {result['seconds']:.4f} с против {old['seconds']:.4f} с в базе")
+        if result['peak_bytes'] > old['peak_bytes'] * (1 + memory_tolerance):
+            problems.append(f"{stage}: память {result['peak_bytes']:,} Б против {old['peak_bytes']:,} Б в базе")
+    return problems
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--products', type=int, default=DEFAULT_PRODUCTS, help="число товаров в каталоге")
+    parser.add_argument('--categories', type=int, default=DEFAULT_CATEGORIES, help="число категорий")
+    parser.add_argument('--runs', type=int, default=DEFAULT_RUNS, help="прогонов каждого этапа для замера времени")
+    parser.add_argument('--baseline', default=BASELINE, help="файл базы в JSON")
+    parser.add_argument('--update-baseline', action='store_true', help="записать результат как новую базу")
+    parser.add_argument('--time-tolerance', type=float, default=TIME_TOLERANCE,
+                        help="допустимый рост времени (0.5 — на 50%%)")
+    parser.add_argument('--memory-tolerance', type=float, default=MEMORY_TOLERANCE,
+                        help="допустимый рост пиковой памяти")
+    args = parser.parse_args(argv)
+
+    passes = BASELINE_PASSES if args.update_baseline else 1
+    report = slowest([run_pipeline(args.products, args.categories, args.runs) for _ in range(passes)])
+    for stage, result in report['stages'].items():
+        print(f"{stage:<12} {result['seconds'] * 1000:10.1f} мс {result['peak_bytes'] / 1024:12,.1f} КиБ")
+
+    if args.update_baseline:
+        os.makedirs(os.path.dirname(os.path.abspath(args.baseline)), exist_ok=True)
+        with open(args.baseline, 'w', encoding='utf-8') as file:
+            json.dump(report, file, ensure_ascii=False, indent=2)
+            file.write('\n')
+        print(f"База записана в {args.baseline}")
+        return 0
+
+    with open(args.baseline, encoding='utf-8') as file:
+        baseline = json.load(file)
+    if (baseline['meta']['products'], baseline['meta']['categories']) != (args.products, args.categories):
+        print("Размер каталога не совпадает с базой: сравнение невозможно", file=sys.stderr)
+        return 2
+
+    problems = check(report, baseline, args.time_tolerance, args.memory_tolerance)
+    for problem in problems:
+        print(f"РЕГРЕССИЯ {problem}", file=sys.stderr)
+    if not problems:
+        print("Регрессий относительно базы нет")
+    return 1 if problems else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,41 @@
+"""Генерация синтетических каталогов в формате products.json."""
+import json
+
+
+def make_record(index: int, mixed: bool = True) -> dict:
+    """Запись товара; при mixed=True каждая вторая и третья запись — Smartphone и LawnGrass."""
+    record = {"name": f"Товар {index}", "description": f"Описание товара {index % 1000}",
+              "price": 100.0 + index % 10_000, "quantity": 1 + index % 50}
+    if mixed and index % 3 == 1:
+        record.update(type="smartphone", efficiency=95.5, model=f"Модель {index % 100}", memory=128,
+                      color="Черный")
+    elif mixed and index % 3 == 2:
+        record.update(type="lawn_grass", country="Россия", germination_period="7 дней", color="Зеленый")
+    return record
+
+
+def make_records(count: int, mixed: bool = True) -> list:
+    """Список из count записей товаров."""
+    return [make_record(index, mixed) for index in range(count)]
+
+
+def write_catalog(path: str, n_products: int, n_categories: int = 10, mixed: bool = True):
+    """
+    Записывает каталог из n_products товаров, поровну разложенных по n_categories категориям.
+    Файл пишется по одной категории, так что в памяти не держится весь каталог.
+    """
+    n_categories = max(1, min(n_categories, n_products))
+    per_category, rest = divmod(n_products, n_categories)
+    index = 0
+
+    with open(path, 'w', encoding='utf-8') as file:
+        file.write('[')
+        for number in range(n_categories):
+            size = per_category + (1 if number < rest else 0)
+            category = {"name": f"Категория {number}", "description": f"Описание категории {number}",
+                        "products": [make_record(i, mixed) for i in range(index, index + size)]}
+            index += size
+            if number:
+                file.write(',\n')
+            file.write(json.dumps(category, ensure_ascii=False))
+        file.write(']\n')
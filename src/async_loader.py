@@ -0,0 +1,101 @@
+import asyncio
+import logging
+import os
+
+from src.catalog_io import open_text
+from src.data_loader import CHUNK_SIZE, _JsonArrayParser, _build_category
+
+logger = logging.getLogger(__name__)
+
+
+def _read_categories(file, parser: _JsonArrayParser, silent: bool) -> list:
+    """
+    Читает порции, пока в буфере не найдется хотя бы одна целая категория, и строит
+    найденные категории. Выполняется в пуле потоков: разбор и создание товаров большой
+    категории не блокируют цикл событий.
+    """
+    while not parser.done:
+        parser.feed(file.read(parser.wanted))
+        categories = [_build_category(category_data, silent) for category_data in parser.parse()]
+        if categories:
+            return categories
+    return []
+
+
+async def aiter_categories_from_json(file_path: str, chunk_size: int = CHUNK_SIZE, silent: bool = False):
+    """
+    Асинхронно загружает JSON файл и по одной отдает объекты Category.
+    Чтение, разбор и создание категорий идут в пуле потоков, в цикле событий остается
+    только выдача готовых категорий, между которыми управление возвращается циклу.
+    """
+    loop = asyncio.get_running_loop()
+    file = await loop.run_in_executor(None, open_text, file_path)
+    try:
+        parser = _JsonArrayParser(chunk_size)
+        while not parser.done:
+            for category in await loop.run_in_executor(None, _read_categories, file, parser, silent):
+                yield category
+                await asyncio.sleep(0)
+    finally:
+        file.close()
+
+
+async def aload_data_from_json(file_path: str, chunk_size: int = CHUNK_SIZE, silent: bool = False) -> list:
+    """Асинхронный аналог load_data_from_json."""
+    return [category async for category in aiter_categories_from_json(file_path, chunk_size, silent)]
+
+
+class CatalogRefresher:
+    """
+    Периодически перечитывает файл каталога в фоне. Новый список категорий строится
+    целиком и только потом подменяет старый одной операцией присваивания, поэтому
+    читатели categories никогда не видят наполовину собранный каталог.
+    """
+
+    def __init__(self, file_path: str, interval: float = 60.0, silent: bool = True):
+        self.file_path = file_path
+        self.interval = interval
+        self.silent = silent
+        self.categories = []
+        self.last_error = None
+        self._mtime = None
+        self._task = None
+
+    async def refresh(self, force: bool = False) -> bool:
+        """Перечитывает каталог, если файл изменился. Возвращает True, если список заменен."""
+        loop = asyncio.get_running_loop()
+        mtime = (await loop.run_in_executor(None, os.stat, self.file_path)).st_mtime_ns
+        if not force and mtime == self._mtime:
+            return False
+
+        categories = await aload_data_from_json(self.file_path, silent=self.silent)
+        self.categories = categories
+        self._mtime = mtime
+        return True
+
+    async def _run(self):
+        while True:
+            try:
+                await self.refresh()
+                self.last_error = None
+            except (OSError, ValueError, KeyError, TypeError) as e:
+                # Оставляем прежний каталог и пробуем снова на следующем шаге
+                self.last_error = e
+                logger.warning("Не удалось обновить каталог %s: %s", self.file_path, e)
+            await asyncio.sleep(self.interval)
+
+    def start(self):
+        """Запускает фоновое обновление в текущем цикле событий."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._run())
+        return self._task
+
+    async def stop(self):
+        """Останавливает фоновое обновление."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
@@ -0,0 +1,171 @@
+from bisect import bisect_left, bisect_right, insort
+
+# Длина n-граммы для подстрочного поиска
+NGRAM = 3
+
+# Символ больше любого другого — верхняя граница при поиске по префиксу
+_MAX_CHAR = chr(0x10FFFF)
+
+
+def _ngrams(text: str) -> set:
+    text = text.lower()
+    return {text[i:i + NGRAM] for i in range(len(text) - NGRAM + 1)}
+
+
+class CatalogIndex:
+    """
+    Индексы для поиска товаров по набору категорий: по точному названию,
+    префиксу и подстроке названия/описания, диапазону цен и категории.
+    Индексы обновляются при add_product/add_products, remove_product и при смене цены товара.
+    """
+
+    def __init__(self, categories=()):
+        self._products = {}          # id(product) -> product
+        self._categories = {}        # id(product) -> список категорий товара
+        self._by_name = {}           # название -> список товаров
+        self._names = []             # отсортированные уникальные названия
+        self._ngrams = {}            # n-грамма -> множество id(product)
+        self._prices = []            # отсортированные пары (цена, id(product))
+
+        for category in categories:
+            self.add_category(category)
+
+    def __len__(self):
+        return len(self._products)
+
+    def add_category(self, category):
+        """Индексирует товары категории и подписывается на её изменения."""
+        category._subscribe(self._on_category_changed)
+        self._on_category_changed('added', category, category.get_products_list())
+
+    def _on_category_changed(self, event: str, category, products: list):
+        if event == 'added':
+            for product in products:
+                self._add(category, product)
+        elif event == 'removed':
+            for product in products:
+                self._remove(category, product)
+
+    def _add(self, category, product):
+        key = id(product)
+        categories = self._categories.get(key)
+        if categories is not None:
+            # Товар уже проиндексирован через другую категорию (или повторно через эту же)
+            categories.append(category)
+            return
+
+        self._products[key] = product
+        # Категории товара с учетом повторов: одна запись на каждое вхождение
+        self._categories[key] = [category]
+
+        same_name = self._by_name.setdefault(product.name, [])
+        if not same_name:
+            insort(self._names, product.name)
+        same_name.append(product)
+
+        for gram in _ngrams(product.name) | _ngrams(product.description):
+            self._ngrams.setdefault(gram, set()).add(key)
+
+        insort(self._prices, (product.price, key))
+        product._watch(self)
+
+    def _remove(self, category, product):
+        key = id(product)
+        categories = self._categories.get(key)
+        if categories is None:
+            return
+        if category in categories:
+            categories.remove(category)
+        if categories:
+            # Товар остается в другой категории
+            return
+
+        del self._categories[key]
+        del self._products[key]
+
+        same_name = self._by_name[product.name]
+        same_name.remove(product)
+        if not same_name:
+            del self._by_name[product.name]
+            del self._names[bisect_left(self._names, product.name)]
+
+        for gram in _ngrams(product.name) | _ngrams(product.description):
+            keys = self._ngrams.get(gram)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._ngrams[gram]
+
+        del self._prices[bisect_left(self._prices, (product.price, key))]
+        product._unwatch(self)
+
+    def _product_changed(self, product, field: str, old, new):
+        key = id(product)
+        if field == 'description':
+            self._reindex_text(key, _ngrams(product.name) | _ngrams(old), _ngrams(product.name) | _ngrams(new))
+            return
+        if field != 'price':
+            return
+        position = bisect_left(self._prices, (old, key))
+        if position < len(self._prices) and self._prices[position] == (old, key):
+            del self._prices[position]
+        insort(self._prices, (new, key))
+
+    def _reindex_text(self, key: int, old_grams: set, new_grams: set):
+        for gram in old_grams - new_grams:
+            keys = self._ngrams.get(gram)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._ngrams[gram]
+        for gram in new_grams - old_grams:
+            self._ngrams.setdefault(gram, set()).add(key)
+
+    def _filter(self, products, category):
+        if category is None:
+            return list(products)
+        return [product for product in products
+                if any(c.name == category for c in self._categories[id(product)])]
+
+    def by_name(self, name: str, category: str = None) -> list:
+        """Товары с точно совпадающим названием."""
+        return self._filter(self._by_name.get(name, ()), category)
+
+    def by_prefix(self, prefix: str, category: str = None) -> list:
+        """Товары, название которых начинается с prefix (с учетом регистра)."""
+        start = bisect_left(self._names, prefix)
+        end = bisect_right(self._names, prefix + _MAX_CHAR)
+        found = [product for name in self._names[start:end] for product in self._by_name[name]]
+        return self._filter(found, category)
+
+    def search(self, text: str, category: str = None) -> list:
+        """Товары, в названии или описании которых есть подстрока text (без учета регистра)."""
+        needle = text.lower()
+        grams = _ngrams(needle)
+
+        if grams:
+            keys = None
+            for gram in sorted(grams, key=lambda g: len(self._ngrams.get(g, ()))):
+                matched = self._ngrams.get(gram)
+                if not matched:
+                    return []
+                keys = set(matched) if keys is None else keys & matched
+            candidates = [self._products[key] for key in keys if key in self._products]
+        else:
+            # Для коротких запросов n-граммы не помогают
+            candidates = self._products.values()
+
+        found = [product for product in candidates
+                 if needle in product.name.lower() or needle in product.description.lower()]
+        return self._filter(found, category)
+
+    def price_range(self, low: float = None, high: float = None, category: str = None) -> list:
+        """Товары с ценой в диапазоне [low, high], отсортированные по цене."""
+        start = 0 if low is None else bisect_left(self._prices, (low,))
+        end = len(self._prices) if high is None else bisect_right(self._prices, (high, float('inf')))
+        found = [self._products[key] for _, key in self._prices[start:end]]
+        return self._filter(found, category)
+
+    def by_category(self, category: str) -> list:
+        """Все проиндексированные товары категорий с данным названием."""
+        return self._filter(self._products.values(), category)
@@ -0,0 +1,28 @@
+from src.columnar import ColumnarCategory, EXTRA_FIELDS
+
+# Размер буфера записи: строки копятся в нем, а не в общей строке всего файла
+BUFFER_SIZE = 1024 * 1024
+
+
+def open_text(file_path: str, mode: str = 'r', compress: bool = None):
+    """
+    Открывает текстовый файл каталога в UTF-8. Файлы с расширением .gz (или при
+    compress=True) читаются и пишутся через gzip.
+    """
+    if compress is None:
+        compress = file_path.endswith('.gz')
+    if not compress:
+        return open(file_path, mode, encoding='utf-8', newline='', buffering=BUFFER_SIZE)
+    # gzip нужен только для сжатых файлов: не удлиняем им импорт
+    import gzip
+    return gzip.open(file_path, mode + 't', encoding='utf-8', newline='')
+
+
+def product_rows(category):
+    """Строки товаров категории: (класс, название, описание, цена, количество, доп. поля)."""
+    if isinstance(category, ColumnarCategory):
+        return zip(category._kinds, category._names, category._descriptions,
+                   category._prices, category._quantities, category._extras)
+    return ((type(product), product.name, product.description, product.price, product.quantity,
+             tuple(getattr(product, field) for field in EXTRA_FIELDS[type(product)]))
+            for product in category.get_products_list())
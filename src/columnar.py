@@ -0,0 +1,267 @@
+import heapq
+import operator
+from array import array
+
+from operator import itemgetter
+
+from src.models import Product, Category, ZeroQuantityError, PRODUCT_TYPES, TYPE_FIELD, suppress_creation_log
+
+try:
+    import numpy as np
+except ImportError:  # numpy необязателен: без него агрегаты считаются по array
+    np = None
+
+# Дополнительные поля наследников Product в порядке аргументов конструктора
+EXTRA_FIELDS = {cls: cls.record_fields[len(Product.record_fields):] for cls in PRODUCT_TYPES.values()}
+
+# Тип записи -> (класс, извлекатель дополнительных полей)
+_EXTRA_GETTERS = {
+    type_name: (cls, itemgetter(*EXTRA_FIELDS[cls]) if EXTRA_FIELDS[cls] else None)
+    for type_name, cls in PRODUCT_TYPES.items()
+}
+
+
+class ColumnarCategory(Category):
+    """
+    Категория с колоночным хранением товаров: цены и количества лежат в массивах,
+    названия и описания — в параллельных списках. Агрегаты считаются без обхода
+    объектов Product, сами объекты создаются только по запросу.
+    """
+
+    def __init__(self, name: str, description: str, products: list = None):
+        self._names = []
+        self._descriptions = []
+        self._prices = array('d')
+        self._quantities = array('q')
+        self._kinds = []
+        self._extras = []
+        self._materialized = None
+        super().__init__(name, description, products)
+
+    @classmethod
+    def _from_columns(cls, name: str, description: str, names, descriptions, prices, quantities,
+                      kinds, extras):
+        """
+        Создает категорию поверх готовых колонок без проверки товаров. Колонки могут быть
+        любыми последовательностями (например, memoryview над снимком каталога).
+        """
+        category = cls(name, description)
+        category._names = names
+        category._descriptions = descriptions
+        category._prices = prices
+        category._quantities = quantities
+        category._kinds = kinds
+        category._extras = extras
+        Category._update_counters(products=len(names))
+        return category
+
+    def _ensure_writable(self):
+        """Копирует колонки в изменяемые списки и массивы перед первым добавлением."""
+        if isinstance(self._prices, array) and isinstance(self._names, list):
+            return
+        self._names = list(self._names)
+        self._descriptions = list(self._descriptions)
+        self._prices = array('d', self._prices)
+        self._quantities = array('q', self._quantities)
+        self._kinds = list(self._kinds)
+        self._extras = list(self._extras)
+
+    def _store(self, product):
+        kind = type(product)
+        if kind not in EXTRA_FIELDS:
+            raise TypeError(f"Класс {kind.__name__} не поддерживается колоночным хранилищем")
+
+        self._ensure_writable()
+        size = len(self._names)
+        try:
+            # Числовые колонки первыми: нечисловая цена или количество отвергаются до остальных
+            self._prices.append(product.price)
+            self._quantities.append(product.quantity)
+            self._extras.append(tuple(getattr(product, field) for field in EXTRA_FIELDS[kind]))
+        except Exception:
+            self._truncate(size)
+            raise
+        self._names.append(product.name)
+        self._descriptions.append(product.description)
+        self._kinds.append(kind)
+        self._materialized = None
+
+    def _store_many(self, products: list):
+        size = len(self._names)
+        try:
+            for product in products:
+                self._store(product)
+        except Exception:
+            self._truncate(size)
+            raise
+
+    def _truncate(self, size: int):
+        """Отбрасывает строки колонок начиная с size (откат неудачного добавления)."""
+        for column in (self._names, self._descriptions, self._prices, self._quantities, self._kinds, self._extras):
+            del column[size:]
+
+    def _discard(self, product):
+        # Материализованные товары — снимки колонок, поэтому удалить их по ссылке нельзя
+        raise TypeError("Колоночная категория не поддерживает удаление товаров")
+
+    def _discard_many(self, products: list):
+        raise TypeError("Колоночная категория не поддерживает удаление товаров")
+
+    @classmethod
+    def from_records(cls, name: str, description: str, records, product_cls=None):
+        """Заполняет колонки прямо из словарей, не создавая объекты Product."""
+        if product_cls not in (None, Product):
+            return super().from_records(name, description, records, product_cls)
+
+        names, descriptions = [], []
+        prices, quantities = array('d'), array('q')
+        kinds, extras = [], []
+
+        for record in records:
+            if record['quantity'] == 0:
+                raise ZeroQuantityError(f"Товар '{record['name']}' с нулевым количеством не может быть добавлен")
+            type_name = record.get(TYPE_FIELD, 'product')
+            if type_name not in _EXTRA_GETTERS:
+                raise ValueError(f"Неизвестный тип товара: {type_name}")
+            kind, getter = _EXTRA_GETTERS[type_name]
+
+            names.append(record['name'])
+            descriptions.append(record['description'])
+            prices.append(record['price'])
+            quantities.append(record['quantity'])
+            kinds.append(kind)
+            extras.append(getter(record) if getter else ())
+
+        return cls._from_columns(name, description, names, descriptions, prices, quantities, kinds, extras)
+
+    def _column(self, field: str):
+        """Возвращает колонку как массив numpy (без копирования) или как array."""
+        column = self._prices if field == 'price' else self._quantities
+        if np is not None:
+            return np.frombuffer(column, dtype=np.float64 if field == 'price' else np.int64)
+        return column
+
+    def __len__(self):
+        return len(self._names)
+
+    def __str__(self):
+        return f"{self.name}, количество продуктов: {self.total_quantity()} шт."
+
+    def middle_price(self):
+        """Рассчитывает средний ценник всех товаров в категории."""
+        if not self._names:
+            return 0
+        if np is not None:
+            return float(self._column('price').mean())
+        return float(sum(self._prices)) / len(self._prices)
+
+    def total_quantity(self) -> int:
+        """Суммарный остаток товаров."""
+        if np is not None and self._names:
+            return int(self._column('quantity').sum())
+        return sum(self._quantities)
+
+    def stock_value(self) -> float:
+        """Суммарная стоимость остатков (цена × количество)."""
+        if np is not None and self._names:
+            return float(np.dot(self._column('price'), self._column('quantity')))
+        return float(sum(map(operator.mul, self._prices, self._quantities)))
+
+    def stock_value_by_class(self) -> dict:
+        """Стоимость остатков по классам товаров, посчитанная по колонкам."""
+        kinds = set(self._kinds)
+        if len(kinds) <= 1:
+            # Однородная категория — весь расчет векторный
+            return {kind: self.stock_value() for kind in kinds}
+
+        if np is not None:
+            values = (self._column('price') * self._column('quantity')).tolist()
+        else:
+            values = map(operator.mul, self._prices, self._quantities)
+        result = dict.fromkeys(kinds, 0.0)
+        for kind, value in zip(self._kinds, values):
+            result[kind] += value
+        return result
+
+    def min_price(self):
+        """Минимальная цена в категории (None для пустой категории)."""
+        if not self._names:
+            return None
+        return float(self._column('price').min()) if np is not None else min(self._prices)
+
+    def max_price(self):
+        """Максимальная цена в категории (None для пустой категории)."""
+        if not self._names:
+            return None
+        return float(self._column('price').max()) if np is not None else max(self._prices)
+
+    def filtered_sum(self, field: str = 'quantity', min_price: float = None, max_price: float = None):
+        """
+        Сумма поля 'price', 'quantity' или 'stock_value' по товарам,
+        цена которых попадает в диапазон [min_price, max_price].
+        """
+        if field not in ('price', 'quantity', 'stock_value'):
+            raise ValueError(f"Неизвестное поле: {field}")
+        low = float('-inf') if min_price is None else min_price
+        high = float('inf') if max_price is None else max_price
+
+        if np is not None and self._names:
+            prices = self._column('price')
+            quantities = self._column('quantity')
+            mask = (prices >= low) & (prices <= high)
+            if field == 'price':
+                return float(prices[mask].sum())
+            if field == 'quantity':
+                return int(quantities[mask].sum())
+            return float(np.dot(prices[mask], quantities[mask]))
+
+        total = 0
+        for price, quantity in zip(self._prices, self._quantities):
+            if low <= price <= high:
+                if field == 'price':
+                    total += price
+                elif field == 'quantity':
+                    total += quantity
+                else:
+                    total += price * quantity
+        return total
+
+    def _select(self, n: int, field: str, largest: bool) -> list:
+        """Выборка по колонкам: объекты создаются только для товаров, попавших в результат."""
+        if field not in ('price', 'quantity', 'stock_value'):
+            return super()._select(n, field, largest)
+        if field == 'stock_value':
+            prices, quantities = self._prices, self._quantities
+
+            def key(index: int):
+                return prices[index] * quantities[index]
+        else:
+            key = (self._prices if field == 'price' else self._quantities).__getitem__
+
+        select = heapq.nlargest if largest else heapq.nsmallest
+        return [self.product_at(index) for index in select(n, range(len(self)), key=key)]
+
+    @property
+    def products(self):
+        return "\n".join(
+            f"{name}, {price} руб. Остаток: {quantity} шт."
+            for name, price, quantity in zip(self._names, self._prices, self._quantities)
+        )
+
+    def product_at(self, index: int):
+        """Создает объект товара по индексу, не материализуя остальные."""
+        if self._materialized is not None:
+            return self._materialized[index]
+        kind = self._kinds[index]
+        with suppress_creation_log():
+            return kind(self._names[index], self._descriptions[index], self._prices[index],
+                        self._quantities[index], *self._extras[index])
+
+    def get_products_list(self):
+        """
+        Материализует объекты товаров при первом обращении и кэширует их до следующего
+        добавления. Объекты являются снимками: изменения их полей не попадают в колонки.
+        """
+        if self._materialized is None:
+            self._materialized = [self.product_at(index) for index in range(len(self._names))]
+        return self._materialized
@@ -1,29 +1,367 @@
+import csv
 import json
-from models import Product, Category
+from itertools import groupby
+from operator import itemgetter
+from time import perf_counter
 
+from src.catalog_io import open_text
+from src.export import CATEGORY_FIELDS, CSV_CONVERTERS
+from src.instrumentation import metrics, instrumented
+from src.lazy import LazyCategory
+from src.models import Category, PRODUCT_TYPES, TYPE_FIELD, product_from_record, suppress_creation_log
+from src.snapshot import save_snapshot, load_snapshot  # noqa: F401
+from src.validation import ValidationReport, filter_category
 
-def load_data_from_json(file_path: str) -> list:
+# Размер порции, которой файл читается при потоковой загрузке
+CHUNK_SIZE = 64 * 1024
+
+_WHITESPACE = ' \t\n\r'
+
+# Ошибка разбора ближе этого числа символов к концу буфера может означать оборванный элемент
+# (недочитанное число, литерал или escape-последовательность)
+_TRUNCATION_TAIL = 64
+
+
+def _is_truncated(error: json.JSONDecodeError, length: int) -> bool:
+    """Похожа ли ошибка разбора на обрыв элемента на границе порции, а не на ошибку синтаксиса."""
+    return error.msg.startswith('Unterminated string') or error.pos >= length - _TRUNCATION_TAIL
+
+
+class _JsonArrayParser:
     """
-    Загружает данные из JSON файла и создает объекты Category и Product.
+    Поэлементно разбирает JSON-массив верхнего уровня по мере поступления текста.
+    В памяти одновременно держится только текст текущего элемента и одна порция файла.
+    Источник текста внешний, поэтому разбор одинаково работает с обычным и асинхронным чтением.
     """
-    categories = []
 
-    with open(file_path, 'r', encoding='utf-8') as file:
-        data = json.load(file)
+    def __init__(self, chunk_size: int = CHUNK_SIZE):
+        self._decoder = json.JSONDecoder()
+        self._buffer = ''
+        self._pos = 0
+        self._eof = False
+        self._expect = '['
+        self.chunk_size = chunk_size
+        # Сколько символов прочитать следующей порцией
+        self.wanted = chunk_size
+        self.done = False
+        # Номер строки файла (с 1), с которой начинается последний отданный элемент
+        self.value_line = None
+        # Переводов строк до позиции _line_pos буфера
+        self._lines = 0
+        self._line_pos = 0
+
+    def feed(self, chunk: str):
+        """Отбрасывает разобранную часть буфера и добавляет очередную порцию ('' — конец файла)."""
+        self._lines += self._buffer.count('\n', self._line_pos, self._pos)
+        self._line_pos = 0
+        self._buffer = self._buffer[self._pos:] + chunk
+        self._pos = 0
+        self._eof = not chunk
+
+    def parse(self):
+        """Отдает все элементы, целиком лежащие в буфере; возвращается, когда нужна следующая порция."""
+        buffer, pos = self._buffer, self._pos
+        self.wanted = self.chunk_size
+
+        while not self.done:
+            while pos < len(buffer) and buffer[pos] in _WHITESPACE:
+                pos += 1
 
-        for category_data in data:
-            # Создаём категорию БЕЗ товаров
-            category = Category(
-                name=category_data['name'],
-                description=category_data['description']
-            )
+            if pos == len(buffer):
+                if not self._eof:
+                    break
+                if self._expect != 'end':
+                    raise json.JSONDecodeError("Неожиданный конец файла", buffer, pos)
+                self.done = True
+                break
+
+            char = buffer[pos]
+
+            if self._expect == 'end':
+                raise json.JSONDecodeError("Лишние данные после массива категорий", buffer, pos)
+            if self._expect == '[':
+                if char != '[':
+                    raise json.JSONDecodeError("Ожидался массив категорий", buffer, pos)
+                pos += 1
+                self._expect = 'value_or_end'
+            elif self._expect == 'separator':
+                if char == ']':
+                    # После массива допускаются только пробельные символы до конца файла
+                    pos += 1
+                    self._expect = 'end'
+                    continue
+                if char != ',':
+                    raise json.JSONDecodeError("Ожидалась ',' или ']'", buffer, pos)
+                pos += 1
+                self._expect = 'value'
+            else:
+                if char == ']' and self._expect == 'value_or_end':
+                    pos += 1
+                    self._expect = 'end'
+                    continue
+                try:
+                    value, end = self._decoder.raw_decode(buffer, pos)
+                except json.JSONDecodeError as error:
+                    if self._eof or not _is_truncated(error, len(buffer)):
+                        # Ошибка посреди уже прочитанного текста — дочитывать файл бессмысленно
+                        raise
+                    # Элемент не поместился в буфер — увеличиваем порцию вдвое
+                    self.wanted = max(self.chunk_size, len(buffer) - pos)
+                    break
+
+                # Значение, упирающееся в конец буфера, может продолжаться в следующей порции
+                if end == len(buffer) and not self._eof:
+                    break
+
+                self.value_line = self.line_at(pos)
+                pos = end
+                self._expect = 'separator'
+                self._pos = pos
+                yield value
+
+        self._pos = pos
+
+    def line_at(self, pos: int) -> int:
+        """Номер строки файла (с 1) для позиции pos текущего буфера, не раньше уже пройденных."""
+        self._lines += self._buffer.count('\n', self._line_pos, pos)
+        self._line_pos = pos
+        return self._lines + 1
+
+
+def _iter_json_array(file, chunk_size: int = CHUNK_SIZE, parser: _JsonArrayParser = None):
+    """
+    Поэлементно разбирает JSON-массив верхнего уровня из открытого файла, не читая его целиком.
+    Переданный parser позволяет узнать позицию каждого элемента (parser.value_line).
+    """
+    parser = parser or _JsonArrayParser(chunk_size)
+    while not parser.done:
+        parser.feed(file.read(parser.wanted))
+        yield from parser.parse()
+
+
+def _timed(iterable, name: str):
+    """Замеряет время получения каждого элемента итератора, если метрики включены."""
+    iterator = iter(iterable)
+    while True:
+        start = perf_counter() if metrics.enabled else None
+        try:
+            item = next(iterator)
+        except StopIteration:
+            return
+        if start is not None:
+            metrics.observe(name, perf_counter() - start)
+        yield item
+
+
+def _new_category(category_data: dict) -> Category:
+    # Создаём категорию БЕЗ товаров
+    return Category(
+        name=category_data['name'],
+        description=category_data['description']
+    )
+
+
+def _build_category(category_data: dict, silent: bool = False, lazy: bool = False) -> Category:
+    """Создает категорию с товарами из разобранной записи каталога."""
+    if lazy:
+        return LazyCategory(category_data['name'], category_data['description'], category_data['products'])
+    if silent:
+        return Category.from_records(category_data['name'], category_data['description'],
+                                     category_data['products'])
+
+    category = _new_category(category_data)
+
+    # Добавляем товары через метод add_product
+    for product_data in category_data['products']:
+        # Класс товара выбирается по полю "type" записи
+        product = product_from_record(product_data)
+        category.add_product(product)
+
+    return category
+
+
+def iter_products_from_json(file_path: str, chunk_size: int = CHUNK_SIZE):
+    """
+    Потоково загружает JSON файл и по одной отдает пары (category, product)
+    по мере разбора. Категория наполняется товарами постепенно.
+    """
+    with open_text(file_path) as file:
+        for category_data in _iter_json_array(file, chunk_size):
+            category = _new_category(category_data)
 
-            # Добавляем товары через метод add_product
             for product_data in category_data['products']:
-                # Используем класс-метод для создания продукта
-                product = Product.new_product(product_data)
+                product = product_from_record(product_data)
                 category.add_product(product)
+                yield category, product
+
+
+def _iter_valid_json_array(file, chunk_size: int, report: ValidationReport):
+    """Как _iter_json_array, но проверяет записи и отдает категории только с корректными товарами."""
+    parser = _JsonArrayParser(chunk_size)
+    for index, category_data in enumerate(_iter_json_array(file, chunk_size, parser)):
+        category_data = filter_category(category_data, report, index, parser.value_line)
+        if category_data is not None:
+            yield category_data
+
+
+def validate_catalog(file_path: str, chunk_size: int = CHUNK_SIZE, max_issues: int = 1000) -> ValidationReport:
+    """
+    Проверяет файл каталога за один потоковый проход, не создавая объекты товаров:
+    схему записей, нулевые количества и неположительные цены. Память ограничена одной
+    категорией и max_issues ошибками. Синтаксическая ошибка JSON завершает проверку
+    и попадает в отчет с кодом 'syntax'.
+    """
+    report = ValidationReport(max_issues)
+    parser = _JsonArrayParser(chunk_size)
+    with open_text(file_path) as file:
+        try:
+            for index, category_data in enumerate(_iter_json_array(file, chunk_size, parser)):
+                filter_category(category_data, report, index, parser.value_line)
+        except json.JSONDecodeError as e:
+            report.add(parser.line_at(e.pos), report.categories, None, 'syntax', e.msg)
+    return report
+
+
+def iter_categories_from_json(file_path: str, chunk_size: int = CHUNK_SIZE, silent: bool = False,
+                              lazy: bool = False, skip_invalid: bool = False, report: ValidationReport = None):
+    """
+    Потоково загружает JSON файл и по одной отдает готовые объекты Category.
+    Память ограничена размером одной категории, а не всего файла.
+    При silent=True товары добавляются пакетно через Category.from_records без print.
+    При lazy=True возвращаются LazyCategory, создающие товары только при обращении к ним.
+    При skip_invalid=True некорректные товары и категории пропускаются, а не прерывают
+    загрузку; ошибки записываются в report, если он передан.
+    """
+    with open_text(file_path) as file:
+        if skip_invalid:
+            items = _iter_valid_json_array(file, chunk_size, report if report is not None else ValidationReport())
+        else:
+            items = _iter_json_array(file, chunk_size)
+        for category_data in _timed(items, 'load.parse'):
+            with metrics.timer('load.build'):
+                category = _build_category(category_data, silent, lazy)
+            yield category
+
+
+@instrumented('load_data_from_json')
+def load_data_from_json(file_path: str, silent: bool = False, lazy: bool = False, skip_invalid: bool = False,
+                        report: ValidationReport = None) -> list:
+    """
+    Загружает данные из JSON файла и создает объекты Category и Product.
+    """
+    return list(iter_categories_from_json(file_path, silent=silent, lazy=lazy, skip_invalid=skip_invalid,
+                                          report=report))
+
+
+# Столбцы CSV, которые используются записью каждого типа товара
+_CSV_FIELDS = {
+    type_name: frozenset(CATEGORY_FIELDS + (TYPE_FIELD,) + cls.record_fields)
+    for type_name, cls in PRODUCT_TYPES.items()
+}
+
+
+def _csv_records(file):
+    """
+    Записи товаров из CSV экспорта: столбцы, которых нет у типа товара, отбрасываются,
+    числа восстанавливаются. Пустые строки в используемых полях (например, описание) сохраняются.
+    """
+    for row in csv.DictReader(file):
+        # Для неизвестного типа оставляем непустые ячейки: ошибку сообщит сборка товара
+        used = _CSV_FIELDS.get(row.get(TYPE_FIELD) or 'product')
+        record = {}
+        for field, value in row.items():
+            if (field in used) if used is not None else value != '':
+                converter = CSV_CONVERTERS.get(field)
+                record[field] = converter(value) if converter else value
+        yield record
+
+
+def _ndjson_records(file):
+    for line in file:
+        if line.strip():
+            yield json.loads(line)
+
+
+def _group_records(records):
+    """Собирает идущие подряд записи товаров одной категории в запись категории."""
+    for (name, description), group in groupby(records, key=itemgetter(*CATEGORY_FIELDS)):
+        products = []
+        for record in group:
+            for field in CATEGORY_FIELDS:
+                del record[field]
+            products.append(record)
+        yield {'name': name, 'description': description, 'products': products}
+
+
+def iter_categories_from_rows(file_path: str, file_format: str = None, silent: bool = False, lazy: bool = False):
+    """
+    Потоково загружает каталог из CSV или NDJSON, записанного export_csv/export_ndjson.
+    Формат определяется по расширению (.csv, .ndjson, .jsonl, в том числе с .gz).
+    В памяти держится одна категория.
+    """
+    if file_format is None:
+        name = file_path[:-3] if file_path.endswith('.gz') else file_path
+        file_format = 'csv' if name.endswith('.csv') else 'ndjson'
+    read = _csv_records if file_format == 'csv' else _ndjson_records
+    with open_text(file_path) as file:
+        for category_data in _group_records(read(file)):
+            yield _build_category(category_data, silent, lazy)
+
+
+def load_data_from_rows(file_path: str, file_format: str = None, silent: bool = False, lazy: bool = False) -> list:
+    """Загружает каталог из CSV или NDJSON в список Category."""
+    return list(iter_categories_from_rows(file_path, file_format, silent, lazy))
+
+
+def _parse_catalog_file(file_path: str):
+    """
+    Разбирает и проверяет один файл каталога в процессе-обработчике.
+    Возвращает (путь, [(название, описание, товары), ...], ошибка).
+    """
+    try:
+        parsed = []
+        with open_text(file_path) as file, suppress_creation_log():
+            for category_data in _iter_json_array(file):
+                products = [product_from_record(product_data) for product_data in category_data['products']]
+                parsed.append((category_data['name'], category_data['description'], products))
+        return file_path, parsed, None
+    except (OSError, ValueError, KeyError, TypeError) as e:
+        # ValueError покрывает и ZeroQuantityError, и json.JSONDecodeError
+        return file_path, None, e
+
+
+def load_catalogs(file_paths, workers: int = None):
+    """
+    Загружает несколько файлов каталога параллельно в пуле процессов.
+    Категории с одинаковым названием объединяются, счетчики Category учитывают
+    итоговый набор. Файл с ошибкой пропускается целиком и не прерывает загрузку.
+    Возвращает (список категорий, {путь: исключение}).
+    """
+    file_paths = list(file_paths)
+    if workers == 1 or len(file_paths) <= 1:
+        results = map(_parse_catalog_file, file_paths)
+        return _merge_parsed(results)
+
+    # Пул процессов тянет за собой multiprocessing: импортируем его только здесь, не при старте
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return _merge_parsed(executor.map(_parse_catalog_file, file_paths))
+
+
+def _merge_parsed(results):
+    categories = {}
+    errors = {}
+
+    for file_path, parsed, error in results:
+        if error is not None:
+            errors[file_path] = error
+            continue
 
-            categories.append(category)
+        for name, description, products in parsed:
+            category = categories.get(name)
+            if category is None:
+                category = categories[name] = Category(name, description)
+            category.add_products(products)
 
-    return categories
+    return list(categories.values()), errors
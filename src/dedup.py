@@ -0,0 +1,138 @@
+from src.columnar import ColumnarCategory
+
+
+def _first(price, quantity, other_price, other_quantity):
+    return price
+
+
+def _last(price, quantity, other_price, other_quantity):
+    return other_price
+
+
+def _min(price, quantity, other_price, other_quantity):
+    return min(price, other_price)
+
+
+def _max(price, quantity, other_price, other_quantity):
+    return max(price, other_price)
+
+
+def _weighted(price, quantity, other_price, other_quantity):
+    # Средняя цена, взвешенная по количеству, сохраняет суммарную стоимость остатков
+    return (price * quantity + other_price * other_quantity) / (quantity + other_quantity)
+
+
+def _error(price, quantity, other_price, other_quantity):
+    raise ValueError(f"Конфликт цен дубликатов: {price} и {other_price}")
+
+
+# Политики выбора цены при слиянии: f(цена, количество, цена дубликата, количество дубликата) -> цена
+PRICE_POLICIES = {
+    'first': _first,
+    'last': _last,
+    'min': _min,
+    'max': _max,
+    'weighted': _weighted,
+    'error': _error,
+}
+
+
+class MergeReport:
+    """Итоги слияния дубликатов."""
+
+    def __init__(self):
+        self.records = 0
+        self.unique = 0
+        self.collapsed = 0
+        self.cross_category = 0
+        self.price_conflicts = 0
+
+    def to_dict(self) -> dict:
+        return {
+            'records': self.records,
+            'unique': self.unique,
+            'collapsed': self.collapsed,
+            'cross_category': self.cross_category,
+            'price_conflicts': self.price_conflicts,
+        }
+
+    def __str__(self):
+        return (f"Товаров: {self.records}, уникальных: {self.unique}, схлопнуто: {self.collapsed} "
+                f"(из других категорий: {self.cross_category}), конфликтов цен: {self.price_conflicts}")
+
+
+def merge_duplicates(categories, price_policy='first', across_categories: bool = True) -> MergeReport:
+    """
+    Схлопывает повторы товаров в загруженных категориях за один проход со словарем.
+
+    Товар определяется классом, названием и описанием. Остается первое вхождение:
+    его количество становится суммой количеств дубликатов, цена выбирается политикой
+    price_policy (имя из PRICE_POLICIES или функция с той же сигнатурой). Дубликаты
+    удаляются из своих категорий пачкой, поэтому счетчики и агрегаты категорий остаются
+    верными. При across_categories=False повторы ищутся только внутри каждой категории.
+    Все проверки и выбор цен выполняются до изменений: при ошибке (в том числе политики
+    'error') каталог остается прежним. Один и тот же объект в разных категориях дубликатом
+    не считается. Колоночные категории не поддерживаются (TypeError).
+    """
+    categories = list(categories)
+    for category in categories:
+        if isinstance(category, ColumnarCategory):
+            raise TypeError(f"Колоночная категория '{category.name}' не поддерживает слияние товаров")
+
+    policy = PRICE_POLICIES[price_policy] if isinstance(price_policy, str) else price_policy
+    report = MergeReport()
+
+    # Ключ -> первое вхождение товара. Ключ состоит только из строк и чисел (класс и область
+    # поиска — через id), а списки заводятся только для дубликатов: на миллионах товаров
+    # это избавляет сборщик мусора от обхода миллионов новых контейнеров
+    kept = {}
+    # Ключ -> [итоговая цена, итоговое количество] для товаров, у которых есть дубликаты
+    merged = {}
+    removals = []
+    for category in categories:
+        duplicates = []
+        # Ключи, впервые встреченные в этой категории (для подсчета межкатегорийных повторов)
+        local = set()
+        scope = 0 if across_categories else id(category)
+        for product in category.get_products_list():
+            key = (scope, id(type(product)), product.name, product.description)
+            first = kept.get(key)
+            if first is None:
+                kept[key] = product
+                local.add(key)
+                continue
+            if product is first:
+                # Тот же объект: в другой категории это не дубликат, а повторную ссылку
+                # в той же категории убираем, не складывая количество с самим собой
+                if key in local:
+                    report.collapsed += 1
+                    duplicates.append(product)
+                continue
+
+            entry = merged.get(key)
+            if entry is None:
+                entry = merged[key] = [first.price, first.quantity]
+            if key not in local:
+                report.cross_category += 1
+            if product.price != entry[0]:
+                report.price_conflicts += 1
+                entry[0] = policy(entry[0], entry[1], product.price, product.quantity)
+            entry[1] += product.quantity
+            report.collapsed += 1
+            duplicates.append(product)
+
+        report.records += len(category.get_products_list())
+        if duplicates:
+            removals.append((category, duplicates))
+
+    report.unique = len(kept)
+
+    for category, duplicates in removals:
+        category.remove_products(duplicates)
+    for key, (price, quantity) in merged.items():
+        product = kept[key]
+        if product.price != price:
+            product.price = price
+        if product.quantity != quantity:
+            product.quantity = quantity
+    return report
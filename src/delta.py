@@ -0,0 +1,168 @@
+import json
+
+from src.columnar import ColumnarCategory
+from src.models import (Category, ZeroQuantityError, PRODUCT_TYPES, TYPE_FIELD, product_from_record,
+                        suppress_creation_log)
+
+
+class CatalogUpdater:
+    """
+    Применяет к загруженному каталогу небольшие изменения на месте, без повторной загрузки.
+
+    Изменение — список записей по категориям:
+        [{"category": "Смартфоны", "description": "...",      # описание нужно только новой категории
+          "upsert": [{"name": ..., "description": ..., "price": ..., "quantity": ...}, ...],
+          "price": {"Iphone 15": 199000.0},
+          "quantity": {"Iphone 15": 3},
+          "remove": ["Xiaomi Redmi Note 11"]}]
+
+    Индексы по названиям строятся один раз при создании и дальше поддерживаются подпиской
+    на изменения категорий, поэтому стоимость apply() пропорциональна размеру изменения.
+    Изменение сначала целиком проверяется и только потом применяется, поэтому при ошибке
+    каталог остается прежним. Колоночные категории (в том числе из снимков каталога)
+    хранят товары в колонках и изменяться на месте не могут.
+    """
+
+    def __init__(self, categories: list):
+        for category in categories:
+            if isinstance(category, ColumnarCategory):
+                raise TypeError(f"Колоночная категория '{category.name}' не поддерживает изменения на месте")
+        self.categories = categories
+        self._by_name = {}
+        self._products = {}
+        for category in categories:
+            if category.name not in self._by_name:
+                self._track(category)
+
+    def _track(self, category):
+        """Индексирует товары категории по названию и подписывается на изменения её состава."""
+        self._by_name[category.name] = category
+        self._products[category.name] = {product.name: product for product in category.get_products_list()}
+        category._subscribe(self._on_category_changed)
+
+    def _on_category_changed(self, event: str, category, products: list):
+        names = self._products[category.name]
+        if event == 'added':
+            for product in products:
+                names[product.name] = product
+        elif event == 'removed':
+            for product in products:
+                if names.get(product.name) is product:
+                    del names[product.name]
+
+    def apply_file(self, file_path: str) -> dict:
+        """Применяет изменение из JSON файла."""
+        with open(file_path, 'r', encoding='utf-8') as file:
+            return self.apply(json.load(file))
+
+    def apply(self, patch: list) -> dict:
+        """Применяет изменение и возвращает количество добавленных, измененных и удаленных товаров."""
+        self._validate(patch)
+
+        summary = {'categories_added': 0, 'added': 0, 'updated': 0, 'removed': 0}
+        for entry in patch:
+            category = self._by_name.get(entry['category'])
+            if category is None:
+                category = Category(entry['category'], entry.get('description', ''))
+                self.categories.append(category)
+                self._track(category)
+                summary['categories_added'] += 1
+            # Словарь обновляется подпиской при удалении и добавлении товаров
+            products = self._products[category.name]
+
+            for name in entry.get('remove', ()):
+                category.remove_product(products[name])
+                summary['removed'] += 1
+
+            # Новые товары добавляются пачкой в конце, до этого их ищем здесь
+            pending = {}
+            for record in entry.get('upsert', ()):
+                product = pending.get(record['name']) or products.get(record['name'])
+                kind = PRODUCT_TYPES[record.get(TYPE_FIELD, 'product')]
+                if product is not None and type(product) is kind:
+                    self._update(product, record)
+                    summary['updated'] += 1
+                    continue
+                if product is not None and product is not pending.get(record['name']):
+                    # Сменился класс товара — заменяем объект целиком
+                    category.remove_product(product)
+                    summary['removed'] += 1
+                with suppress_creation_log():
+                    pending[record['name']] = product_from_record(record)
+            if pending:
+                category.add_products(list(pending.values()))
+                summary['added'] += len(pending)
+
+            for name, price in entry.get('price', {}).items():
+                products[name].price = price
+                summary['updated'] += 1
+            for name, quantity in entry.get('quantity', {}).items():
+                products[name].quantity = quantity
+                summary['updated'] += 1
+
+        return summary
+
+    @staticmethod
+    def _update(product, record: dict):
+        old = product.description
+        if old != record['description']:
+            product.description = record['description']
+            # Описание — простой атрибут: наблюдателей (индексы поиска) уведомляем явно
+            if product._watchers:
+                product._notify('description', old, record['description'])
+        for field in type(product).record_fields[4:]:
+            setattr(product, field, record[field])
+        product.price = record['price']
+        product.quantity = record['quantity']
+
+    def _validate(self, patch: list):
+        """
+        Проверяет изменение целиком по тем же правилам, что и Product и сеттер цены.
+        Записи одной категории проверяются по очереди с учетом предыдущих: товар,
+        удаленный раньше в этом же изменении, дальше считается отсутствующим.
+        """
+        # Категория -> названия товаров с учетом уже проверенных записей изменения
+        names = {}
+        for entry in patch:
+            known = names.get(entry['category'])
+            if known is None:
+                known = names[entry['category']] = set(self._products.get(entry['category'], ()))
+            removed = set()
+            for name in entry.get('remove', ()):
+                if name in removed:
+                    raise ValueError(f"Товар '{name}' повторяется в списке удаления")
+                if name not in known:
+                    raise KeyError(f"Товар '{name}' не найден в категории '{entry['category']}'")
+                removed.add(name)
+                known.discard(name)
+
+            for record in entry.get('upsert', ()):
+                type_name = record.get(TYPE_FIELD, 'product')
+                if type_name not in PRODUCT_TYPES:
+                    raise ValueError(f"Неизвестный тип товара: {type_name}")
+                missing = [field for field in PRODUCT_TYPES[type_name].record_fields if field not in record]
+                if missing:
+                    raise KeyError(f"В записи товара '{record.get('name')}' нет полей: {', '.join(missing)}")
+                self._check(record['name'], record['price'], record['quantity'])
+                known.add(record['name'])
+
+            for name, price in entry.get('price', {}).items():
+                if name not in known:
+                    raise KeyError(f"Товар '{name}' не найден в категории '{entry['category']}'")
+                self._check(name, price, None)
+            for name, quantity in entry.get('quantity', {}).items():
+                if name not in known:
+                    raise KeyError(f"Товар '{name}' не найден в категории '{entry['category']}'")
+                self._check(name, None, quantity)
+
+    @staticmethod
+    def _check(name: str, price, quantity):
+        if quantity is not None and quantity == 0:
+            raise ZeroQuantityError(f"Товар '{name}' с нулевым количеством не может быть добавлен")
+        if price is not None and price <= 0:
+            raise ValueError(f"Цена товара '{name}' не должна быть нулевая или отрицательная")
+
+
+def apply_delta(categories: list, patch: list) -> dict:
+    """Разово применяет изменение к списку категорий (для потока изменений используйте CatalogUpdater)."""
+    return CatalogUpdater(categories).apply(patch)
@@ -0,0 +1,79 @@
+import csv
+import json
+
+from src.catalog_io import open_text, product_rows
+from src.columnar import EXTRA_FIELDS
+from src.models import PRODUCT_TYPES, TYPE_FIELD
+
+# Поля категории в строках CSV и NDJSON
+CATEGORY_FIELDS = ('category', 'category_description')
+
+# Все поля товаров: общие, затем дополнительные поля наследников в порядке PRODUCT_TYPES
+PRODUCT_FIELDS = tuple(dict.fromkeys(field for cls in PRODUCT_TYPES.values() for field in cls.record_fields))
+
+COLUMNS = CATEGORY_FIELDS + (TYPE_FIELD,) + PRODUCT_FIELDS
+
+# Преобразование строк CSV обратно в значения; остальные поля остаются строками
+CSV_CONVERTERS = {'price': float, 'quantity': int, 'efficiency': float, 'memory': int}
+
+_TYPE_NAMES = {cls: type_name for type_name, cls in PRODUCT_TYPES.items()}
+
+
+def iter_product_records(category):
+    """Записи товаров категории в формате загрузчика (с полем "type"), по одной."""
+    for kind, name, description, price, quantity, extras in product_rows(category):
+        record = {TYPE_FIELD: _TYPE_NAMES[kind], 'name': name, 'description': description,
+                  'price': price, 'quantity': quantity}
+        record.update(zip(EXTRA_FIELDS[kind], extras))
+        yield record
+
+
+def export_csv(categories, file_path: str, compress: bool = None) -> int:
+    """
+    Потоково пишет товары категорий в CSV: строка на товар, столбцы COLUMNS, пустые
+    ячейки у полей, которых нет у класса товара. Возвращает число записанных товаров.
+    """
+    count = 0
+    with open_text(file_path, 'w', compress) as file:
+        writer = csv.writer(file)
+        writer.writerow(COLUMNS)
+        for category in categories:
+            head = (category.name, category.description)
+            for record in iter_product_records(category):
+                writer.writerow(head + tuple(record.get(field, '') for field in COLUMNS[2:]))
+                count += 1
+    return count
+
+
+def export_ndjson(categories, file_path: str, compress: bool = None) -> int:
+    """Потоково пишет товары категорий в NDJSON: объект на строку. Возвращает число товаров."""
+    count = 0
+    with open_text(file_path, 'w', compress) as file:
+        for category in categories:
+            head = {'category': category.name, 'category_description': category.description}
+            for record in iter_product_records(category):
+                file.write(json.dumps({**head, **record}, ensure_ascii=False))
+                file.write('\n')
+                count += 1
+    return count
+
+
+def export_json(categories, file_path: str, compress: bool = None) -> int:
+    """
+    Потоково пишет категории в формате, который читает load_data_from_json
+    (в отличие от CSV и NDJSON сохраняются и пустые категории). Возвращает число товаров.
+    """
+    count = 0
+    with open_text(file_path, 'w', compress) as file:
+        file.write('[')
+        for index, category in enumerate(categories):
+            file.write(',\n{' if index else '\n{')
+            file.write(f'"name": {json.dumps(category.name, ensure_ascii=False)}, '
+                       f'"description": {json.dumps(category.description, ensure_ascii=False)}, "products": [')
+            for position, record in enumerate(iter_product_records(category)):
+                file.write(',\n  ' if position else '\n  ')
+                file.write(json.dumps(record, ensure_ascii=False))
+                count += 1
+            file.write('\n]}')
+        file.write('\n]\n')
+    return count
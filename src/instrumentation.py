@@ -0,0 +1,149 @@
+import functools
+from bisect import bisect_left
+from contextlib import contextmanager
+from time import perf_counter
+
+# Верхние границы корзин гистограммы времени, в секундах
+BUCKETS = (1e-6, 1e-5, 1e-4, 1e-3, 1e-2, 0.1, 1.0, 10.0)
+
+
+class _Histogram:
+    __slots__ = ('counts', 'total', 'count')
+
+    def __init__(self):
+        self.counts = [0] * (len(BUCKETS) + 1)
+        self.total = 0.0
+        self.count = 0
+
+    def observe(self, seconds: float):
+        self.counts[bisect_left(BUCKETS, seconds)] += 1
+        self.total += seconds
+        self.count += 1
+
+
+class Metrics:
+    """
+    Счетчики и гистограммы времени по операциям. По умолчанию выключены:
+    в горячих путях при этом остается только проверка флага enabled.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self._counters = {}
+        self._histograms = {}
+
+    def enable(self):
+        self.enabled = True
+
+    def disable(self):
+        self.enabled = False
+
+    @contextmanager
+    def collecting(self):
+        """Включает сбор метрик на время блока with."""
+        previous = self.enabled
+        self.enabled = True
+        try:
+            yield self
+        finally:
+            self.enabled = previous
+
+    def reset(self):
+        self._counters.clear()
+        self._histograms.clear()
+
+    def count(self, name: str, value: int = 1):
+        """Увеличивает счетчик события."""
+        self._counters[name] = self._counters.get(name, 0) + value
+
+    def observe(self, name: str, seconds: float):
+        """Добавляет длительность операции в её гистограмму."""
+        histogram = self._histograms.get(name)
+        if histogram is None:
+            histogram = self._histograms[name] = _Histogram()
+        histogram.observe(seconds)
+
+    @contextmanager
+    def timer(self, name: str):
+        """Замеряет длительность блока with, если сбор метрик включен."""
+        if not self.enabled:
+            yield
+            return
+        start = perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, perf_counter() - start)
+
+    def as_dict(self) -> dict:
+        """Снимок метрик: {'counters': {...}, 'timings': {операция: {count, sum, buckets}}}."""
+        timings = {}
+        for name, histogram in self._histograms.items():
+            timings[name] = {
+                'count': histogram.count,
+                'sum': histogram.total,
+                'buckets': dict(zip([str(bound) for bound in BUCKETS] + ['+Inf'], histogram.counts)),
+            }
+        return {'counters': dict(self._counters), 'timings': timings}
+
+    def to_prometheus(self, prefix: str = 'homework') -> str:
+        """Метрики в текстовом формате Prometheus."""
+        lines = []
+        if self._counters:
+            lines.append(f"# TYPE {prefix}_events_total counter")
+            for name, value in sorted(self._counters.items()):
+                lines.append(f'{prefix}_events_total{{event="{name}"}} {value}')
+
+        if self._histograms:
+            metric = f"{prefix}_operation_seconds"
+            lines.append(f"# TYPE {metric} histogram")
+            for name, histogram in sorted(self._histograms.items()):
+                cumulative = 0
+                for bound, count in zip([repr(bound) for bound in BUCKETS] + ['+Inf'], histogram.counts):
+                    cumulative += count
+                    lines.append(f'{metric}_bucket{{operation="{name}",le="{bound}"}} {cumulative}')
+                lines.append(f'{metric}_sum{{operation="{name}"}} {histogram.total!r}')
+                lines.append(f'{metric}_count{{operation="{name}"}} {histogram.count}')
+        return "\n".join(lines) + "\n"
+
+
+# Общий реестр метрик для models и data_loader
+metrics = Metrics()
+
+
+def instrumented(name: str):
+    """Декоратор: считает вызовы и время функции под именем name, когда метрики включены."""
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not metrics.enabled:
+                return func(*args, **kwargs)
+            start = perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                metrics.observe(name, perf_counter() - start)
+        return wrapper
+    return decorator
+
+
+@contextmanager
+def profile(output_path: str = None, stream=None, sort: str = 'cumulative', limit: int = 30):
+    """
+    Запускает cProfile на время блока with (например, вокруг загрузки каталога).
+    Статистика сохраняется в output_path и/или печатается в stream.
+    """
+    # cProfile и pstats заметно удлиняют импорт, а нужны только при профилировании
+    import cProfile
+    import pstats
+
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        yield profiler
+    finally:
+        profiler.disable()
+        if output_path is not None:
+            profiler.dump_stats(output_path)
+        if stream is not None:
+            pstats.Stats(profiler, stream=stream).sort_stats(sort).print_stats(limit)
@@ -0,0 +1,130 @@
+import heapq
+
+from src.models import (Category, ZeroQuantityError, PRODUCT_TYPES, TYPE_FIELD, product_from_record,
+                        suppress_creation_log, _rank_key)
+
+
+class LazyCategory(Category):
+    """
+    Категория, которая хранит исходные записи товаров и создает объекты Product только
+    при обращении к get_products_list(), products или product_at(). Агрегаты считаются
+    по записям при загрузке, поэтому len(), str() и middle_price() не создают товары.
+    """
+
+    def __init__(self, name: str, description: str, records=()):
+        super().__init__(name, description)
+        self._records = []
+        # Товары, созданные по одному через product_at до полной материализации
+        self._built = {}
+
+        for record in records:
+            if record['quantity'] == 0:
+                raise ZeroQuantityError(f"Товар '{record['name']}' с нулевым количеством не может быть добавлен")
+            kind = PRODUCT_TYPES.get(record.get(TYPE_FIELD, 'product'))
+            if kind is None:
+                raise ValueError(f"Неизвестный тип товара: {record[TYPE_FIELD]}")
+            self._account_record(kind, record['price'], record['quantity'])
+            self._records.append(record)
+
+        Category._update_counters(products=len(self._records))
+
+    def _account_record(self, kind, price, quantity):
+        self._total_price += price
+        self._total_quantity += quantity
+        self._stock_value += price * quantity
+        self._stock_by_class[kind] = self._stock_by_class.get(kind, 0) + price * quantity
+        if self._min_price is None or price < self._min_price:
+            self._min_price = price
+        if self._max_price is None or price > self._max_price:
+            self._max_price = price
+
+    @property
+    def is_materialized(self) -> bool:
+        return self._records is None
+
+    def _materialize(self):
+        """Создает все товары из записей и переводит категорию в обычный режим."""
+        if self._records is None:
+            return
+        records, built = self._records, self._built
+        self._records, self._built = None, {}
+
+        for product in built.values():
+            product._unwatch(self)
+        with suppress_creation_log():
+            products = [built[index] if index in built else product_from_record(record)
+                        for index, record in enumerate(records)]
+
+        # Агрегаты пересчитываются по объектам, заодно категория подписывается на их изменения
+        self._reset_stats()
+        super()._store_many(products)
+
+    def product_at(self, index: int):
+        """Возвращает товар по индексу, создавая только его."""
+        if self._records is None:
+            return self.get_products_list()[index]
+        index = range(len(self._records))[index]
+        product = self._built.get(index)
+        if product is None:
+            with suppress_creation_log():
+                product = self._built[index] = product_from_record(self._records[index])
+            product._watch(self)
+        return product
+
+    def _refresh_extremes(self):
+        if self._records is None:
+            return super()._refresh_extremes()
+        prices = [self._built[index].price if index in self._built else record['price']
+                  for index, record in enumerate(self._records)]
+        self._min_price = min(prices) if prices else None
+        self._max_price = max(prices) if prices else None
+        self._extremes_dirty = False
+
+    def _select(self, n: int, field: str, largest: bool) -> list:
+        """Выборка по записям: создаются только товары, попавшие в результат."""
+        if self._records is None or field not in ('price', 'quantity', 'stock_value'):
+            return super()._select(n, field, largest)
+        key = _rank_key(field)
+        records, built = self._records, self._built
+
+        def value(index: int):
+            product = built.get(index)
+            if product is not None:
+                return key(product)
+            record = records[index]
+            if field == 'stock_value':
+                return record['price'] * record['quantity']
+            return record[field]
+
+        select = heapq.nlargest if largest else heapq.nsmallest
+        return [self.product_at(index) for index in select(n, range(len(records)), key=value)]
+
+    def _store(self, product):
+        self._materialize()
+        super()._store(product)
+
+    def _store_many(self, products: list):
+        self._materialize()
+        super()._store_many(products)
+
+    def _discard(self, product):
+        self._materialize()
+        super()._discard(product)
+
+    def _discard_many(self, products: list):
+        self._materialize()
+        super()._discard_many(products)
+
+    def __len__(self):
+        if self._records is not None:
+            return len(self._records)
+        return super().__len__()
+
+    @property
+    def products(self):
+        self._materialize()
+        return super().products
+
+    def get_products_list(self):
+        self._materialize()
+        return super().get_products_list()
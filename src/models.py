@@ -1,4 +1,29 @@
+import heapq
+import threading
 from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from itertools import chain
+from operator import attrgetter, itemgetter
+from time import perf_counter
+
+from src.instrumentation import metrics, instrumented
+from src.render_cache import RenderCache
+
+# Предел суммарной длины строк в общем кэше: ключи — сами объекты, поэтому без него
+# несколько больших Category.products держали бы в памяти и строки, и удаленные каталоги
+RENDER_CACHE_MAX_CHARS = 16 * 1024 * 1024
+
+# Общий кэш строк str(product) и Category.products
+render_cache = RenderCache(max_chars=RENDER_CACHE_MAX_CHARS)
+
+# Защищает общие счетчики Category.category_count и Category.product_count
+_counter_lock = threading.Lock()
+
+
+def _logger():
+    """Логгер модуля. logging импортируется при первом сообщении: он заметно удлиняет импорт models."""
+    import logging
+    return logging.getLogger(__name__)
 
 
 class ZeroQuantityError(ValueError):
@@ -9,6 +34,8 @@ class ZeroQuantityError(ValueError):
 class BaseProduct(ABC):
     """Абстрактный базовый класс для всех продуктов."""
 
+    __slots__ = ()
+
     @abstractmethod
     def __init__(self, name: str, description: str, price: float, quantity: int):
         pass
@@ -24,38 +51,94 @@ class BaseProduct(ABC):
         pass
 
 
+class _CreationLogState(threading.local):
+    # Отключение сообщений через suppress_creation_log действует только в своем потоке
+    suppressed = False
+
+
+_creation_log_state = _CreationLogState()
+
+
 class LogCreationMixin:
     """Миксин для логирования создания объектов."""
 
-    def __init__(self, *args, **kwargs):
-        self._init_args = args
-        self._init_kwargs = kwargs
+    __slots__ = ()
 
-        if hasattr(super(), '__init__'):
-            super().__init__(*args, **kwargs)
+    # Выключатель сообщений о создании объектов
+    log_creation = True
+    # Если задан logging.Logger, сообщения пишутся в него вместо print
+    creation_logger = None
 
-    def _log_creation(self):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Аргументы конструктора не сохраняются в объекте: они нужны только для сообщения
+        self._log_creation(args)
+
+    def _log_creation(self, args: tuple = ()):
         """Логирует создание объекта."""
+        if not self.log_creation or _creation_log_state.suppressed:
+            return
+
         class_name = self.__class__.__name__
-        args_str = ", ".join([repr(arg) for arg in self._init_args])
-        print(f"{class_name}({args_str})")
+        args_str = ", ".join([repr(arg) for arg in args])
+        message = f"{class_name}({args_str})"
+
+        start = perf_counter() if metrics.enabled else None
+        if self.creation_logger is None:
+            print(message)
+        else:
+            self.creation_logger.info(message)
+        if start is not None:
+            metrics.observe('log_creation', perf_counter() - start)
+
+
+@contextmanager
+def suppress_creation_log():
+    """
+    Временно отключает сообщения о создании объектов (например, при массовой загрузке)
+    в текущем потоке: объекты, которые одновременно создают другие потоки, логируются как обычно.
+    """
+    state = _creation_log_state
+    previous = state.suppressed
+    state.suppressed = True
+    try:
+        yield
+    finally:
+        state.suppressed = previous
 
 
 class Product(LogCreationMixin, BaseProduct):
     """Класс для представления товара в магазине."""
 
+    __slots__ = ('_name', 'description', '__price', '_quantity', '_watchers')
+
+    # Поля записи каталога в порядке аргументов конструктора
+    record_fields = ('name', 'description', 'price', 'quantity')
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Извлекатель полей компилируется один раз на класс, а не на каждую запись
+        cls._record_getter = itemgetter(*cls.record_fields)
+
     def __init__(self, name: str, description: str, price: float, quantity: int):
+        start = perf_counter() if metrics.enabled else None
+
         # Проверка на нулевое количество
         if quantity == 0:
             raise ZeroQuantityError("Товар с нулевым количеством не может быть добавлен")
 
+        # Наблюдатели за изменением цены и количества (категории, индексы)
+        self._watchers = ()
         self._name = name
         self.description = description
         self.__price = price
-        self.quantity = quantity
+        self._quantity = quantity
 
-        super().__init__(name, description, price, quantity)
-        self._log_creation()
+        # Без логирования цепочка LogCreationMixin -> BaseProduct ничего не делает: пропускаем её
+        if self.log_creation and not _creation_log_state.suppressed:
+            super().__init__(name, description, price, quantity)
+        if start is not None:
+            metrics.observe('product_create', perf_counter() - start)
 
     @property
     def name(self):
@@ -70,18 +153,47 @@ class Product(LogCreationMixin, BaseProduct):
         if value <= 0:
             print("Цена не должна быть нулевая или отрицательная")
         else:
+            old = self.__price
             self.__price = value
+            render_cache.invalidate(self)
+            if self._watchers:
+                self._notify('price', old, value)
+
+    @property
+    def quantity(self):
+        return self._quantity
+
+    @quantity.setter
+    def quantity(self, value: int):
+        old = self._quantity
+        self._quantity = value
+        render_cache.invalidate(self)
+        if self._watchers:
+            self._notify('quantity', old, value)
+
+    def _watch(self, watcher):
+        """Подписывает watcher на изменения товара: вызывается watcher._product_changed(product, field, old, new)."""
+        self._watchers += (watcher,)
+
+    def _unwatch(self, watcher):
+        """Отписывает watcher (одну подписку) от изменений товара."""
+        watchers = list(self._watchers)
+        if watcher in watchers:
+            watchers.remove(watcher)
+            self._watchers = tuple(watchers)
+
+    def _notify(self, field: str, old, new):
+        for watcher in self._watchers:
+            watcher._product_changed(self, field, old, new)
 
     @classmethod
     def new_product(cls, product_data: dict):
-        return cls(
-            name=product_data['name'],
-            description=product_data['description'],
-            price=product_data['price'],
-            quantity=product_data['quantity']
-        )
+        return cls(*cls._record_getter(product_data))
 
     def __str__(self):
+        return render_cache.get_or_render(self, Product._render)
+
+    def _render(self):
         return f"{self.name}, {self.price} руб. Остаток: {self.quantity} шт."
 
     def __add__(self, other):
@@ -93,9 +205,16 @@ class Product(LogCreationMixin, BaseProduct):
         return f"{self.__class__.__name__}('{self.name}', '{self.description}', {self.price}, {self.quantity})"
 
 
+Product._record_getter = itemgetter(*Product.record_fields)
+
+
 class Smartphone(Product):
     """Класс для представления смартфона."""
 
+    __slots__ = ('efficiency', 'model', 'memory', 'color')
+
+    record_fields = Product.record_fields + ('efficiency', 'model', 'memory', 'color')
+
     def __init__(self, name: str, description: str, price: float, quantity: int,
                  efficiency: float, model: str, memory: int, color: str):
         self.efficiency = efficiency
@@ -113,6 +232,10 @@ class Smartphone(Product):
 class LawnGrass(Product):
     """Класс для представления газонной травы."""
 
+    __slots__ = ('country', 'germination_period', 'color')
+
+    record_fields = Product.record_fields + ('country', 'germination_period', 'color')
+
     def __init__(self, name: str, description: str, price: float, quantity: int,
                  country: str, germination_period: str, color: str):
         self.country = country
@@ -126,6 +249,38 @@ class LawnGrass(Product):
                 f"'{self.color}')")
 
 
+# Значения поля "type" записи каталога -> класс товара
+TYPE_FIELD = 'type'
+PRODUCT_TYPES = {
+    'product': Product,
+    'smartphone': Smartphone,
+    'lawn_grass': LawnGrass,
+}
+
+
+# Числовые поля, по которым можно выбирать товары (stock_value = цена × количество)
+RANK_FIELDS = ('price', 'quantity', 'stock_value', 'efficiency', 'memory')
+
+
+def _rank_key(field: str):
+    """Функция-ключ товара для выборки по полю field."""
+    if field not in RANK_FIELDS:
+        raise ValueError(f"Неизвестное числовое поле: {field}")
+    if field == 'stock_value':
+        return lambda product: product.price * product.quantity
+    return attrgetter(field)
+
+
+def product_from_record(product_data: dict):
+    """Создает товар класса, указанного в поле "type" записи (по умолчанию Product)."""
+    type_name = product_data.get(TYPE_FIELD, 'product')
+    try:
+        product_cls = PRODUCT_TYPES[type_name]
+    except KeyError:
+        raise ValueError(f"Неизвестный тип товара: {type_name}") from None
+    return product_cls.new_product(product_data)
+
+
 class Category:
     """Класс для представления категории товаров."""
 
@@ -136,13 +291,191 @@ class Category:
         self.name = name
         self.description = description
         self.__products = []
+        self._listeners = []
+        self._reset_stats()
 
-        Category.category_count += 1
+        Category._update_counters(categories=1)
 
         if products:
             for product in products:
                 self.add_product(product)
 
+    @staticmethod
+    def _update_counters(categories: int = 0, products: int = 0):
+        """Атомарно изменяет общие счетчики категорий и товаров."""
+        with _counter_lock:
+            Category.category_count += categories
+            Category.product_count += products
+
+    def _subscribe(self, listener):
+        """Подписывает listener(event, category, products) на изменения состава категории."""
+        self._listeners.append(listener)
+
+    def _unsubscribe(self, listener):
+        """Отписывает listener от изменений категории."""
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+
+    def _notify(self, event: str, products: list):
+        for listener in list(self._listeners):
+            listener(event, self, products)
+
+    def _reset_stats(self):
+        # Накопительные агрегаты: обновляются за O(1) при добавлении и изменении товаров
+        self._total_price = 0
+        self._total_quantity = 0
+        self._stock_value = 0
+        # Стоимость остатков по классам товаров: складываются только товары одного класса
+        self._stock_by_class = {}
+        self._min_price = None
+        self._max_price = None
+        self._extremes_dirty = False
+
+    def _account(self, product):
+        self._add_values(type(product), product.price, product.quantity)
+        product._watch(self)
+
+    def _add_values(self, kind, price, quantity):
+        """
+        Добавляет в агрегаты товар класса kind с ценой price и количеством quantity.
+        Новые значения сначала считаются целиком, поэтому при ошибке (например, нечисловой
+        цене) агрегаты не меняются.
+        """
+        stock = price * quantity
+        total_price = self._total_price + price
+        total_quantity = self._total_quantity + quantity
+        stock_value = self._stock_value + stock
+        class_stock = self._stock_by_class.get(kind, 0) + stock
+        min_price, max_price = self._min_price, self._max_price
+        if not self._extremes_dirty:
+            if min_price is None or price < min_price:
+                min_price = price
+            if max_price is None or price > max_price:
+                max_price = price
+
+        self._total_price = total_price
+        self._total_quantity = total_quantity
+        self._stock_value = stock_value
+        self._stock_by_class[kind] = class_stock
+        self._min_price, self._max_price = min_price, max_price
+
+    def _change_values(self, kind, old_price, old_quantity, price, quantity, count: int = 1):
+        """Переносит в агрегаты смену цены и количества у count вхождений товара класса kind."""
+        delta = 0
+        if price != old_price:
+            self._total_price += (price - old_price) * count
+            delta += (price - old_price) * old_quantity * count
+            if not self._extremes_dirty:
+                if price < self._min_price:
+                    self._min_price = price
+                elif old_price == self._min_price:
+                    self._extremes_dirty = True
+                if price > self._max_price:
+                    self._max_price = price
+                elif old_price == self._max_price:
+                    self._extremes_dirty = True
+        if quantity != old_quantity:
+            self._total_quantity += (quantity - old_quantity) * count
+            delta += price * (quantity - old_quantity) * count
+        self._stock_value += delta
+        self._stock_by_class[kind] += delta
+
+    def _product_changed(self, product, field: str, old, new):
+        """Обновляет агрегаты при смене цены или количества товара категории."""
+        render_cache.invalidate(self)
+        if field == 'price':
+            quantity = product.quantity
+            self._change_values(type(product), old, quantity, new, quantity)
+        elif field == 'quantity':
+            price = product.price
+            self._change_values(type(product), price, old, price, new)
+
+    def _store(self, product):
+        """Сохраняет товар во внутреннее хранилище категории."""
+        # Сначала учет: если товар нельзя учесть в агрегатах, он не попадает и в список
+        self._account(product)
+        self.__products.append(product)
+
+    def _store_many(self, products: list):
+        """Сохраняет пачку товаров во внутреннее хранилище категории (все или ни одного)."""
+        accounted = 0
+        try:
+            for product in products:
+                self._account(product)
+                accounted += 1
+        except Exception:
+            for product in products[:accounted]:
+                self._unaccount(product)
+            raise
+        self.__products.extend(products)
+
+    def _unaccount(self, product):
+        self._remove_values(type(product), product.price, product.quantity)
+        product._unwatch(self)
+
+    def _remove_values(self, kind, price, quantity):
+        """Вычитает из агрегатов товар класса kind с ценой price и количеством quantity."""
+        self._total_price -= price
+        self._total_quantity -= quantity
+        self._stock_value -= price * quantity
+        self._stock_by_class[kind] -= price * quantity
+        if price == self._min_price or price == self._max_price:
+            self._extremes_dirty = True
+
+    def _discard(self, product):
+        """Удаляет товар из внутреннего хранилища категории."""
+        for index, item in enumerate(self.__products):
+            if item is product:
+                del self.__products[index]
+                break
+        else:
+            raise ValueError(f"Товар '{product.name}' не найден в категории '{self.name}'")
+        self._unaccount(product)
+
+    def _discard_many(self, products: list):
+        """
+        Удаляет пачку товаров за один проход по хранилищу. Товар, добавленный в категорию
+        несколько раз, удаляется столько раз, сколько встречается в products (с конца).
+        """
+        pending = {}
+        for product in products:
+            pending[id(product)] = pending.get(id(product), 0) + 1
+
+        kept = []
+        for item in reversed(self.__products):
+            count = pending.get(id(item))
+            if count:
+                pending[id(item)] = count - 1
+            else:
+                kept.append(item)
+        if any(pending.values()):
+            raise ValueError(f"Не все товары найдены в категории '{self.name}'")
+
+        kept.reverse()
+        self.__products[:] = kept
+        for product in products:
+            self._unaccount(product)
+
+    def remove_product(self, product):
+        """Удаляет товар из категории и обновляет агрегаты и счетчик товаров."""
+        self._discard(product)
+        Category._update_counters(products=-1)
+        render_cache.invalidate_many((self, product))
+        if self._listeners:
+            self._notify('removed', [product])
+
+    def remove_products(self, products) -> int:
+        """Пакетно удаляет товары из категории за один проход. Возвращает число удаленных."""
+        products = list(products)
+        self._discard_many(products)
+        Category._update_counters(products=-len(products))
+        # Строки удаленных товаров тоже не должны держать их в кэше
+        render_cache.invalidate_many([self, *products])
+        if self._listeners:
+            self._notify('removed', products)
+        return len(products)
+
+    @instrumented('add_product')
     def add_product(self, product):
         try:
             if not isinstance(product, Product):
@@ -151,8 +484,11 @@ class Category:
             if product.quantity == 0:
                 raise ZeroQuantityError(f"Товар '{product.name}' с нулевым количеством не может быть добавлен")
 
-            self.__products.append(product)
-            Category.product_count += 1
+            self._store(product)
+            Category._update_counters(products=1)
+            render_cache.invalidate(self)
+            if self._listeners:
+                self._notify('added', [product])
             print(f"Товар '{product.name}' успешно добавлен в категорию '{self.name}'")
 
         except (TypeError, ZeroQuantityError) as e:
@@ -161,32 +497,147 @@ class Category:
         finally:
             print(f"Обработка добавления товара завершена")
 
+    @instrumented('add_products')
+    def add_products(self, products) -> int:
+        """
+        Пакетно добавляет товары. Вся пачка проверяется до добавления, счетчик
+        товаров обновляется один раз, сообщения идут в logging вместо print.
+        """
+        products = list(products)
+
+        for product in products:
+            if not isinstance(product, Product):
+                raise TypeError("Можно добавлять только продукты или их наследники")
+            if product.quantity == 0:
+                raise ZeroQuantityError(f"Товар '{product.name}' с нулевым количеством не может быть добавлен")
+
+        self._store_many(products)
+        Category._update_counters(products=len(products))
+        if metrics.enabled:
+            metrics.count('products_added_bulk', len(products))
+        render_cache.invalidate(self)
+        if self._listeners:
+            self._notify('added', products)
+        _logger().debug("В категорию '%s' добавлено товаров: %d", self.name, len(products))
+        return len(products)
+
+    @classmethod
+    def from_records(cls, name: str, description: str, records, product_cls=None):
+        """Создает категорию из словарей товаров без вывода сообщений о каждом товаре."""
+        factory = product_cls.new_product if product_cls else product_from_record
+        with suppress_creation_log():
+            products = [factory(record) for record in records]
+
+        category = cls(name, description)
+        category.add_products(products)
+        return category
+
     @property
     def products(self):
-        result = ""
-        for product in self.__products:
-            result += str(product) + "\n"
-        return result.rstrip()
+        return render_cache.get_or_render(self, Category._render_products)
+
+    @instrumented('render_products')
+    def _render_products(self):
+        # Строки товаров строим напрямую: иначе большая категория вытесняет из общего LRU
+        # все остальные записи и тратит время на его обслуживание, а кэшируется итоговая строка
+        return "\n".join([product._render() for product in self.__products])
 
     def __str__(self):
-        total_quantity = 0
-        for product in self.__products:
-            total_quantity += product.quantity
-        return f"{self.name}, количество продуктов: {total_quantity} шт."
+        return f"{self.name}, количество продуктов: {self._total_quantity} шт."
 
     def __len__(self):
         return len(self.__products)
 
+    @instrumented('middle_price')
     def middle_price(self):
         """Рассчитывает средний ценник всех товаров в категории."""
-        if len(self.__products) == 0:
-            return 0
-
-        try:
-            total_price = sum(product.price for product in self.__products)
-            return total_price / len(self.__products)
-        except ZeroDivisionError:
+        count = len(self)
+        if count == 0:
             return 0
+        return self._total_price / count
+
+    def total_quantity(self):
+        """Суммарный остаток товаров."""
+        return self._total_quantity
+
+    def stock_value(self):
+        """Суммарная стоимость остатков (цена × количество)."""
+        return self._stock_value
+
+    @instrumented('stock_value_by_class')
+    def stock_value_by_class(self) -> dict:
+        """Стоимость остатков по классам товаров: {Product: ..., Smartphone: ..., LawnGrass: ...}."""
+        return dict(self._stock_by_class)
+
+    def _refresh_extremes(self):
+        prices = [product.price for product in self.__products]
+        self._min_price = min(prices) if prices else None
+        self._max_price = max(prices) if prices else None
+        self._extremes_dirty = False
+
+    def min_price(self):
+        """Минимальная цена в категории (None для пустой категории)."""
+        if self._extremes_dirty:
+            self._refresh_extremes()
+        return self._min_price
+
+    def max_price(self):
+        """Максимальная цена в категории (None для пустой категории)."""
+        if self._extremes_dirty:
+            self._refresh_extremes()
+        return self._max_price
 
     def get_products_list(self):
         return self.__products
+
+    def _select(self, n: int, field: str, largest: bool) -> list:
+        """
+        n товаров с наибольшим (largest=True) или наименьшим значением поля. Выборка
+        идет через кучу размера n за O(N log n), без сортировки и копии списка товаров.
+        """
+        key = _rank_key(field)
+        products = self.get_products_list()
+        if field not in Product.record_fields and field != 'stock_value':
+            # Поля наследников (memory, efficiency) есть не у всех товаров
+            products = (product for product in products if hasattr(product, field))
+        return (heapq.nlargest if largest else heapq.nsmallest)(n, products, key=key)
+
+    def top_products(self, n: int, field: str = 'price') -> list:
+        """n товаров с наибольшим значением поля, по убыванию."""
+        return self._select(n, field, largest=True)
+
+    def bottom_products(self, n: int, field: str = 'price') -> list:
+        """n товаров с наименьшим значением поля, по возрастанию."""
+        return self._select(n, field, largest=False)
+
+
+def stock_value_by_class(categories) -> dict:
+    """
+    Стоимость остатков (цена × количество) по классам товаров для набора категорий за один проход.
+    Как и Product.__add__, суммирует значения только внутри одного класса товаров.
+    """
+    result = {}
+    for category in categories:
+        for kind, value in category.stock_value_by_class().items():
+            result[kind] = result.get(kind, 0) + value
+    return result
+
+
+def total_stock_value(categories) -> float:
+    """Суммарная стоимость остатков по набору категорий."""
+    return sum(category.stock_value() for category in categories)
+
+
+def top_products(categories, n: int, field: str = 'price') -> list:
+    """
+    n товаров с наибольшим значением поля по набору категорий. Каждая категория отдает
+    не больше n кандидатов, итоговая выборка делается по ним, а не по всем товарам.
+    """
+    candidates = chain.from_iterable(category._select(n, field, True) for category in categories)
+    return heapq.nlargest(n, candidates, key=_rank_key(field))
+
+
+def bottom_products(categories, n: int, field: str = 'price') -> list:
+    """n товаров с наименьшим значением поля по набору категорий."""
+    candidates = chain.from_iterable(category._select(n, field, False) for category in categories)
+    return heapq.nsmallest(n, candidates, key=_rank_key(field))
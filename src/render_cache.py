@@ -0,0 +1,94 @@
+import threading
+from collections import OrderedDict
+
+
+class RenderCache:
+    """
+    Ограниченный LRU-кэш строковых представлений товаров и категорий.
+    Ключ — сам объект, записи сбрасываются при изменениях, влияющих на строку.
+    Операции со словарем выполняются под коротким замком, строки строятся вне его.
+    """
+
+    def __init__(self, maxsize: int = 4096, max_chars: int = None):
+        # maxsize=0 отключает кэш; max_chars ограничивает суммарную длину хранимых строк
+        self.maxsize = maxsize
+        self.max_chars = max_chars
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+        # Растет при каждом сбросе: строка, построенная до сброса из другого потока, не сохраняется
+        self._generation = 0
+        self._chars = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self._data)
+
+    def get_or_render(self, key, render) -> str:
+        """Возвращает строку из кэша или строит её вызовом render(key)."""
+        data = self._data
+        with self._lock:
+            try:
+                value = data[key]
+            except KeyError:
+                self.misses += 1
+                generation = self._generation
+            else:
+                self.hits += 1
+                data.move_to_end(key)
+                return value
+
+        value = render(key)
+        if self.maxsize <= 0 or (self.max_chars is not None and len(value) > self.max_chars):
+            return value
+
+        with self._lock:
+            if generation != self._generation:
+                return value
+            previous = data.pop(key, None)
+            if previous is not None:
+                self._chars -= len(previous)
+            data[key] = value
+            self._chars += len(value)
+            while len(data) > self.maxsize or (self.max_chars is not None and self._chars > self.max_chars):
+                _, evicted = data.popitem(last=False)
+                self._chars -= len(evicted)
+                self.evictions += 1
+        return value
+
+    def invalidate(self, key):
+        """Сбрасывает запись для объекта, если она есть."""
+        with self._lock:
+            self._generation += 1
+            value = self._data.pop(key, None)
+            if value is not None:
+                self._chars -= len(value)
+
+    def invalidate_many(self, keys):
+        """Сбрасывает записи для пачки объектов под одним захватом замка."""
+        with self._lock:
+            self._generation += 1
+            data = self._data
+            for key in keys:
+                value = data.pop(key, None)
+                if value is not None:
+                    self._chars -= len(value)
+
+    def clear(self):
+        """Очищает кэш и счетчики."""
+        with self._lock:
+            self._generation += 1
+            self._data.clear()
+            self._chars = 0
+            self.hits = self.misses = self.evictions = 0
+
+    def stats(self) -> dict:
+        """Счетчики попаданий и промахов."""
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'size': len(self._data),
+            'chars': self._chars,
+        }
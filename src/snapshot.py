@@ -0,0 +1,192 @@
+import mmap
+import struct
+import sys
+from array import array
+
+from src.catalog_io import product_rows
+from src.columnar import ColumnarCategory
+from src.models import Product, Smartphone, LawnGrass
+
+MAGIC = b'HWSNAP\x00\x01'
+VERSION = 1
+
+# magic, версия, порядок байт, категории, товары, строки, размер блока строк, смартфоны, трава
+_HEADER = struct.Struct('<8sIIQQQQQQ')
+
+# Коды классов товаров в снимке
+KINDS = (Product, Smartphone, LawnGrass)
+_KIND_CODES = {kind: code for code, kind in enumerate(KINDS)}
+
+_BYTE_ORDER = 0 if sys.byteorder == 'little' else 1
+
+
+class SnapshotError(ValueError):
+    """Файл не является снимком каталога или записан в несовместимом формате."""
+    pass
+
+
+def _pad(size: int) -> int:
+    return (size + 7) & ~7
+
+
+class _StringTable:
+    """Строки снимка: декодируются из отображенного файла только при обращении."""
+
+    def __init__(self, blob, offsets):
+        self._blob = blob
+        self._offsets = offsets
+
+    def __getitem__(self, index: int) -> str:
+        return str(self._blob[self._offsets[index]:self._offsets[index + 1]], 'utf-8')
+
+
+class _MappedColumn:
+    """Ленивая колонка: i-й элемент — getter(keys[i])."""
+
+    def __init__(self, getter, keys):
+        self._getter = getter
+        self._keys = keys
+
+    def __len__(self):
+        return len(self._keys)
+
+    def __getitem__(self, index: int):
+        return self._getter(self._keys[index])
+
+    def __iter__(self):
+        getter = self._getter
+        for key in self._keys:
+            yield getter(key)
+
+
+def save_snapshot(categories: list, path: str):
+    """
+    Сохраняет категории в бинарный снимок: таблица строк и колонки фиксированной
+    ширины, выровненные по 8 байт, чтобы их можно было читать через mmap без копирования.
+    """
+    strings = {}
+
+    def intern(value: str) -> int:
+        index = strings.get(value)
+        if index is None:
+            index = strings[value] = len(strings)
+        return index
+
+    category_table = array('Q')
+    prices, quantities = array('d'), array('q')
+    name_refs, description_refs = array('Q'), array('Q')
+    kind_codes, extra_refs = array('q'), array('q')
+    smartphone_efficiency, smartphone_fields = array('d'), array('q')
+    grass_fields = array('q')
+
+    for category in categories:
+        start = len(prices)
+        for kind, name, description, price, quantity, extras in product_rows(category):
+            if kind not in _KIND_CODES:
+                raise TypeError(f"Класс {kind.__name__} не поддерживается снимком каталога")
+            prices.append(price)
+            quantities.append(quantity)
+            name_refs.append(intern(name))
+            description_refs.append(intern(description))
+            kind_codes.append(_KIND_CODES[kind])
+
+            if kind is Smartphone:
+                efficiency, model, memory, color = extras
+                extra_refs.append(len(smartphone_efficiency))
+                smartphone_efficiency.append(efficiency)
+                smartphone_fields.extend((memory, intern(model), intern(color)))
+            elif kind is LawnGrass:
+                extra_refs.append(len(grass_fields) // 3)
+                grass_fields.extend(intern(value) for value in extras)
+            else:
+                extra_refs.append(-1)
+
+        category_table.extend((intern(category.name), intern(category.description),
+                               start, len(prices) - start))
+
+    encoded = [value.encode('utf-8') for value in strings]
+    string_offsets = array('Q', [0])
+    for value in encoded:
+        string_offsets.append(string_offsets[-1] + len(value))
+    blob = b''.join(encoded)
+
+    header = _HEADER.pack(MAGIC, VERSION, _BYTE_ORDER, len(category_table) // 4, len(prices),
+                          len(encoded), len(blob), len(smartphone_efficiency), len(grass_fields) // 3)
+
+    with open(path, 'wb') as file:
+        file.write(header)
+        file.write(string_offsets.tobytes())
+        file.write(blob)
+        file.write(b'\x00' * (_pad(len(blob)) - len(blob)))
+        for column in (category_table, prices, quantities, name_refs, description_refs,
+                       kind_codes, extra_refs, smartphone_efficiency, smartphone_fields, grass_fields):
+            file.write(column.tobytes())
+
+
+def load_snapshot(path: str) -> list:
+    """
+    Загружает снимок каталога через mmap. Возвращает список ColumnarCategory, колонки
+    которых указывают прямо в отображенный файл: JSON не разбирается, товары не проверяются,
+    строки и объекты Product создаются только при обращении.
+    """
+    with open(path, 'rb') as file:
+        mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    view = memoryview(mapped)
+    if len(view) < _HEADER.size:
+        raise SnapshotError("Файл слишком мал для снимка каталога")
+
+    (magic, version, byte_order, n_categories, n_products, n_strings, blob_size,
+     n_smartphones, n_grass) = _HEADER.unpack_from(view)
+    if magic != MAGIC or version != VERSION:
+        raise SnapshotError("Файл не является снимком каталога")
+    if byte_order != _BYTE_ORDER:
+        raise SnapshotError("Снимок записан с другим порядком байт")
+
+    offset = _HEADER.size
+
+    def take(size: int, fmt: str = None):
+        nonlocal offset
+        section = view[offset:offset + size]
+        offset += _pad(size)
+        return section.cast(fmt) if fmt else section
+
+    string_offsets = take(8 * (n_strings + 1), 'Q')
+    strings = _StringTable(take(blob_size), string_offsets)
+    category_table = take(8 * 4 * n_categories, 'Q')
+    prices = take(8 * n_products, 'd')
+    quantities = take(8 * n_products, 'q')
+    name_refs = take(8 * n_products, 'Q')
+    description_refs = take(8 * n_products, 'Q')
+    kind_codes = take(8 * n_products, 'q')
+    extra_refs = take(8 * n_products, 'q')
+    smartphone_efficiency = take(8 * n_smartphones, 'd')
+    smartphone_fields = take(8 * 3 * n_smartphones, 'q')
+    grass_fields = take(8 * 3 * n_grass, 'q')
+
+    if offset > len(view):
+        raise SnapshotError("Снимок каталога поврежден")
+
+    def extras(position: int) -> tuple:
+        kind, ref = KINDS[kind_codes[position]], extra_refs[position]
+        if kind is Smartphone:
+            memory, model, color = smartphone_fields[3 * ref:3 * ref + 3]
+            return smartphone_efficiency[ref], strings[model], memory, strings[color]
+        if kind is LawnGrass:
+            return tuple(strings[value] for value in grass_fields[3 * ref:3 * ref + 3])
+        return ()
+
+    categories = []
+    for index in range(n_categories):
+        name, description, start, count = category_table[4 * index:4 * index + 4]
+        end = start + count
+        categories.append(ColumnarCategory._from_columns(
+            strings[name], strings[description],
+            _MappedColumn(strings.__getitem__, name_refs[start:end]),
+            _MappedColumn(strings.__getitem__, description_refs[start:end]),
+            prices[start:end],
+            quantities[start:end],
+            _MappedColumn(KINDS.__getitem__, kind_codes[start:end]),
+            _MappedColumn(extras, range(start, end)),
+        ))
+    return categories
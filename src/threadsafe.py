@@ -0,0 +1,157 @@
+import threading
+
+from src.models import Category, render_cache
+
+
+class _Snapshot:
+    """Согласованное состояние категории: кортеж товаров и агрегаты по нему."""
+
+    __slots__ = ('products', 'total_price', 'total_quantity', 'stock_value', 'stock_by_class',
+                 'min_price', 'max_price', 'rendered')
+
+    def __init__(self, products: tuple, total_price, total_quantity, stock_value, stock_by_class: dict,
+                 min_price, max_price):
+        self.products = products
+        self.total_price = total_price
+        self.total_quantity = total_quantity
+        self.stock_value = stock_value
+        self.stock_by_class = stock_by_class
+        self.min_price = min_price
+        self.max_price = max_price
+        # Строка products, строится первым читателем снимка
+        self.rendered = None
+
+
+_EMPTY = _Snapshot((), 0, 0, 0, {}, None, None)
+
+
+class ThreadSafeCategory(Category):
+    """
+    Категория для одновременной работы нескольких потоков по схеме копирования при записи.
+
+    Изменения (добавление и удаление товаров, смена их цены и количества) выполняются
+    под замком категории и публикуют новый неизменяемый снимок. Читатели берут текущий
+    снимок одним чтением атрибута, поэтому не блокируются и всегда видят согласованные
+    между собой список товаров и агрегаты. Каждая запись копирует список товаров,
+    поэтому большие пачки лучше добавлять через add_products().
+
+    Сеттеры товара меняют значение и уведомляют категорию вне её замка, поэтому переданные
+    в уведомлении старое и новое значения могут устареть, если товар меняют несколько потоков.
+    Категория помнит, с какими ценой и количеством учла каждый товар, и при уведомлении
+    пересчитывает его вклад по текущим значениям под замком.
+    """
+
+    def __init__(self, name: str, description: str, products: list = None):
+        self._lock = threading.RLock()
+        self._snapshot = _EMPTY
+        # id(товара) -> [учтенная цена, учтенное количество, число вхождений в категорию]
+        self._accounted = {}
+        super().__init__(name, description, products)
+
+    def _publish(self):
+        """Публикует снимок текущего состояния. Вызывается под замком."""
+        if self._extremes_dirty:
+            self._refresh_extremes()
+        self._snapshot = _Snapshot(
+            tuple(super().get_products_list()), self._total_price, self._total_quantity,
+            self._stock_value, dict(self._stock_by_class), self._min_price, self._max_price,
+        )
+
+    def _store(self, product):
+        with self._lock:
+            super()._store(product)
+            self._publish()
+
+    def _store_many(self, products: list):
+        with self._lock:
+            super()._store_many(products)
+            self._publish()
+
+    def _discard(self, product):
+        with self._lock:
+            super()._discard(product)
+            self._publish()
+
+    def _discard_many(self, products: list):
+        with self._lock:
+            super()._discard_many(products)
+            self._publish()
+
+    def _account(self, product):
+        price, quantity = product.price, product.quantity
+        self._add_values(type(product), price, quantity)
+        entry = self._accounted.get(id(product))
+        if entry is None:
+            self._accounted[id(product)] = [price, quantity, 1]
+        else:
+            # Товар уже есть в категории: переносим в остальные вхождения его еще не учтенные изменения
+            self._change_values(type(product), entry[0], entry[1], price, quantity, entry[2])
+            entry[0], entry[1] = price, quantity
+            entry[2] += 1
+        product._watch(self)
+
+    def _unaccount(self, product):
+        entry = self._accounted[id(product)]
+        # Вычитаем учтенные значения: текущие могли измениться без уведомления категории
+        self._remove_values(type(product), entry[0], entry[1])
+        entry[2] -= 1
+        if not entry[2]:
+            del self._accounted[id(product)]
+        product._unwatch(self)
+
+    def _product_changed(self, product, field: str, old, new):
+        with self._lock:
+            render_cache.invalidate(self)
+            entry = self._accounted.get(id(product))
+            if entry is None:
+                return
+            price, quantity = product.price, product.quantity
+            if price == entry[0] and quantity == entry[1]:
+                return
+            self._change_values(type(product), entry[0], entry[1], price, quantity, entry[2])
+            entry[0], entry[1] = price, quantity
+            self._publish()
+
+    @property
+    def products(self):
+        snapshot = self._snapshot
+        if snapshot.rendered is None:
+            snapshot.rendered = "\n".join([product._render() for product in snapshot.products])
+        return snapshot.rendered
+
+    def __str__(self):
+        return f"{self.name}, количество продуктов: {self._snapshot.total_quantity} шт."
+
+    def __len__(self):
+        return len(self._snapshot.products)
+
+    def middle_price(self):
+        """Рассчитывает средний ценник всех товаров в категории."""
+        snapshot = self._snapshot
+        if not snapshot.products:
+            return 0
+        return snapshot.total_price / len(snapshot.products)
+
+    def total_quantity(self):
+        """Суммарный остаток товаров."""
+        return self._snapshot.total_quantity
+
+    def stock_value(self):
+        """Суммарная стоимость остатков (цена × количество)."""
+        return self._snapshot.stock_value
+
+    def stock_value_by_class(self) -> dict:
+        """Стоимость остатков по классам товаров."""
+        return dict(self._snapshot.stock_by_class)
+
+    def min_price(self):
+        """Минимальная цена в категории (None для пустой категории)."""
+        return self._snapshot.min_price
+
+    def max_price(self):
+        """Максимальная цена в категории (None для пустой категории)."""
+        return self._snapshot.max_price
+
+    def get_products_list(self):
+        """Товары текущего снимка в виде кортежа: последующие изменения категории его не меняют."""
+        return self._snapshot.products
@@ -0,0 +1,140 @@
+from collections import namedtuple
+
+from src.models import PRODUCT_TYPES, TYPE_FIELD
+
+# Ошибка в файле каталога: строка начала категории, номер категории и товара (с 0; None — вся категория)
+CatalogIssue = namedtuple('CatalogIssue', ('line', 'category', 'record', 'code', 'message'))
+
+# Поля записи и допустимые для них типы значений
+_FIELD_TYPES = {
+    'name': str,
+    'description': str,
+    'price': (int, float),
+    'quantity': int,
+}
+
+
+class ValidationReport:
+    """
+    Отчет о проверке файла каталога. Хранит не больше max_issues ошибок,
+    остальные только считаются, поэтому память не зависит от размера файла.
+    """
+
+    def __init__(self, max_issues: int = 1000):
+        self.max_issues = max_issues
+        self.issues = []
+        self.error_count = 0
+        self.categories = 0
+        self.records = 0
+        self.invalid_records = 0
+        self.invalid_categories = 0
+
+    @property
+    def ok(self) -> bool:
+        return self.error_count == 0
+
+    def add(self, line: int, category: int, record, code: str, message: str):
+        """Регистрирует ошибку."""
+        self.error_count += 1
+        if len(self.issues) < self.max_issues:
+            self.issues.append(CatalogIssue(line, category, record, code, message))
+
+    def to_dict(self) -> dict:
+        """Отчет в виде словаря (например, для json.dump)."""
+        return {
+            'ok': self.ok,
+            'categories': self.categories,
+            'records': self.records,
+            'errors': self.error_count,
+            'invalid_categories': self.invalid_categories,
+            'invalid_records': self.invalid_records,
+            'issues': [issue._asdict() for issue in self.issues],
+        }
+
+    def __str__(self):
+        lines = [f"Категорий: {self.categories}, товаров: {self.records}, ошибок: {self.error_count}"]
+        for issue in self.issues:
+            where = f"строка {issue.line}, категория {issue.category}"
+            if issue.record is not None:
+                where += f", товар {issue.record}"
+            lines.append(f"{where}: {issue.message}")
+        if self.error_count > len(self.issues):
+            lines.append(f"... и еще {self.error_count - len(self.issues)}")
+        return "\n".join(lines)
+
+
+def _is_number(value, expected) -> bool:
+    # bool — подкласс int, но ценой или количеством быть не может
+    return isinstance(value, expected) and not isinstance(value, bool)
+
+
+def check_record(record) -> list:
+    """
+    Проверяет запись товара по тем же правилам, что Product.__init__ и сеттер цены.
+    Возвращает список (код, сообщение); пустой список — запись корректна.
+    """
+    if not isinstance(record, dict):
+        return [('not_object', "Запись товара должна быть объектом")]
+
+    type_name = record.get(TYPE_FIELD, 'product')
+    product_cls = PRODUCT_TYPES.get(type_name) if isinstance(type_name, str) else None
+    if product_cls is None:
+        return [('unknown_type', f"Неизвестный тип товара: {type_name}")]
+
+    problems = []
+    for field in product_cls.record_fields:
+        if field not in record:
+            problems.append(('missing_field', f"Нет поля '{field}'"))
+        elif field in _FIELD_TYPES and not _is_number(record[field], _FIELD_TYPES[field]):
+            problems.append(('bad_type', f"Поле '{field}' имеет недопустимое значение {record[field]!r}"))
+    if problems:
+        return problems
+
+    if record['quantity'] == 0:
+        problems.append(('zero_quantity', f"Товар '{record['name']}' с нулевым количеством"))
+    if record['price'] <= 0:
+        problems.append(('non_positive_price', f"Цена товара '{record['name']}' должна быть положительной"))
+    return problems
+
+
+def check_category(category_data) -> list:
+    """Проверяет поля записи категории (без товаров). Возвращает список (код, сообщение)."""
+    if not isinstance(category_data, dict):
+        return [('not_object', "Запись категории должна быть объектом")]
+    problems = []
+    for field in ('name', 'description'):
+        if not isinstance(category_data.get(field), str):
+            problems.append(('missing_field', f"Нет поля категории '{field}' или оно не строка"))
+    if not isinstance(category_data.get('products'), list):
+        problems.append(('missing_field', "Нет списка товаров 'products'"))
+    return problems
+
+
+def filter_category(category_data, report: ValidationReport, index: int, line: int = None):
+    """
+    Проверяет запись категории и её товары, записывая ошибки в report. Возвращает запись
+    только с корректными товарами или None, если некорректна сама категория.
+    """
+    report.categories += 1
+    problems = check_category(category_data)
+    if problems:
+        for code, message in problems:
+            report.add(line, index, None, code, message)
+        report.invalid_categories += 1
+        return None
+
+    products = category_data['products']
+    valid = []
+    for position, record in enumerate(products):
+        problems = check_record(record)
+        if problems:
+            for code, message in problems:
+                report.add(line, index, position, code, message)
+            report.invalid_records += 1
+        else:
+            valid.append(record)
+    report.records += len(products)
+
+    if len(valid) == len(products):
+        return category_data
+    return dict(category_data, products=valid)
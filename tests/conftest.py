@@ -0,0 +1,28 @@
+import json
+
+import pytest
+
+
+@pytest.fixture
+def catalog_file(tmp_path):
+    """Небольшой каталог во временном файле."""
+    data = [
+        {
+            "name": "Смартфоны",
+            "description": "Телефоны",
+            "products": [
+                {"name": "Iphone 15", "description": "512GB", "price": 210000.0, "quantity": 8},
+                {"name": "Xiaomi", "description": "1024GB, \"Синий\"", "price": 31000.0, "quantity": 14},
+            ]
+        },
+        {
+            "name": "Телевизоры",
+            "description": "ТВ",
+            "products": [
+                {"name": "55\" QLED 4K", "description": "Фоновая подсветка", "price": 123000.0, "quantity": 7},
+            ]
+        },
+    ]
+    path = tmp_path / "catalog.json"
+    path.write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding='utf-8')
+    return str(path)
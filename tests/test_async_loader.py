@@ -0,0 +1,134 @@
+import asyncio
+import gzip
+import json
+import os
+import threading
+
+import pytest
+from src import async_loader
+from src.async_loader import aiter_categories_from_json, aload_data_from_json, CatalogRefresher
+from src.models import Category
+
+
+def _write(path, names):
+    data = [{"name": name, "description": "О", "products": [
+        {"name": "Т", "description": "О", "price": 1.0, "quantity": 1}]} for name in names]
+    path.write_text(json.dumps(data, ensure_ascii=False), encoding='utf-8')
+
+
+class TestAsyncLoader:
+    """Тесты асинхронной загрузки каталога."""
+
+    def setup_method(self):
+        Category.category_count = 0
+        Category.product_count = 0
+
+    def test_aload_matches_sync(self, catalog_file):
+        """Тест совпадения асинхронной загрузки с обычной."""
+        categories = asyncio.run(aload_data_from_json(catalog_file, chunk_size=16, silent=True))
+
+        assert [c.name for c in categories] == ["Смартфоны", "Телевизоры"]
+        assert [len(c) for c in categories] == [2, 1]
+        assert Category.product_count == 3
+
+    def test_aload_gzip(self, tmp_path):
+        """Тест асинхронной загрузки сжатого каталога."""
+        path = tmp_path / "catalog.json.gz"
+        with gzip.open(path, 'wt', encoding='utf-8') as file:
+            json.dump([{"name": "К", "description": "О", "products": [
+                {"name": "Т", "description": "О", "price": 1.0, "quantity": 1}]}], file, ensure_ascii=False)
+
+        categories = asyncio.run(aload_data_from_json(str(path), silent=True))
+
+        assert [c.name for c in categories] == ["К"]
+
+    def test_yields_between_categories(self, tmp_path):
+        """Тест, что другие задачи выполняются во время загрузки."""
+        path = tmp_path / "catalog.json"
+        _write(path, [f"К{i}" for i in range(5)])
+        ticks = []
+
+        async def ticker():
+            while True:
+                ticks.append(len(ticks))
+                await asyncio.sleep(0)
+
+        async def main():
+            task = asyncio.create_task(ticker())
+            loaded = [c async for c in aiter_categories_from_json(str(path), silent=True)]
+            task.cancel()
+            return loaded
+
+        assert len(asyncio.run(main())) == 5
+        assert len(ticks) >= 5
+
+    def test_build_off_event_loop(self, tmp_path, monkeypatch):
+        """Тест, что разбор и создание категорий не выполняются в потоке цикла событий."""
+        path = tmp_path / "catalog.json"
+        _write(path, [f"К{i}" for i in range(3)])
+        threads = []
+        build = async_loader._build_category
+
+        def tracked(category_data, silent=False):
+            threads.append(threading.current_thread())
+            return build(category_data, silent)
+
+        monkeypatch.setattr(async_loader, '_build_category', tracked)
+        categories = asyncio.run(aload_data_from_json(str(path), chunk_size=16, silent=True))
+
+        assert len(categories) == 3
+        assert threads and threading.main_thread() not in threads
+
+    def test_malformed(self, tmp_path):
+        """Тест ошибки разбора при асинхронной загрузке."""
+        path = tmp_path / "broken.json"
+        path.write_text('[{"name": ', encoding='utf-8')
+        with pytest.raises(json.JSONDecodeError):
+            asyncio.run(aload_data_from_json(str(path)))
+
+
+class TestCatalogRefresher:
+    """Тесты фонового обновления каталога."""
+
+    def setup_method(self):
+        Category.category_count = 0
+        Category.product_count = 0
+
+    def test_refresh_swaps_catalog(self, tmp_path):
+        """Тест подмены каталога только при изменении файла."""
+        path = tmp_path / "catalog.json"
+        _write(path, ["А"])
+        refresher = CatalogRefresher(str(path))
+
+        async def main():
+            assert await refresher.refresh() is True
+            first = refresher.categories
+            assert await refresher.refresh() is False
+            assert refresher.categories is first
+
+            _write(path, ["Б", "В"])
+            os.utime(path, ns=(0, os.stat(path).st_mtime_ns + 1_000_000))
+            assert await refresher.refresh() is True
+            return first
+
+        first = asyncio.run(main())
+        assert [c.name for c in first] == ["А"]
+        assert [c.name for c in refresher.categories] == ["Б", "В"]
+
+    def test_background_task_keeps_old_catalog_on_error(self, tmp_path):
+        """Тест, что ошибка обновления не портит текущий каталог."""
+        path = tmp_path / "catalog.json"
+        _write(path, ["А"])
+        refresher = CatalogRefresher(str(path), interval=0.01)
+
+        async def main():
+            refresher.start()
+            await asyncio.sleep(0.05)
+            path.write_text('[{"name": ', encoding='utf-8')
+            os.utime(path, ns=(0, os.stat(path).st_mtime_ns + 1_000_000))
+            await asyncio.sleep(0.05)
+            await refresher.stop()
+
+        asyncio.run(main())
+        assert [c.name for c in refresher.categories] == ["А"]
+        assert isinstance(refresher.last_error, json.JSONDecodeError)
@@ -0,0 +1,105 @@
+import json
+
+from benchmarks import bench_startup, bench_suite, load_gate
+from benchmarks.synthetic import write_catalog
+from src.data_loader import load_data_from_json
+from src.models import Category, Smartphone, LawnGrass
+
+
+def test_write_catalog(tmp_path):
+    """Тест генерации синтетического каталога."""
+    path = str(tmp_path / "catalog.json")
+    write_catalog(path, 10, n_categories=3)
+
+    categories = load_data_from_json(path, silent=True)
+
+    assert [len(c) for c in categories] == [4, 3, 3]
+    kinds = [type(p) for c in categories for p in c.get_products_list()]
+    assert kinds.count(Smartphone) == 3
+    assert kinds.count(LawnGrass) == 3
+
+
+def test_bench_suite_smoke(tmp_path, monkeypatch):
+    """Тест прогона всех сценариев на маленьком каталоге и сравнения отчетов."""
+    monkeypatch.setattr(bench_suite, 'MIN_SECONDS', 0)
+    output = str(tmp_path / "bench.json")
+
+    bench_suite.main(['--sizes', '20', '--output', output])
+    bench_suite.main(['--sizes', '20', '--cases', 'Category.products', '--compare', output])
+
+    with open(output, encoding='utf-8') as file:
+        report = json.load(file)
+    assert set(report['results']) == set(bench_suite.CASES)
+    assert report['results']['Category.add_product']['20']['items_per_sec'] > 0
+    Category.category_count = 0
+    Category.product_count = 0
+
+
+def test_bench_startup_smoke(tmp_path):
+    """Тест замера старта: импорт, первая категория и создание товаров."""
+    output = str(tmp_path / "startup.json")
+
+    bench_startup.main(['--runs', '1', '--output', output])
+    bench_startup.main(['--runs', '1', '--compare', output])
+
+    with open(output, encoding='utf-8') as file:
+        report = json.load(file)
+    assert set(report['us']) == {'import src.models', 'import src.data_loader', 'first Category'}
+    assert all(value > 0 for value in report['us'].values())
+    assert report['product_ns'] > 0
+
+
+def test_load_gate(tmp_path, capsys, monkeypatch):
+    """Тест нагрузочной проверки: запись базы, сравнение и обнаружение регрессии памяти."""
+    monkeypatch.setattr(load_gate, 'MIN_SECONDS', 0)
+    Category.category_count = 0
+    Category.product_count = 0
+    baseline = str(tmp_path / "baseline.json")
+    args = ['--products', '300', '--categories', '3', '--runs', '1', '--baseline', baseline]
+
+    assert load_gate.main(args + ['--update-baseline']) == 0
+    assert load_gate.main(args + ['--time-tolerance', '1000']) == 0
+
+    with open(baseline, encoding='utf-8') as file:
+        report = json.load(file)
+    assert set(report['stages']) == {'load', 'load_verbose', 'construct', 'add_product', 'render'}
+    report['stages']['load']['peak_bytes'] //= 2
+    with open(baseline, 'w', encoding='utf-8') as file:
+        json.dump(report, file)
+
+    assert load_gate.main(args + ['--time-tolerance', '1000']) == 1
+    assert "РЕГРЕССИЯ load: память" in capsys.readouterr().err
+    assert load_gate.main(['--products', '200', '--runs', '1', '--baseline', baseline]) == 2
+    assert Category.product_count == 0
+
+
+def test_load_gate_restores_counters(monkeypatch):
+    """Тест, что замеры не сбрасывают счетчики уже созданных категорий."""
+    monkeypatch.setattr(load_gate, 'MIN_SECONDS', 0)
+    monkeypatch.setattr(Category, 'category_count', 5)
+    monkeypatch.setattr(Category, 'product_count', 42)
+
+    load_gate.run_pipeline(60, 2, runs=1)
+
+    assert (Category.category_count, Category.product_count) == (5, 42)
+
+
+def test_load_gate_slowest():
+    """Тест сведения прогонов для базы: берутся худшие время и память каждого этапа."""
+    fast = {'meta': {'products': 1}, 'stages': {'load': {'seconds': 1.0, 'peak_bytes': 30}}}
+    slow = {'meta': {'products': 1}, 'stages': {'load': {'seconds': 2.0, 'peak_bytes': 20}}}
+
+    merged = load_gate.slowest([fast, slow])
+
+    assert merged['meta'] == fast['meta']
+    assert merged['stages'] == {'load': {'seconds': 2.0, 'peak_bytes': 30}}
+
+
+def test_load_gate_stored_baseline():
+    """Тест, что сохраненная база соответствует размеру проверки по умолчанию."""
+    with open(load_gate.BASELINE, encoding='utf-8') as file:
+        baseline = json.load(file)
+
+    assert baseline['meta']['products'] == load_gate.DEFAULT_PRODUCTS
+    assert baseline['meta']['categories'] == load_gate.DEFAULT_CATEGORIES
+    assert load_gate.check(baseline, baseline) == []
@@ -0,0 +1,74 @@
+from src.catalog_index import CatalogIndex
+from src.models import Product, Smartphone, Category
+
+
+class TestCatalogIndex:
+    """Тесты индексов поиска товаров."""
+
+    def setup_method(self):
+        Category.category_count = 0
+        Category.product_count = 0
+        self.iphone = Smartphone("Iphone 15", "512GB, Gray space", 210000.0, 8, 98.2, "15", 512, "Gray")
+        self.xiaomi = Product("Xiaomi Redmi Note 11", "1024GB, Синий", 31000.0, 14)
+        self.tv = Product("55\" QLED 4K", "Фоновая подсветка", 123000.0, 7)
+        self.phones = Category("Смартфоны", "Описание", [self.iphone, self.xiaomi])
+        self.tvs = Category("Телевизоры", "Описание", [self.tv])
+        self.index = CatalogIndex([self.phones, self.tvs])
+
+    def test_by_name(self):
+        """Тест поиска по точному названию."""
+        assert self.index.by_name("Iphone 15") == [self.iphone]
+        assert self.index.by_name("Iphone") == []
+        assert self.index.by_name("Iphone 15", category="Телевизоры") == []
+
+    def test_by_prefix(self):
+        """Тест поиска по префиксу названия."""
+        assert self.index.by_prefix("Xia") == [self.xiaomi]
+        assert self.index.by_prefix("") == [self.tv, self.iphone, self.xiaomi]
+
+    def test_search_substring(self):
+        """Тест поиска по подстроке названия и описания."""
+        assert self.index.search("redmi") == [self.xiaomi]
+        assert self.index.search("подсвет") == [self.tv]
+        assert sorted(p.name for p in self.index.search("gb")) == ["Iphone 15", "Xiaomi Redmi Note 11"]
+        assert self.index.search("нет такого") == []
+
+    def test_price_range(self):
+        """Тест поиска по диапазону цен."""
+        assert self.index.price_range(30000.0, 130000.0) == [self.xiaomi, self.tv]
+        assert self.index.price_range(low=200000.0) == [self.iphone]
+        assert self.index.price_range(high=31000.0) == [self.xiaomi]
+        assert self.index.price_range(category="Смартфоны") == [self.xiaomi, self.iphone]
+
+    def test_by_category(self):
+        """Тест выборки товаров категории."""
+        assert self.index.by_category("Телевизоры") == [self.tv]
+
+    def test_add_product_updates_index(self):
+        """Тест обновления индексов при добавлении товара."""
+        product = Product("Iphone 14", "256GB", 90000.0, 3)
+        self.phones.add_product(product)
+        other = Product("Iphone 13", "128GB", 50000.0, 1)
+        self.tvs.add_products([other])
+
+        assert len(self.index) == 5
+        assert self.index.by_prefix("Iphone 1") == [other, product, self.iphone]
+        assert self.index.price_range(40000.0, 100000.0) == [other, product]
+
+    def test_price_change_updates_index(self):
+        """Тест обновления индекса цен при смене цены."""
+        self.iphone.price = 1000.0
+        assert self.index.price_range(high=20000.0) == [self.iphone]
+        assert self.index.price_range(low=200000.0) == []
+
+        # Некорректная цена не меняет ни товар, ни индекс
+        self.iphone.price = -1.0
+        assert self.index.price_range(high=20000.0) == [self.iphone]
+
+    def test_product_in_several_categories(self):
+        """Тест товара, входящего в несколько категорий."""
+        self.tvs.add_product(self.xiaomi)
+
+        assert len(self.index) == 3
+        assert self.index.by_name("Xiaomi Redmi Note 11", category="Телевизоры") == [self.xiaomi]
+        assert self.index.by_name("Xiaomi Redmi Note 11", category="Смартфоны") == [self.xiaomi]
@@ -0,0 +1,153 @@
+import pytest
+from src import columnar as columnar_module
+from src.columnar import ColumnarCategory
+from src.models import Product, Smartphone, LawnGrass, Category, ZeroQuantityError
+
+
+class TestColumnarCategory:
+    """Тесты колоночного хранилища категории."""
+
+    def setup_method(self):
+        Category.category_count = 0
+        Category.product_count = 0
+        self.products = [
+            Product("Т1", "Описание", 100.0, 2),
+            Smartphone("Смартфон", "Описание", 300.0, 1, 95.5, "Модель", 128, "Черный"),
+            LawnGrass("Трава", "Газонная", 200.0, 4, "Россия", "7 дней", "Зеленый"),
+        ]
+
+    def test_aggregates_match_category(self):
+        """Тест совпадения агрегатов с обычной категорией."""
+        columnar = ColumnarCategory("Тест", "Описание", self.products)
+        plain = Category("Тест", "Описание", self.products)
+
+        assert len(columnar) == len(plain) == 3
+        assert columnar.middle_price() == plain.middle_price() == 200.0
+        assert str(columnar) == str(plain)
+        assert columnar.products == plain.products
+        assert columnar.total_quantity() == 7
+        assert columnar.stock_value() == 100.0 * 2 + 300.0 * 1 + 200.0 * 4
+        assert columnar.min_price() == 100.0
+        assert columnar.max_price() == 300.0
+        assert Category.product_count == 6
+
+    def test_stock_value_by_class(self):
+        """Тест стоимости остатков по классам товаров."""
+        mixed = ColumnarCategory("Тест", "Описание", self.products)
+        plain = ColumnarCategory("Тест", "Описание", self.products[:1])
+
+        assert mixed.stock_value_by_class() == {Product: 200.0, Smartphone: 300.0, LawnGrass: 800.0}
+        assert plain.stock_value_by_class() == {Product: 200.0}
+        assert ColumnarCategory("Пусто", "Описание").stock_value_by_class() == {}
+
+    def test_filtered_sum(self):
+        """Тест сумм по диапазону цен."""
+        category = ColumnarCategory("Тест", "Описание", self.products)
+
+        assert category.filtered_sum('quantity', min_price=150.0) == 5
+        assert category.filtered_sum('price', max_price=200.0) == 300.0
+        assert category.filtered_sum('stock_value', 150.0, 250.0) == 800.0
+        with pytest.raises(ValueError):
+            category.filtered_sum('name')
+
+    def test_empty_category(self):
+        """Тест агрегатов пустой категории."""
+        category = ColumnarCategory("Пусто", "Описание")
+
+        assert category.middle_price() == 0
+        assert category.min_price() is None
+        assert category.stock_value() == 0
+        assert str(category) == "Пусто, количество продуктов: 0 шт."
+
+    def test_lazy_materialization(self, capsys):
+        """Тест создания объектов товаров по запросу."""
+        category = ColumnarCategory("Тест", "Описание", self.products)
+        capsys.readouterr()
+
+        assert repr(category.product_at(1)) == repr(self.products[1])
+        products = category.get_products_list()
+        assert [repr(p) for p in products] == [repr(p) for p in self.products]
+        assert category.get_products_list() is products
+        assert capsys.readouterr().out == ""
+
+    def test_from_records(self):
+        """Тест заполнения колонок из словарей."""
+        records = [{"name": f"Т{i}", "description": "О", "price": 10.0 * i, "quantity": i} for i in range(1, 5)]
+        category = ColumnarCategory.from_records("Тест", "Описание", records)
+
+        assert len(category) == 4
+        assert category.total_quantity() == 10
+        assert category.get_products_list()[3].name == "Т4"
+        assert Category.product_count == 4
+
+        with pytest.raises(ZeroQuantityError):
+            ColumnarCategory.from_records("Тест", "Описание", [{"name": "Т", "description": "О",
+                                                                 "price": 1.0, "quantity": 0}])
+
+    def test_from_typed_records(self):
+        """Тест заполнения колонок записями разных типов."""
+        records = [
+            {"type": "smartphone", "name": "Смартфон", "description": "Описание", "price": 300.0, "quantity": 1,
+             "efficiency": 95.5, "model": "Модель", "memory": 128, "color": "Черный"},
+            {"type": "lawn_grass", "name": "Трава", "description": "Газонная", "price": 200.0, "quantity": 4,
+             "country": "Россия", "germination_period": "7 дней", "color": "Зеленый"},
+        ]
+        category = ColumnarCategory.from_records("Тест", "Описание", records)
+
+        assert [repr(p) for p in category.get_products_list()] == [repr(p) for p in self.products[1:]]
+        with pytest.raises(ValueError):
+            ColumnarCategory.from_records("Тест", "Описание", [dict(records[0], type="car")])
+
+    def test_add_product_validation(self):
+        """Тест проверок при добавлении товара."""
+        category = ColumnarCategory("Тест", "Описание")
+        with pytest.raises(TypeError):
+            category.add_product("не продукт")
+
+        product = Product("Т", "О", 1.0, 1)
+        category.add_product(product)
+        assert category.get_products_list()[0].name == "Т"
+        category.add_product(Product("Т2", "О", 2.0, 1))
+        assert len(category.get_products_list()) == 2
+
+
+class TestColumnarNumpy:
+    """Тесты агрегатов колоночной категории через numpy: результаты совпадают с расчетом по array."""
+
+    def setup_method(self):
+        pytest.importorskip("numpy")
+        Category.category_count = 0
+        Category.product_count = 0
+        products = [
+            Product("Т1", "Описание", 100.5, 2),
+            Smartphone("Смартфон", "Описание", 300.0, 1, 95.5, "Модель", 128, "Черный"),
+            LawnGrass("Трава", "Газонная", 200.0, 4, "Россия", "7 дней", "Зеленый"),
+        ]
+        self.category = ColumnarCategory("Тест", "Описание", products)
+
+    def _aggregates(self, category):
+        return (
+            category.middle_price(), category.total_quantity(), category.stock_value(),
+            category.stock_value_by_class(), category.min_price(), category.max_price(),
+            category.filtered_sum('quantity', min_price=150.0), category.filtered_sum('price', max_price=200.0),
+            category.filtered_sum('stock_value', 150.0, 250.0), str(category),
+        )
+
+    def test_matches_pure_python(self, monkeypatch):
+        """Тест совпадения векторных агрегатов с расчетом без numpy."""
+        vectorized = self._aggregates(self.category)
+        monkeypatch.setattr(columnar_module, 'np', None)
+
+        assert vectorized == self._aggregates(self.category)
+        assert vectorized[0] == pytest.approx((100.5 + 300.0 + 200.0) / 3)
+        assert isinstance(vectorized[0], float) and isinstance(vectorized[1], int)
+
+    def test_snapshot_columns(self, tmp_path):
+        """Тест агрегатов по колонкам снимка, прочитанного через mmap."""
+        from src.snapshot import load_snapshot, save_snapshot
+        path = str(tmp_path / "catalog.snap")
+        save_snapshot([self.category], path)
+
+        loaded = load_snapshot(path)[0]
+
+        assert self._aggregates(loaded) == self._aggregates(self.category)
@@ -0,0 +1,175 @@
+import json
+import os
+import tracemalloc
+
+import pytest
+from src.data_loader import load_data_from_json, iter_categories_from_json, iter_products_from_json, load_catalogs
+from src.models import Category, Product, Smartphone, LawnGrass, ZeroQuantityError
+
+PRODUCTS_JSON = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'products.json')
+
+
+class TestLoadDataFromJson:
+    """Тесты загрузки каталога из JSON."""
+
+    def setup_method(self):
+        Category.category_count = 0
+        Category.product_count = 0
+
+    def test_load_products_json(self):
+        """Тест загрузки файла products.json из репозитория."""
+        categories = load_data_from_json(PRODUCTS_JSON)
+        with open(PRODUCTS_JSON, encoding='utf-8') as file:
+            data = json.load(file)
+
+        assert [c.name for c in categories] == [c['name'] for c in data]
+        assert [len(c) for c in categories] == [len(c['products']) for c in data]
+        assert Category.product_count == sum(len(c['products']) for c in data)
+
+    def test_typed_products(self, tmp_path):
+        """Тест загрузки наследников Product по полю type."""
+        path = tmp_path / "typed.json"
+        path.write_text(json.dumps([{"name": "К", "description": "О", "products": [
+            {"type": "smartphone", "name": "Iphone", "description": "О", "price": 1.0, "quantity": 1,
+             "efficiency": 95.5, "model": "15", "memory": 256, "color": "Черный"},
+            {"type": "lawn_grass", "name": "Трава", "description": "О", "price": 2.0, "quantity": 2,
+             "country": "Россия", "germination_period": "7 дней", "color": "Зеленый"},
+            {"name": "Т", "description": "О", "price": 3.0, "quantity": 3},
+        ]}], ensure_ascii=False), encoding='utf-8')
+
+        for categories in (load_data_from_json(str(path)), load_data_from_json(str(path), silent=True)):
+            products = categories[0].get_products_list()
+            assert [type(p) for p in products] == [Smartphone, LawnGrass, Product]
+            assert products[0].memory == 256
+            assert products[1].germination_period == "7 дней"
+
+    def test_zero_quantity_raises(self, tmp_path):
+        """Тест загрузки товара с нулевым количеством."""
+        path = tmp_path / "bad.json"
+        path.write_text(json.dumps([{"name": "К", "description": "О", "products": [
+            {"name": "Т", "description": "О", "price": 1.0, "quantity": 0}]}]), encoding='utf-8')
+        with pytest.raises(ZeroQuantityError):
+            load_data_from_json(str(path))
+
+
+class TestStreamingLoader:
+    """Тесты потоковой загрузки каталога."""
+
+    def setup_method(self):
+        Category.category_count = 0
+        Category.product_count = 0
+
+    @pytest.mark.parametrize("chunk_size", [1, 7, 64, 1 << 16])
+    def test_iter_categories_matches_json(self, catalog_file, chunk_size):
+        """Тест совпадения потоковой загрузки с обычной при любом размере порции."""
+        categories = list(iter_categories_from_json(catalog_file, chunk_size=chunk_size))
+
+        assert [c.name for c in categories] == ["Смартфоны", "Телевизоры"]
+        assert categories[0].products == ("Iphone 15, 210000.0 руб. Остаток: 8 шт.\n"
+                                          "Xiaomi, 31000.0 руб. Остаток: 14 шт.")
+        assert repr(categories[1].get_products_list()[0]) == \
+            "Product('55\" QLED 4K', 'Фоновая подсветка', 123000.0, 7)"
+
+    def test_iter_categories_is_lazy(self, catalog_file):
+        """Тест, что категории создаются по мере чтения."""
+        iterator = iter_categories_from_json(catalog_file)
+        first = next(iterator)
+        assert first.name == "Смартфоны"
+        assert Category.category_count == 1
+
+    def test_iter_products_pairs(self, catalog_file):
+        """Тест выдачи пар (категория, товар)."""
+        pairs = list(iter_products_from_json(catalog_file, chunk_size=5))
+
+        assert [(c.name, p.name) for c, p in pairs] == [
+            ("Смартфоны", "Iphone 15"),
+            ("Смартфоны", "Xiaomi"),
+            ("Телевизоры", "55\" QLED 4K"),
+        ]
+        assert all(isinstance(p, Product) for _, p in pairs)
+        assert pairs[0][0] is pairs[1][0]
+        assert Category.product_count == 3
+
+    def test_silent_mode(self, catalog_file, capsys):
+        """Тест загрузки без вывода сообщений."""
+        categories = load_data_from_json(catalog_file, silent=True)
+
+        assert capsys.readouterr().out == ""
+        assert [len(c) for c in categories] == [2, 1]
+        assert Category.product_count == 3
+
+    def test_empty_array(self, tmp_path):
+        """Тест пустого каталога."""
+        path = tmp_path / "empty.json"
+        path.write_text(" [ ] ", encoding='utf-8')
+        assert list(iter_categories_from_json(str(path))) == []
+
+    @pytest.mark.parametrize("text", ['{"name": 1}', '[{"name": "К"', '[{"name": "К", "description": "О", '
+                                                                     '"products": []} {}]',
+                                      '[]\n[]', '[ ]  garbage', '[{"name": "К", "description": "О", "products": []}]]'])
+    def test_malformed_json(self, tmp_path, text):
+        """Тест ошибок разбора повреждённого файла."""
+        path = tmp_path / "broken.json"
+        path.write_text(text, encoding='utf-8')
+        with pytest.raises(json.JSONDecodeError):
+            list(iter_categories_from_json(str(path), chunk_size=4))
+
+    def test_syntax_error_does_not_read_whole_file(self, tmp_path):
+        """Тест, что ошибка синтаксиса в первой категории не затягивает в память остаток файла."""
+        record = json.dumps({"name": "Т", "description": "О" * 50, "price": 1.0, "quantity": 1})
+        path = tmp_path / "broken.json"
+        with open(path, 'w', encoding='utf-8') as file:
+            # В первой категории пропущена запятая между товарами
+            file.write('[{"name": "К", "description": "О", "products": [' + record + ' ' + record + ']}')
+            for _ in range(100):
+                file.write(',{"name": "К", "description": "О", "products": [' + ','.join([record] * 1000) + ']}')
+            file.write(']')
+
+        tracemalloc.start()
+        try:
+            with pytest.raises(json.JSONDecodeError):
+                list(iter_categories_from_json(str(path), silent=True))
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+        assert os.path.getsize(path) > 10 * 1024 * 1024
+        # Буфер чтения файла (1 МиБ) и одна порция текста
+        assert peak < 3 * 1024 * 1024
+
+
+class TestLoadCatalogs:
+    """Тесты параллельной загрузки нескольких файлов."""
+
+    def setup_method(self):
+        Category.category_count = 0
+        Category.product_count = 0
+
+    def _write(self, tmp_path, file_name, data):
+        path = tmp_path / file_name
+        path.write_text(json.dumps(data, ensure_ascii=False), encoding='utf-8')
+        return str(path)
+
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_merge_and_errors(self, tmp_path, catalog_file, workers):
+        """Тест объединения одноименных категорий и отчета об ошибках по файлам."""
+        second = self._write(tmp_path, "vendor2.json", [
+            {"name": "Смартфоны", "description": "Другое описание", "products": [
+                {"name": "Pixel 8", "description": "128GB", "price": 70000.0, "quantity": 3}]},
+            {"name": "Ноутбуки", "description": "Ноутбуки", "products": [
+                {"name": "ThinkPad", "description": "X1", "price": 150000.0, "quantity": 2}]},
+        ])
+        zero = self._write(tmp_path, "zero.json", [{"name": "Смартфоны", "description": "О", "products": [
+            {"name": "Брак", "description": "О", "price": 1.0, "quantity": 0}]}])
+        missing = str(tmp_path / "missing.json")
+
+        categories, errors = load_catalogs([catalog_file, zero, second, missing], workers=workers)
+
+        assert [c.name for c in categories] == ["Смартфоны", "Телевизоры", "Ноутбуки"]
+        assert categories[0].description == "Телефоны"
+        assert [p.name for p in categories[0].get_products_list()] == ["Iphone 15", "Xiaomi", "Pixel 8"]
+        assert Category.category_count == 3
+        assert Category.product_count == 5
+        assert set(errors) == {zero, missing}
+        assert isinstance(errors[zero], ZeroQuantityError)
+        assert isinstance(errors[missing], OSError)
@@ -0,0 +1,120 @@
+import pytest
+from src.catalog_index import CatalogIndex
+from src.columnar import ColumnarCategory
+from src.dedup import merge_duplicates
+from src.lazy import LazyCategory
+from src.models import Product, Smartphone, Category
+from src.threadsafe import ThreadSafeCategory
+
+
+def _product(name="Т", price=100.0, quantity=1, description="О"):
+    return Product(name, description, price, quantity)
+
+
+class TestMergeDuplicates:
+    """Тесты слияния дубликатов товаров."""
+
+    def setup_method(self):
+        Category.category_count = 0
+        Category.product_count = 0
+
+    def test_merge_across_categories(self):
+        """Тест слияния повторов внутри и между категориями."""
+        first, second = _product(quantity=2), _product("Другой", 50.0)
+        phones = Category("К1", "О", [first, second, _product(quantity=3)])
+        garden = Category("К2", "О", [_product(quantity=5), _product(description="Иное")])
+        index = CatalogIndex([phones, garden])
+
+        report = merge_duplicates([phones, garden])
+
+        assert report.to_dict() == {'records': 5, 'unique': 3, 'collapsed': 2, 'cross_category': 1,
+                                    'price_conflicts': 0}
+        assert phones.get_products_list() == [first, second]
+        assert first.quantity == 10
+        assert phones.total_quantity() == 11
+        assert phones.stock_value() == 100.0 * 10 + 50.0
+        assert [p.description for p in garden.get_products_list()] == ["Иное"]
+        assert Category.product_count == 3
+        assert len(index) == 3
+        assert index.by_name("Т") == [first, garden.get_products_list()[0]]
+
+    @pytest.mark.parametrize("policy, price", [
+        ('first', 100.0), ('last', 40.0), ('min', 40.0), ('max', 300.0),
+        ('weighted', (100.0 * 1 + 300.0 * 2 + 40.0 * 1) / 4),
+        (lambda price, quantity, other, other_quantity: price + other, 440.0),
+    ])
+    def test_price_policies(self, policy, price):
+        """Тест политик выбора цены при конфликте."""
+        category = Category("К", "О", [_product(), _product(price=300.0, quantity=2), _product(price=40.0)])
+
+        report = merge_duplicates([category], price_policy=policy)
+
+        assert report.price_conflicts == 2
+        assert len(category) == 1
+        kept = category.get_products_list()[0]
+        assert (kept.price, kept.quantity) == (pytest.approx(price), 4)
+        assert category.middle_price() == pytest.approx(price)
+
+    def test_error_policy_keeps_catalog(self):
+        """Тест, что политика 'error' не меняет каталог."""
+        category = Category("К", "О", [_product(), _product(price=300.0)])
+
+        with pytest.raises(ValueError):
+            merge_duplicates([category], price_policy='error')
+
+        assert len(category) == 2
+        assert Category.product_count == 2
+
+    def test_scope_and_classes(self):
+        """Тест поиска только внутри категорий и различения классов товаров."""
+        phone = Smartphone("Т", "О", 100.0, 1, 90.0, "M", 64, "Black")
+        first = Category("К1", "О", [_product(), phone])
+        second = LazyCategory("К2", "О", [{"name": "Т", "description": "О", "price": 100.0, "quantity": 1}] * 2)
+
+        report = merge_duplicates([first, second], across_categories=False)
+
+        assert (report.collapsed, report.unique) == (1, 3)
+        assert len(first) == 2
+        assert len(second) == 1 and second.total_quantity() == 2
+
+    def test_same_object_added_twice(self):
+        """Тест товара, добавленного в категорию дважды."""
+        product = _product(quantity=3)
+        category = ThreadSafeCategory("К", "О", [product, product])
+
+        merge_duplicates([category])
+
+        assert category.get_products_list() == (product,)
+        assert product.quantity == 3
+        assert category.total_quantity() == 3
+        assert Category.product_count == 1
+
+    def test_shared_object_across_categories(self):
+        """Тест товара, который входит в две категории одним и тем же объектом."""
+        product = _product(quantity=3)
+        first = Category("К1", "О", [product])
+        second = Category("К2", "О", [product])
+
+        report = merge_duplicates([first, second])
+
+        assert report.collapsed == 0
+        assert first.get_products_list() == [product]
+        assert second.get_products_list() == [product]
+        assert product.quantity == 3
+
+    def test_columnar_not_supported(self):
+        """Тест отказа для колоночной категории."""
+        with pytest.raises(TypeError):
+            merge_duplicates([ColumnarCategory("К", "О", [_product()])])
+
+    def test_remove_products(self):
+        """Тест пакетного удаления товаров."""
+        products = [_product(str(i)) for i in range(4)]
+        category = Category("К", "О", products)
+
+        assert category.remove_products(products[1:3]) == 2
+        assert category.get_products_list() == [products[0], products[3]]
+        assert Category.product_count == 2
+        with pytest.raises(ValueError):
+            category.remove_products([products[1]])
+        assert len(category) == 2
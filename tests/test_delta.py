@@ -0,0 +1,192 @@
+import json
+
+import pytest
+from src.catalog_index import CatalogIndex
+from src.columnar import ColumnarCategory
+from src.delta import CatalogUpdater, apply_delta
+from src.lazy import LazyCategory
+from src.models import Product, Smartphone, Category, ZeroQuantityError
+
+
+class TestRemoveProduct:
+    """Тесты удаления товара из категории."""
+
+    def setup_method(self):
+        Category.category_count = 0
+        Category.product_count = 0
+
+    def test_remove_updates_aggregates(self):
+        """Тест пересчета агрегатов и счетчика при удалении."""
+        p1 = Product("Т1", "О", 100.0, 2)
+        p2 = Product("Т2", "О", 300.0, 1)
+        category = Category("К", "О", [p1, p2])
+        category.products
+
+        category.remove_product(p2)
+
+        assert len(category) == 1
+        assert Category.product_count == 1
+        assert category.middle_price() == 100.0
+        assert category.max_price() == 100.0
+        assert category.stock_value() == 200.0
+        assert category.products == "Т1, 100.0 руб. Остаток: 2 шт."
+        p2.price = 1000.0
+        assert category.middle_price() == 100.0
+
+    def test_remove_missing(self):
+        """Тест удаления товара, которого нет в категории."""
+        category = Category("К", "О")
+        with pytest.raises(ValueError):
+            category.remove_product(Product("Т", "О", 1.0, 1))
+
+    def test_remove_updates_index(self):
+        """Тест обновления индекса при удалении."""
+        product = Product("Iphone", "О", 100.0, 1)
+        category = Category("К", "О", [product])
+        index = CatalogIndex([category])
+
+        category.remove_product(product)
+
+        assert len(index) == 0
+        assert index.by_prefix("Iph") == []
+        assert index.price_range() == []
+        assert index.search("iphone") == []
+
+
+class TestCatalogUpdater:
+    """Тесты применения изменений к каталогу."""
+
+    def setup_method(self):
+        Category.category_count = 0
+        Category.product_count = 0
+        self.iphone = Product("Iphone 15", "512GB", 210000.0, 8)
+        self.xiaomi = Product("Xiaomi", "1024GB", 31000.0, 14)
+        self.phones = Category("Смартфоны", "Телефоны", [self.iphone, self.xiaomi])
+        self.categories = [self.phones]
+        self.updater = CatalogUpdater(self.categories)
+
+    def test_price_and_quantity(self):
+        """Тест изменения цены и количества на месте."""
+        summary = self.updater.apply([{"category": "Смартфоны", "price": {"Iphone 15": 200000.0},
+                                       "quantity": {"Xiaomi": 4}}])
+
+        assert summary == {'categories_added': 0, 'added': 0, 'updated': 2, 'removed': 0}
+        assert self.iphone.price == 200000.0
+        assert self.xiaomi.quantity == 4
+        assert str(self.phones) == "Смартфоны, количество продуктов: 12 шт."
+        assert self.phones.middle_price() == (200000.0 + 31000.0) / 2
+
+    def test_upsert_and_remove(self):
+        """Тест добавления, обновления и удаления товаров."""
+        summary = self.updater.apply([
+            {"category": "Смартфоны", "remove": ["Xiaomi"], "upsert": [
+                {"name": "Iphone 15", "description": "256GB", "price": 190000.0, "quantity": 2},
+                {"type": "smartphone", "name": "Pixel 8", "description": "128GB", "price": 70000.0, "quantity": 3,
+                 "efficiency": 90.0, "model": "8", "memory": 128, "color": "Black"},
+            ]},
+            {"category": "Ноутбуки", "description": "Ноутбуки", "upsert": [
+                {"name": "ThinkPad", "description": "X1", "price": 150000.0, "quantity": 1}]},
+        ])
+
+        assert summary == {'categories_added': 1, 'added': 2, 'updated': 1, 'removed': 1}
+        assert [p.name for p in self.phones.get_products_list()] == ["Iphone 15", "Pixel 8"]
+        assert self.iphone.description == "256GB"
+        assert isinstance(self.phones.get_products_list()[1], Smartphone)
+        assert [c.name for c in self.categories] == ["Смартфоны", "Ноутбуки"]
+        assert Category.category_count == 2
+        assert Category.product_count == 3
+
+    def test_type_change_replaces_product(self):
+        """Тест замены товара при смене его класса."""
+        self.updater.apply([{"category": "Смартфоны", "upsert": [
+            {"type": "smartphone", "name": "Xiaomi", "description": "О", "price": 1.0, "quantity": 1,
+             "efficiency": 90.0, "model": "M", "memory": 64, "color": "Blue"}]}])
+
+        products = self.phones.get_products_list()
+        assert [type(p) for p in products] == [Product, Smartphone]
+        assert Category.product_count == 2
+
+    @pytest.mark.parametrize("patch, error", [
+        ([{"category": "Смартфоны", "quantity": {"Iphone 15": 0}}], ZeroQuantityError),
+        ([{"category": "Смартфоны", "upsert": [{"name": "Новый", "description": "О", "price": 1.0,
+                                               "quantity": 0}]}], ZeroQuantityError),
+        ([{"category": "Смартфоны", "price": {"Iphone 15": -1.0}}], ValueError),
+        ([{"category": "Смартфоны", "remove": ["Нет такого"]}], KeyError),
+        ([{"category": "Смартфоны", "remove": ["Xiaomi"], "price": {"Xiaomi": 1.0}}], KeyError),
+        ([{"category": "Смартфоны", "upsert": [{"name": "Без цены", "description": "О", "quantity": 1}]}],
+         KeyError),
+        ([{"category": "Смартфоны", "remove": ["Xiaomi", "Xiaomi"]}], ValueError),
+        ([{"category": "Смартфоны", "remove": ["Iphone 15"]}, {"category": "Смартфоны", "price": {"Iphone 15": 5.0}}],
+         KeyError),
+        ([{"category": "Смартфоны", "remove": ["Iphone 15"]}, {"category": "Смартфоны", "remove": ["Iphone 15"]}],
+         KeyError),
+    ])
+    def test_invalid_patch_is_atomic(self, patch, error):
+        """Тест, что некорректное изменение не применяется даже частично."""
+        patch = [{"category": "Смартфоны", "price": {"Xiaomi": 1.0}}] + patch
+
+        with pytest.raises(error):
+            self.updater.apply(patch)
+
+        assert self.xiaomi.price == 31000.0
+        assert len(self.phones) == 2
+        assert Category.product_count == 2
+
+    def test_apply_file_and_lazy_category(self, tmp_path):
+        """Тест применения изменения из файла к ленивой категории."""
+        category = LazyCategory("Сад", "О", [{"name": "Трава", "description": "О", "price": 10.0, "quantity": 5}])
+        path = tmp_path / "delta.json"
+        path.write_text(json.dumps([{"category": "Сад", "quantity": {"Трава": 7}}], ensure_ascii=False),
+                        encoding='utf-8')
+
+        assert CatalogUpdater([category]).apply_file(str(path))['updated'] == 1
+        assert category.total_quantity() == 7
+
+    def test_apply_delta(self):
+        """Тест разового применения изменения."""
+        apply_delta(self.categories, [{"category": "Смартфоны", "remove": ["Iphone 15"]}])
+        assert len(self.phones) == 1
+        assert Category.product_count == 1
+
+    def test_entries_for_same_category(self):
+        """Тест нескольких записей одной категории: каждая проверяется с учетом предыдущих."""
+        summary = self.updater.apply([
+            {"category": "Смартфоны", "remove": ["Xiaomi"]},
+            {"category": "Смартфоны", "upsert": [{"name": "Xiaomi", "description": "Новый", "price": 1.0,
+                                                 "quantity": 1}]},
+            {"category": "Смартфоны", "price": {"Xiaomi": 2.0}},
+        ])
+
+        assert summary == {'categories_added': 0, 'added': 1, 'updated': 1, 'removed': 1}
+        replacement = self.phones.get_products_list()[1]
+        assert replacement is not self.xiaomi and replacement.price == 2.0
+
+    def test_tracks_category_changes(self):
+        """Тест, что индекс названий следит за товарами, добавленными и удаленными в обход апдейтера."""
+        pixel = Product("Pixel", "О", 50000.0, 1)
+        self.phones.add_product(pixel)
+        self.phones.remove_product(self.xiaomi)
+
+        self.updater.apply([{"category": "Смартфоны", "price": {"Pixel": 45000.0}}])
+        assert pixel.price == 45000.0
+        with pytest.raises(KeyError):
+            self.updater.apply([{"category": "Смартфоны", "quantity": {"Xiaomi": 1}}])
+
+        self.updater.apply([{"category": "Смартфоны", "remove": ["Pixel"]}])
+        assert self.phones.get_products_list() == [self.iphone]
+
+    def test_description_updates_index(self):
+        """Тест, что смена описания переиндексирует поиск."""
+        index = CatalogIndex(self.categories)
+
+        self.updater.apply([{"category": "Смартфоны", "upsert": [
+            {"name": "Iphone 15", "description": "Титановый", "price": 210000.0, "quantity": 8}]}])
+
+        assert index.search("512GB") == []
+        assert index.search("титан") == [self.iphone]
+
+    def test_columnar_not_supported(self):
+        """Тест отказа изменять колоночные категории."""
+        category = ColumnarCategory("К", "О", [Product("Т", "О", 1.0, 1)])
+        with pytest.raises(TypeError):
+            CatalogUpdater([category])
@@ -0,0 +1,93 @@
+import csv
+import gzip
+import json
+
+import pytest
+from src.columnar import ColumnarCategory
+from src.data_loader import load_data_from_json, load_data_from_rows
+from src.export import COLUMNS, export_csv, export_json, export_ndjson
+from src.models import Product, Smartphone, LawnGrass, Category
+
+
+def _catalog():
+    return [
+        Category("Смартфоны", "Телефоны, \"флагманы\"", [
+            Product("Т1", "Описание, с запятой", 100.0, 2),
+            Smartphone("Iphone", "512GB", 210000.0, 8, 98.2, "15", 512, "Gray"),
+        ]),
+        ColumnarCategory("Сад", "Трава", [LawnGrass("Трава", "Газонная\nмногострочная", 200.0, 4, "Россия",
+                                                    "7 дней", "Зеленый")]),
+    ]
+
+
+def _dump(categories):
+    return [(c.name, c.description, [repr(p) for p in c.get_products_list()]) for c in categories]
+
+
+class TestExport:
+    """Тесты потоковой выгрузки каталога."""
+
+    def setup_method(self):
+        Category.category_count = 0
+        Category.product_count = 0
+
+    @pytest.mark.parametrize("file_name", ["catalog.csv", "catalog.ndjson", "catalog.csv.gz", "catalog.jsonl.gz"])
+    def test_rows_round_trip(self, tmp_path, file_name, capsys):
+        """Тест выгрузки в CSV и NDJSON и обратной загрузки."""
+        categories = _catalog()
+        path = str(tmp_path / file_name)
+        writer = export_csv if ".csv" in file_name else export_ndjson
+
+        assert writer(categories, path) == 3
+        loaded = load_data_from_rows(path, silent=True)
+        capsys.readouterr()
+
+        assert _dump(loaded) == _dump(categories)
+        assert [type(p) for c in loaded for p in c.get_products_list()] == [Product, Smartphone, LawnGrass]
+
+    def test_json_round_trip(self, tmp_path, capsys):
+        """Тест выгрузки в формат загрузчика, в том числе пустой категории и gzip."""
+        categories = _catalog() + [Category("Пусто", "Нет товаров")]
+        path = str(tmp_path / "catalog.json.gz")
+
+        assert export_json(categories, path) == 3
+        loaded = load_data_from_json(path, silent=True)
+        capsys.readouterr()
+
+        assert _dump(loaded) == _dump(categories)
+
+    def test_csv_keeps_empty_strings(self, tmp_path, capsys):
+        """Тест сохранения пустых описаний товара и категории при загрузке CSV."""
+        categories = [Category("Пустое описание", "", [Product("Т", "", 1.0, 1),
+                                                         LawnGrass("Трава", "", 2.0, 1, "", "", "")])]
+        path = str(tmp_path / "catalog.csv")
+
+        export_csv(categories, path)
+        loaded = load_data_from_rows(path, silent=True)
+        capsys.readouterr()
+
+        assert _dump(loaded) == _dump(categories)
+
+    def test_csv_layout(self, tmp_path):
+        """Тест столбцов CSV и пустых ячеек для чужих полей."""
+        path = str(tmp_path / "catalog.csv")
+        export_csv(_catalog(), path)
+
+        with open(path, encoding='utf-8', newline='') as file:
+            rows = list(csv.DictReader(file))
+
+        assert tuple(rows[0]) == COLUMNS
+        assert rows[0]['type'] == "product" and rows[0]['memory'] == ""
+        assert rows[1]['memory'] == "512" and rows[1]['country'] == ""
+        assert rows[2]['category'] == "Сад" and rows[2]['germination_period'] == "7 дней"
+
+    def test_ndjson_is_compressed(self, tmp_path):
+        """Тест записи gzip по расширению и явному флагу."""
+        path = str(tmp_path / "catalog.out")
+        export_ndjson(_catalog(), path, compress=True)
+
+        with gzip.open(path, 'rt', encoding='utf-8') as file:
+            first = json.loads(file.readline())
+        assert first == {"category": "Смартфоны", "category_description": "Телефоны, \"флагманы\"",
+                         "type": "product", "name": "Т1", "description": "Описание, с запятой",
+                         "price": 100.0, "quantity": 2}
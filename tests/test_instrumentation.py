@@ -0,0 +1,90 @@
+import io
+
+import pytest
+from src.data_loader import load_data_from_json
+from src.instrumentation import Metrics, metrics, profile
+from src.models import Product, Category
+
+
+@pytest.fixture
+def collected():
+    metrics.reset()
+    with metrics.collecting():
+        yield metrics
+    metrics.reset()
+
+
+class TestMetrics:
+    """Тесты счетчиков и гистограмм."""
+
+    def test_disabled_by_default(self):
+        """Тест, что по умолчанию метрики не собираются."""
+        registry = Metrics()
+        with registry.timer('operation'):
+            pass
+        assert registry.enabled is False
+        assert registry.as_dict() == {'counters': {}, 'timings': {}}
+
+    def test_as_dict_and_prometheus(self):
+        """Тест экспорта в словарь и формат Prometheus."""
+        registry = Metrics()
+        registry.count('created', 2)
+        registry.observe('load', 0.5)
+        registry.observe('load', 5e-6)
+
+        snapshot = registry.as_dict()
+        assert snapshot['counters'] == {'created': 2}
+        assert snapshot['timings']['load']['count'] == 2
+        assert snapshot['timings']['load']['buckets']['1e-05'] == 1
+        assert snapshot['timings']['load']['buckets']['1.0'] == 1
+
+        text = registry.to_prometheus()
+        assert 'homework_events_total{event="created"} 2' in text
+        assert 'homework_operation_seconds_bucket{operation="load",le="1e-05"} 1' in text
+        assert 'homework_operation_seconds_bucket{operation="load",le="+Inf"} 2' in text
+        assert 'homework_operation_seconds_count{operation="load"} 2' in text
+
+
+class TestHotPathInstrumentation:
+    """Тесты замеров в models и data_loader."""
+
+    def setup_method(self):
+        Category.category_count = 0
+        Category.product_count = 0
+
+    def test_models_operations(self, collected):
+        """Тест замеров создания товаров, добавления и агрегатов."""
+        product = Product("Т", "О", 100.0, 1)
+        category = Category("К", "О", [product])
+        category.add_products([Product("Т2", "О", 200.0, 1)])
+        category.middle_price()
+        category.products
+
+        timings = collected.as_dict()['timings']
+        assert timings['product_create']['count'] == 2
+        assert timings['log_creation']['count'] == 2
+        assert timings['add_product']['count'] == 1
+        assert timings['add_products']['count'] == 1
+        assert timings['middle_price']['count'] == 1
+        assert timings['render_products']['count'] == 1
+        assert collected.as_dict()['counters'] == {'products_added_bulk': 1}
+
+    def test_load_phases(self, collected, catalog_file):
+        """Тест замеров этапов загрузки."""
+        load_data_from_json(catalog_file, silent=True)
+
+        timings = collected.as_dict()['timings']
+        assert timings['load.parse']['count'] == 2
+        assert timings['load.build']['count'] == 2
+        assert timings['load_data_from_json']['count'] == 1
+
+    def test_profile(self, catalog_file, tmp_path):
+        """Тест профилирования загрузки через cProfile."""
+        stream = io.StringIO()
+        output = tmp_path / "load.prof"
+
+        with profile(str(output), stream=stream, limit=5):
+            load_data_from_json(catalog_file, silent=True)
+
+        assert output.exists()
+        assert "function calls" in stream.getvalue()
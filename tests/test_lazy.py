@@ -0,0 +1,83 @@
+import pytest
+from src.data_loader import load_data_from_json
+from src.lazy import LazyCategory
+from src.models import Product, Smartphone, Category, ZeroQuantityError
+
+
+class TestLazyCategory:
+    """Тесты ленивой категории."""
+
+    def setup_method(self):
+        Category.category_count = 0
+        Category.product_count = 0
+        self.records = [
+            {"name": "Т1", "description": "О", "price": 100.0, "quantity": 2},
+            {"type": "smartphone", "name": "Смартфон", "description": "О", "price": 300.0, "quantity": 1,
+             "efficiency": 95.5, "model": "Модель", "memory": 128, "color": "Черный"},
+            {"name": "Т3", "description": "О", "price": 200.0, "quantity": 4},
+        ]
+
+    def test_aggregates_without_materialization(self, capsys):
+        """Тест агрегатов без создания товаров."""
+        category = LazyCategory("Тест", "Описание", self.records)
+
+        assert len(category) == 3
+        assert str(category) == "Тест, количество продуктов: 7 шт."
+        assert category.middle_price() == 200.0
+        assert category.stock_value_by_class() == {Product: 1000.0, Smartphone: 300.0}
+        assert category.min_price() == 100.0
+        assert Category.product_count == 3
+        assert not category.is_materialized
+        assert capsys.readouterr().out == ""
+
+    def test_product_at_builds_one(self):
+        """Тест создания одного товара по индексу."""
+        category = LazyCategory("Тест", "Описание", self.records)
+
+        phone = category.product_at(1)
+        assert isinstance(phone, Smartphone)
+        assert category.product_at(-2) is phone
+        assert not category.is_materialized
+
+        phone.price = 50.0
+        assert category.min_price() == 50.0
+        assert category.middle_price() == 350.0 / 3
+
+        products = category.get_products_list()
+        assert category.is_materialized
+        assert products[1] is phone
+        assert category.middle_price() == 350.0 / 3
+        phone.quantity = 2
+        assert category.total_quantity() == 8
+
+    def test_products_materializes(self):
+        """Тест материализации при обращении к products."""
+        category = LazyCategory("Тест", "Описание", self.records)
+
+        assert category.products.splitlines()[0] == "Т1, 100.0 руб. Остаток: 2 шт."
+        assert category.is_materialized
+        assert len(category) == 3
+        assert category.stock_value() == 1300.0
+
+    def test_add_product(self):
+        """Тест добавления товара в ленивую категорию."""
+        category = LazyCategory("Тест", "Описание", self.records)
+        category.add_product(Product("Т4", "О", 400.0, 1))
+
+        assert [p.name for p in category.get_products_list()] == ["Т1", "Смартфон", "Т3", "Т4"]
+        assert category.middle_price() == 250.0
+        assert Category.product_count == 4
+
+    def test_zero_quantity(self):
+        """Тест записи с нулевым количеством."""
+        with pytest.raises(ZeroQuantityError):
+            LazyCategory("Тест", "Описание", [dict(self.records[0], quantity=0)])
+
+    def test_loader_lazy_mode(self, catalog_file):
+        """Тест ленивой загрузки из JSON."""
+        categories = load_data_from_json(catalog_file, lazy=True)
+
+        assert all(isinstance(c, LazyCategory) for c in categories)
+        assert categories[0].middle_price() == (210000.0 + 31000.0) / 2
+        assert not categories[0].is_materialized
+        assert categories[1].get_products_list()[0].name == "55\" QLED 4K"
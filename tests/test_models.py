@@ -1,8 +1,16 @@
 import pytest
 from src.models import Product, Category, ZeroQuantityError, Smartphone, LawnGrass, BaseProduct, LogCreationMixin
+from src.models import suppress_creation_log, product_from_record, stock_value_by_class, total_stock_value
+from src.columnar import ColumnarCategory
+from src.lazy import LazyCategory
+from src.threadsafe import ThreadSafeCategory
 from unittest.mock import patch
 import io
+import logging
+import os
+import subprocess
 import sys
+import threading
 
 
 class TestProductClass:
@@ -254,6 +262,234 @@ class TestCategoryClass:
         assert Category.category_count == 2
 
 
+class TestProductFromRecord:
+    """Тесты создания товаров нужного класса из словаря."""
+
+    def test_subclass_new_product(self):
+        """Тест new_product у наследников Product."""
+        data = {"name": "Трава", "description": "Газонная", "price": 500.0, "quantity": 20,
+                "country": "Россия", "germination_period": "7 дней", "color": "Зеленый"}
+        grass = LawnGrass.new_product(data)
+        assert repr(grass) == "LawnGrass('Трава', 'Газонная', 500.0, 20, 'Россия', '7 дней', 'Зеленый')"
+
+    def test_dispatch_by_type(self):
+        """Тест выбора класса по полю type."""
+        base = {"name": "Т", "description": "О", "price": 100.0, "quantity": 5}
+        phone = dict(base, type="smartphone", efficiency=95.5, model="15 Pro", memory=256, color="Черный")
+
+        assert type(product_from_record(base)) is Product
+        assert type(product_from_record(dict(base, type="product"))) is Product
+        assert repr(product_from_record(phone)) == "Smartphone('Т', 'О', 100.0, 5, 95.5, '15 Pro', 256, 'Черный')"
+
+    def test_unknown_type(self):
+        """Тест записи с неизвестным типом."""
+        with pytest.raises(ValueError, match="Неизвестный тип товара"):
+            product_from_record({"name": "Т", "description": "О", "price": 1.0, "quantity": 1, "type": "car"})
+
+    def test_missing_field(self):
+        """Тест записи без обязательного поля."""
+        with pytest.raises(KeyError):
+            product_from_record({"name": "Т", "description": "О", "price": 1.0, "quantity": 1,
+                                 "type": "smartphone"})
+
+
+class TestCategoryStats:
+    """Тесты накопительных агрегатов категории."""
+
+    def setup_method(self):
+        Category.category_count = 0
+        Category.product_count = 0
+        self.p1 = Product("Т1", "Описание", 100.0, 2)
+        self.p2 = Product("Т2", "Описание", 200.0, 3)
+        self.p3 = Product("Т3", "Описание", 300.0, 1)
+        self.category = Category("Тест", "Описание", [self.p1, self.p2, self.p3])
+
+    def test_initial_aggregates(self):
+        """Тест агрегатов после добавления товаров."""
+        assert self.category.total_quantity() == 6
+        assert self.category.stock_value() == 100.0 * 2 + 200.0 * 3 + 300.0 * 1
+        assert self.category.min_price() == 100.0
+        assert self.category.max_price() == 300.0
+
+    def test_price_change(self):
+        """Тест пересчета агрегатов при смене цены."""
+        self.p2.price = 500.0
+        assert self.category.middle_price() == 300.0
+        assert self.category.stock_value() == 100.0 * 2 + 500.0 * 3 + 300.0 * 1
+        assert self.category.max_price() == 500.0
+
+        self.p1.price = 400.0
+        assert self.category.min_price() == 300.0
+
+        self.p2.price = 50.0
+        assert self.category.min_price() == 50.0
+        assert self.category.max_price() == 400.0
+
+    def test_invalid_price_change_ignored(self):
+        """Тест, что отклоненная цена не меняет агрегаты."""
+        self.p1.price = -10.0
+        assert self.category.middle_price() == 200.0
+
+    def test_quantity_change(self):
+        """Тест пересчета агрегатов при смене количества."""
+        self.p3.quantity = 10
+        assert str(self.category) == "Тест, количество продуктов: 15 шт."
+        assert self.category.stock_value() == 100.0 * 2 + 200.0 * 3 + 300.0 * 10
+
+    def test_products_rendering(self):
+        """Тест строкового списка товаров."""
+        assert self.category.products == ("Т1, 100.0 руб. Остаток: 2 шт.\n"
+                                          "Т2, 200.0 руб. Остаток: 3 шт.\n"
+                                          "Т3, 300.0 руб. Остаток: 1 шт.")
+
+    def test_stock_value_by_class(self):
+        """Тест стоимости остатков по классам товаров."""
+        phone = Smartphone("Смартфон", "Описание", 1000.0, 2, 95.5, "Модель", 128, "Черный")
+        grass = LawnGrass("Трава", "Газонная", 50.0, 10, "Россия", "7 дней", "Зеленый")
+        garden = Category("Сад", "Описание", [grass])
+        self.category.add_product(phone)
+
+        assert self.category.stock_value_by_class() == {Product: 1100.0, Smartphone: 2000.0}
+        phone.quantity = 3
+        self.p1.price = 150.0
+        assert self.category.stock_value_by_class() == {Product: 1200.0, Smartphone: 3000.0}
+
+        categories = [self.category, garden]
+        assert stock_value_by_class(categories) == {Product: 1200.0, Smartphone: 3000.0, LawnGrass: 500.0}
+        assert total_stock_value(categories) == 4700.0
+        # Значение по классу совпадает с попарным сложением через __add__
+        assert self.p1 + self.p2 == 150.0 * 2 + 200.0 * 3
+
+    def test_empty_category(self):
+        """Тест агрегатов пустой категории."""
+        category = Category("Пусто", "Описание")
+        assert category.stock_value_by_class() == {}
+        assert category.min_price() is None
+        assert category.stock_value() == 0
+        assert category.products == ""
+
+
+class TestBulkIngest:
+    """Тесты пакетного добавления товаров."""
+
+    def setup_method(self):
+        Category.category_count = 0
+        Category.product_count = 0
+
+    def test_add_products_silent(self, capsys):
+        """Тест пакетного добавления без вывода в stdout."""
+        with suppress_creation_log():
+            products = [Product(f"Т{i}", "Описание", 100.0 * (i + 1), i + 1) for i in range(3)]
+        category = Category("Тест", "Описание")
+
+        assert category.add_products(iter(products)) == 3
+        assert len(category) == 3
+        assert Category.product_count == 3
+        assert capsys.readouterr().out == ""
+
+    def test_add_products_validates_whole_batch(self):
+        """Тест, что при ошибке в пачке ничего не добавляется."""
+        p1 = Product("Т1", "Описание", 100.0, 1)
+        p2 = Product("Т2", "Описание", 100.0, 1)
+        p2.quantity = 0
+        category = Category("Тест", "Описание")
+
+        with pytest.raises(ZeroQuantityError):
+            category.add_products([p1, p2])
+        with pytest.raises(TypeError):
+            category.add_products([p1, "не продукт"])
+
+        assert len(category) == 0
+        assert Category.product_count == 0
+
+    @pytest.mark.parametrize("category_cls", [Category, ThreadSafeCategory, LazyCategory, ColumnarCategory])
+    def test_unaccountable_product_is_not_stored(self, category_cls, capsys):
+        """Тест, что товар, который нельзя учесть в агрегатах, не попадает в категорию."""
+        good = Product("Т1", "Описание", 100.0, 2)
+        bad = Product("Т2", "Описание", "сто", 1)
+        category = category_cls("Тест", "Описание")
+        category.add_products([good])
+
+        with pytest.raises(TypeError):
+            category.add_product(bad)
+        with pytest.raises(TypeError):
+            category.add_products([Product("Т3", "Описание", 300.0, 1), bad])
+
+        assert len(category) == 1
+        assert [p.name for p in category.get_products_list()] == ["Т1"]
+        assert Category.product_count == 1
+        assert category.middle_price() == 100.0
+        assert category.total_quantity() == 2
+        assert category.stock_value() == 200.0
+        assert category.stock_value_by_class() == {Product: 200.0}
+        assert category.max_price() == 100.0
+
+    def test_from_records(self, capsys):
+        """Тест создания категории из словарей."""
+        records = [
+            {"name": "Т1", "description": "О", "price": 100.0, "quantity": 2},
+            {"name": "Т2", "description": "О", "price": 300.0, "quantity": 1},
+        ]
+        category = Category.from_records("Тест", "Описание", records)
+
+        assert capsys.readouterr().out == ""
+        assert category.middle_price() == 200.0
+        assert Category.category_count == 1
+        assert Category.product_count == 2
+
+    def test_from_records_zero_quantity(self):
+        """Тест from_records с нулевым количеством."""
+        with pytest.raises(ZeroQuantityError):
+            Category.from_records("Тест", "Описание", [{"name": "Т", "description": "О", "price": 1.0,
+                                                        "quantity": 0}])
+        assert LogCreationMixin.log_creation is True
+
+    def test_suppression_is_per_thread(self, capsys):
+        """Тест, что отключение сообщений не действует на другие потоки."""
+        with suppress_creation_log():
+            worker = threading.Thread(target=Product, args=("Поток", "О", 1.0, 1))
+            worker.start()
+            worker.join()
+            Product("Тихий", "О", 1.0, 1)
+
+        assert capsys.readouterr().out == "Product('Поток', 'О', 1.0, 1)\n"
+
+    def test_creation_logger(self, capsys, caplog):
+        """Тест перенаправления сообщений о создании в logging."""
+        LogCreationMixin.creation_logger = logging.getLogger("test.creation")
+        try:
+            with caplog.at_level(logging.INFO, logger="test.creation"):
+                Product("Тест", "Описание", 100.0, 5)
+        finally:
+            LogCreationMixin.creation_logger = None
+
+        assert capsys.readouterr().out == ""
+        assert "Product('Тест', 'Описание', 100.0, 5)" in caplog.text
+
+    def test_construction_without_logging(self, capsys):
+        """Тест создания товаров по быстрому пути без логирования."""
+        with suppress_creation_log():
+            phone = Smartphone("Тел", "О", 10.0, 1, 90.0, "M", 64, "Black")
+        Smartphone.log_creation = False
+        try:
+            grass = LawnGrass("Трава", "О", 5.0, 2, "Россия", "7 дней", "Зеленый")
+            silent = Smartphone("Тел2", "О", 10.0, 1, 90.0, "M", 64, "Black")
+        finally:
+            del Smartphone.log_creation
+
+        assert capsys.readouterr().out == "LawnGrass('Трава', 'О', 5.0, 2)\n"
+        assert repr(phone) == "Smartphone('Тел', 'О', 10.0, 1, 90.0, 'M', 64, 'Black')"
+        assert silent.price == 10.0 and silent._watchers == ()
+
+    def test_import_is_lightweight(self):
+        """Тест, что импорт загрузчика не тянет logging, профилировщик и multiprocessing."""
+        code = ("import sys, src.data_loader; "
+                "print([m for m in ('logging', 'cProfile', 'multiprocessing') if m in sys.modules])")
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        result = subprocess.run([sys.executable, "-c", code], cwd=root, capture_output=True, text=True, check=True)
+        assert result.stdout.strip() == "[]"
+
+
 class TestAbstractClassesAndMixin:
     """Тесты для абстрактных классов и миксинов."""
 
@@ -276,6 +512,18 @@ class TestAbstractClassesAndMixin:
         captured = capsys.readouterr()
         assert "Product('Тест', 'Описание', 100.0, 5)" in captured.out
 
+    @pytest.mark.parametrize("product", [
+        Product("Тест", "Описание", 100.0, 5),
+        Smartphone("Тест", "Описание", 100.0, 5, 95.5, "Модель", 128, "Черный"),
+        LawnGrass("Тест", "Описание", 100.0, 5, "Россия", "7 дней", "Зеленый"),
+    ])
+    def test_compact_layout(self, product):
+        """Тест, что товары не хранят __dict__ и аргументы конструктора."""
+        assert not hasattr(product, '__dict__')
+        assert not hasattr(product, '_init_args')
+        with pytest.raises(AttributeError):
+            product.unknown_attribute = 1
+
 
 class TestIntegration:
     """Интеграционные тесты."""
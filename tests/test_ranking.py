@@ -0,0 +1,79 @@
+import pytest
+from src.columnar import ColumnarCategory
+from src.lazy import LazyCategory
+from src.models import Product, Smartphone, LawnGrass, Category, top_products, bottom_products
+from src.threadsafe import ThreadSafeCategory
+
+RECORDS = [
+    {"name": "Т1", "description": "О", "price": 100.0, "quantity": 2},
+    {"type": "smartphone", "name": "Смартфон", "description": "О", "price": 300.0, "quantity": 1,
+     "efficiency": 95.5, "model": "М", "memory": 128, "color": "Черный"},
+    {"type": "lawn_grass", "name": "Трава", "description": "О", "price": 50.0, "quantity": 10,
+     "country": "Россия", "germination_period": "7 дней", "color": "Зеленый"},
+    {"name": "Т2", "description": "О", "price": 200.0, "quantity": 3},
+]
+
+
+def _names(products):
+    return [product.name for product in products]
+
+
+class TestTopProducts:
+    """Тесты выборки n лучших и худших товаров."""
+
+    def setup_method(self):
+        Category.category_count = 0
+        Category.product_count = 0
+
+    @pytest.mark.parametrize("category_cls", [Category, ColumnarCategory, LazyCategory, ThreadSafeCategory])
+    def test_category_selection(self, category_cls):
+        """Тест выборки по полям во всех видах категорий."""
+        category = category_cls.from_records("К", "О", RECORDS)
+
+        assert _names(category.top_products(2)) == ["Смартфон", "Т2"]
+        assert _names(category.bottom_products(2)) == ["Трава", "Т1"]
+        assert _names(category.top_products(1, 'quantity')) == ["Трава"]
+        assert _names(category.top_products(3, 'stock_value')) == ["Т2", "Трава", "Смартфон"]
+        assert _names(category.top_products(5, 'memory')) == ["Смартфон"]
+        assert category.top_products(0) == []
+        assert _names(category.bottom_products(10)) == ["Трава", "Т1", "Т2", "Смартфон"]
+
+    def test_lazy_selection_does_not_materialize(self):
+        """Тест, что выборка ленивой категории создает только попавшие в неё товары."""
+        category = LazyCategory("К", "О", RECORDS)
+        top = category.top_products(1, 'stock_value')
+
+        assert isinstance(top[0], Product)
+        assert not category.is_materialized
+        assert category._built == {3: top[0]}
+
+        top[0].price = 10.0
+        assert _names(category.top_products(1, 'stock_value')) == ["Трава"]
+
+    def test_selection_follows_price_changes(self):
+        """Тест, что выборка учитывает изменения цен."""
+        products = [Product("А", "О", 10.0, 1), Product("Б", "О", 20.0, 1)]
+        category = Category("К", "О", products)
+        products[0].price = 30.0
+
+        assert _names(category.top_products(1)) == ["А"]
+
+    def test_across_categories(self):
+        """Тест выборки по набору категорий разных видов."""
+        categories = [
+            Category.from_records("К1", "О", RECORDS[:2]),
+            ColumnarCategory.from_records("К2", "О", RECORDS[2:]),
+            LazyCategory("К3", "О", [{"name": "Т3", "description": "О", "price": 150.0, "quantity": 1}]),
+        ]
+
+        assert _names(top_products(categories, 3)) == ["Смартфон", "Т2", "Т3"]
+        assert _names(bottom_products(categories, 2, 'quantity')) == ["Смартфон", "Т3"]
+        assert [type(p) for p in top_products(categories, 4, 'quantity')] == [LawnGrass, Product, Product, Smartphone]
+
+    def test_unknown_field(self):
+        """Тест выборки по неизвестному полю."""
+        category = Category("К", "О", [Product("А", "О", 10.0, 1)])
+        with pytest.raises(ValueError):
+            category.top_products(1, 'name')
+        with pytest.raises(ValueError):
+            top_products([ColumnarCategory("К", "О")], 1, 'color')
@@ -0,0 +1,124 @@
+from src.models import Product, Category, RENDER_CACHE_MAX_CHARS, render_cache
+from src.render_cache import RenderCache
+
+
+class TestRenderCache:
+    """Тесты LRU-кэша строк."""
+
+    def test_lru_eviction(self):
+        """Тест вытеснения давно не использованных записей."""
+        cache = RenderCache(maxsize=2)
+        render = str.upper
+
+        assert cache.get_or_render("a", render) == "A"
+        cache.get_or_render("b", render)
+        cache.get_or_render("a", render)
+        cache.get_or_render("c", render)
+
+        assert cache.stats() == {'hits': 1, 'misses': 3, 'evictions': 1, 'size': 2, 'chars': 2}
+        cache.get_or_render("b", render)
+        assert cache.misses == 4
+
+    def test_max_chars(self):
+        """Тест ограничения суммарной длины строк."""
+        cache = RenderCache(maxsize=10, max_chars=5)
+        cache.get_or_render("abc", str.upper)
+        cache.get_or_render("de", str.upper)
+        cache.get_or_render("fg", str.upper)
+        cache.get_or_render("too long", str.upper)
+
+        assert len(cache) == 2
+        assert cache.stats()['chars'] == 4
+
+    def test_invalidate_many(self):
+        """Тест пакетного сброса записей."""
+        cache = RenderCache()
+        for key in ("a", "bb", "c"):
+            cache.get_or_render(key, str.upper)
+
+        cache.invalidate_many(["a", "bb", "нет такого"])
+
+        assert cache.stats()['size'] == 1
+        assert cache.stats()['chars'] == 1
+
+    def test_disabled(self):
+        """Тест отключенного кэша."""
+        cache = RenderCache(maxsize=0)
+        cache.get_or_render("a", str.upper)
+        cache.get_or_render("a", str.upper)
+        assert cache.misses == 2
+        assert len(cache) == 0
+
+
+class TestRenderCacheIntegration:
+    """Тесты кэширования str(product) и Category.products."""
+
+    def setup_method(self):
+        Category.category_count = 0
+        Category.product_count = 0
+        render_cache.clear()
+        self.product = Product("Т1", "Описание", 100.0, 2)
+        self.category = Category("Тест", "Описание", [self.product])
+
+    def test_repeated_render_hits(self):
+        """Тест повторного рендеринга из кэша."""
+        first = self.category.products
+        misses = render_cache.misses
+
+        assert self.category.products is first
+        assert render_cache.misses == misses
+        assert str(self.product) == "Т1, 100.0 руб. Остаток: 2 шт."
+        assert str(self.product) == "Т1, 100.0 руб. Остаток: 2 шт."
+        assert render_cache.hits >= 2
+
+    def test_products_keeps_only_category_entry(self):
+        """Тест, что Category.products не заполняет кэш строками отдельных товаров."""
+        category = Category("Много", "Описание", [Product(f"Т{i}", "О", 1.0, 1) for i in range(100)])
+        render_cache.clear()
+
+        category.products
+
+        assert render_cache.stats()['size'] == 1
+        assert render_cache.stats()['evictions'] == 0
+
+    def test_invalidation_on_price_change(self):
+        """Тест сброса кэша при смене цены."""
+        self.category.products
+        self.product.price = 150.0
+
+        assert str(self.product) == "Т1, 150.0 руб. Остаток: 2 шт."
+        assert self.category.products == "Т1, 150.0 руб. Остаток: 2 шт."
+
+    def test_invalidation_on_quantity_change(self):
+        """Тест сброса кэша при смене количества."""
+        self.category.products
+        self.product.quantity = 7
+        assert self.category.products == "Т1, 100.0 руб. Остаток: 7 шт."
+
+    def test_invalidation_on_add(self):
+        """Тест сброса кэша при добавлении товаров."""
+        self.category.products
+        self.category.add_product(Product("Т2", "Описание", 200.0, 1))
+        assert self.category.products.splitlines()[1] == "Т2, 200.0 руб. Остаток: 1 шт."
+
+        self.category.add_products([Product("Т3", "Описание", 300.0, 1)])
+        assert len(self.category.products.splitlines()) == 3
+
+    def test_shared_cache_is_bounded_by_chars(self):
+        """Тест, что общий кэш ограничен не только числом записей, но и длиной строк."""
+        assert render_cache.max_chars == RENDER_CACHE_MAX_CHARS
+
+    def test_remove_drops_product_entries(self):
+        """Тест, что удаленные товары не остаются в кэше строк."""
+        other = Product("Т2", "Описание", 200.0, 1)
+        third = Product("Т3", "Описание", 300.0, 1)
+        self.category.add_products([other, third])
+        for product in (self.product, other, third):
+            str(product)
+
+        self.category.remove_product(self.product)
+        self.category.remove_products([other])
+
+        assert render_cache.stats()['size'] == 1
+        str(third)
+        assert render_cache.misses == 3
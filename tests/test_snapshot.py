@@ -0,0 +1,82 @@
+import pytest
+from src.columnar import ColumnarCategory
+from src.data_loader import load_data_from_json, save_snapshot, load_snapshot
+from src.models import Product, Smartphone, LawnGrass, Category
+from src.snapshot import SnapshotError
+from tests.test_data_loader import PRODUCTS_JSON
+
+
+class TestSnapshot:
+    """Тесты бинарного снимка каталога."""
+
+    def setup_method(self):
+        Category.category_count = 0
+        Category.product_count = 0
+        self.products = [
+            Product("Т1", "Описание", 100.0, 2),
+            Smartphone("Iphone 15", "512GB", 210000.0, 8, 98.2, "15", 512, "Gray space"),
+            LawnGrass("Трава", "Газонная", 500.0, 20, "Россия", "7 дней", "Зеленый"),
+        ]
+
+    def test_round_trip(self, tmp_path):
+        """Тест сохранения и загрузки категорий с наследниками Product."""
+        path = str(tmp_path / "catalog.snap")
+        categories = [
+            Category("Разное", "Все подряд", self.products),
+            ColumnarCategory("Колонки", "Описание", self.products[:1]),
+            Category("Пусто", "Описание"),
+        ]
+        save_snapshot(categories, path)
+        Category.category_count = 0
+        Category.product_count = 0
+
+        loaded = load_snapshot(path)
+
+        assert [c.name for c in loaded] == ["Разное", "Колонки", "Пусто"]
+        assert [len(c) for c in loaded] == [3, 1, 0]
+        assert Category.category_count == 3
+        assert Category.product_count == 4
+        assert [repr(p) for p in loaded[0].get_products_list()] == [repr(p) for p in self.products]
+        assert loaded[0].products == categories[0].products
+        assert loaded[0].middle_price() == categories[0].middle_price()
+        assert loaded[0].stock_value() == categories[0].stock_value()
+        assert str(loaded[2]) == "Пусто, количество продуктов: 0 шт."
+
+    def test_lazy_access(self, tmp_path):
+        """Тест чтения отдельного товара без материализации остальных."""
+        path = str(tmp_path / "catalog.snap")
+        save_snapshot([Category("Разное", "Все подряд", self.products)], path)
+
+        category = load_snapshot(path)[0]
+
+        assert category._materialized is None
+        assert repr(category.product_at(2)) == repr(self.products[2])
+        assert category._materialized is None
+
+    def test_loaded_category_accepts_new_products(self, tmp_path):
+        """Тест добавления товара в загруженную из снимка категорию."""
+        path = str(tmp_path / "catalog.snap")
+        save_snapshot([Category("Разное", "Все подряд", self.products[:1])], path)
+        category = load_snapshot(path)[0]
+
+        category.add_product(Product("Т2", "Описание", 300.0, 1))
+
+        assert len(category) == 2
+        assert category.middle_price() == 200.0
+
+    def test_products_json_round_trip(self, tmp_path):
+        """Тест снимка каталога из products.json."""
+        path = str(tmp_path / "catalog.snap")
+        categories = load_data_from_json(PRODUCTS_JSON, silent=True)
+        save_snapshot(categories, path)
+
+        loaded = load_snapshot(path)
+
+        assert [c.products for c in loaded] == [c.products for c in categories]
+
+    def test_not_a_snapshot(self, tmp_path):
+        """Тест загрузки файла другого формата."""
+        path = tmp_path / "bad.snap"
+        path.write_bytes(b"[]" * 64)
+        with pytest.raises(SnapshotError):
+            load_snapshot(str(path))
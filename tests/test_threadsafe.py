@@ -0,0 +1,167 @@
+import threading
+
+from src.models import Product, Category, suppress_creation_log
+from src.render_cache import RenderCache
+from src.threadsafe import ThreadSafeCategory
+
+THREADS = 16
+PER_THREAD = 200
+
+
+def _run(targets):
+    threads = [threading.Thread(target=target) for target in targets]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+
+def _make_products(prefix, count, price=10.0):
+    with suppress_creation_log():
+        return [Product(f"{prefix}-{i}", "О", price, 1) for i in range(count)]
+
+
+class TestThreadSafeCategory:
+    """Стресс-тесты категории при одновременной работе потоков."""
+
+    def setup_method(self):
+        Category.category_count = 0
+        Category.product_count = 0
+
+    def test_matches_category(self):
+        """Тест совпадения результатов с обычной категорией."""
+        products = [Product("Т1", "О", 100.0, 2), Product("Т2", "О", 300.0, 1)]
+        safe = ThreadSafeCategory("К", "О", products)
+        plain = Category("К", "О", products)
+
+        assert str(safe) == str(plain)
+        assert safe.products == plain.products
+        assert safe.middle_price() == plain.middle_price() == 200.0
+        assert safe.stock_value_by_class() == plain.stock_value_by_class()
+        assert safe.min_price() == 100.0
+        assert safe.max_price() == 300.0
+        products[1].price = 50.0
+        assert safe.max_price() == plain.max_price() == 100.0
+        assert safe.products == plain.products
+        safe.remove_product(products[0])
+        assert safe.get_products_list() == (products[1],)
+        assert Category.product_count == 3
+
+    def test_concurrent_writers_and_readers(self, capsys):
+        """Тест параллельных писателей и читателей: снимки согласованы, счетчики точны."""
+        category = ThreadSafeCategory("К", "О")
+        per_thread = 60
+        batches = [_make_products(f"П{n}", per_thread) for n in range(THREADS)]
+        stop = threading.Event()
+        errors = []
+
+        def writer(batch):
+            def run():
+                for index, product in enumerate(batch):
+                    if index % 2:
+                        category.add_products([product])
+                    else:
+                        category.add_product(product)
+                for product in batch[::4]:
+                    category.remove_product(product)
+            return run
+
+        def reader():
+            while not stop.is_set():
+                snapshot = category._snapshot
+                if len(snapshot.products) * 10.0 != snapshot.total_price:
+                    errors.append("агрегаты не совпадают со списком товаров")
+                if snapshot.total_quantity != len(snapshot.products):
+                    errors.append("остаток не совпадает со списком товаров")
+                if category.middle_price() not in (0, 10.0):
+                    errors.append("средняя цена вне снимка")
+                if category.products.count("\n") >= THREADS * per_thread:
+                    errors.append("строка товаров длиннее возможного списка")
+
+        readers = [threading.Thread(target=reader) for _ in range(4)]
+        for thread in readers:
+            thread.start()
+        _run([writer(batch) for batch in batches])
+        stop.set()
+        for thread in readers:
+            thread.join()
+        capsys.readouterr()
+
+        expected = THREADS * (per_thread - per_thread // 4)
+        assert errors == []
+        assert len(category) == expected
+        assert Category.product_count == expected
+        assert category.total_quantity() == expected
+        assert category.middle_price() == 10.0
+        assert len(category.products.split("\n")) == expected
+
+    def test_concurrent_product_changes(self):
+        """Тест изменения количества товаров из разных потоков."""
+        products = _make_products("Т", THREADS)
+        category = ThreadSafeCategory("К", "О")
+        category.add_products(products)
+
+        def bump(product):
+            def run():
+                for _ in range(PER_THREAD):
+                    product.quantity += 1
+            return run
+
+        _run([bump(product) for product in products])
+
+        assert category.total_quantity() == THREADS * (PER_THREAD + 1)
+        assert category.stock_value() == 10.0 * THREADS * (PER_THREAD + 1)
+
+    def test_concurrent_writes_to_same_product(self):
+        """Тест одновременной записи цены и количества одного товара из нескольких потоков."""
+        shared = _make_products("Общий", 1)[0]
+        other = _make_products("Т", 1, price=7.0)[0]
+        category = ThreadSafeCategory("К", "О", [shared, other, shared])
+
+        def writer(seed):
+            def run():
+                for step in range(PER_THREAD * 5):
+                    shared.price = float(1 + (seed * 31 + step) % 50)
+                    shared.quantity = 1 + (seed + step * 7) % 20
+            return run
+
+        _run([writer(seed) for seed in range(THREADS)])
+
+        price, quantity = shared.price, shared.quantity
+        assert category.total_quantity() == 2 * quantity + 1
+        assert category.middle_price() == (2 * price + 7.0) / 3
+        assert category.stock_value() == 2 * price * quantity + 7.0
+        assert category.min_price() == min(price, 7.0)
+        assert category.max_price() == max(price, 7.0)
+
+        category.remove_product(shared)
+        assert category.stock_value() == price * quantity + 7.0
+
+    def test_category_counters(self, capsys):
+        """Тест общих счетчиков при одновременном создании категорий."""
+        def create():
+            for index in range(PER_THREAD // 4):
+                Category("К", "О", _make_products("Т", 2))
+
+        _run([create] * THREADS)
+        capsys.readouterr()
+
+        assert Category.category_count == THREADS * (PER_THREAD // 4)
+        assert Category.product_count == THREADS * (PER_THREAD // 4) * 2
+
+
+def test_render_cache_concurrent_access():
+    """Тест LRU-кэша строк при одновременных чтениях и сбросах."""
+    cache = RenderCache(maxsize=8)
+    keys = [object() for _ in range(32)]
+
+    def worker():
+        for _ in range(PER_THREAD):
+            for key in keys:
+                cache.get_or_render(key, lambda k: "x")
+                cache.invalidate(keys[0])
+
+    _run([worker] * THREADS)
+
+    assert len(cache) <= 8
+    assert cache.stats()['chars'] == len(cache)
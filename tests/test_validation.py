@@ -0,0 +1,131 @@
+import json
+import os
+import tracemalloc
+
+import pytest
+from src.data_loader import load_data_from_json, validate_catalog
+from src.models import Category, Smartphone, ZeroQuantityError
+from src.validation import ValidationReport, check_record
+
+GOOD = {"name": "Т1", "description": "О", "price": 100.0, "quantity": 2}
+
+CATALOG = [
+    {"name": "К1", "description": "О", "products": [
+        GOOD,
+        {"name": "Ноль", "description": "О", "price": 10.0, "quantity": 0},
+    ]},
+    {"name": "К2", "description": "О", "products": [
+        {"type": "smartphone", "name": "Тел", "description": "О", "price": 5.0, "quantity": 1,
+         "efficiency": 90.0, "model": "M", "memory": 64, "color": "Black"},
+        {"name": "Минус", "description": "О", "price": -1, "quantity": 1},
+        {"name": "Без описания", "price": 1.0, "quantity": 1},
+    ]},
+    {"name": "К3", "products": []},
+]
+
+
+def _write(path, categories):
+    # По категории на строку, чтобы проверить номера строк в отчете
+    text = "[\n" + ",\n".join(json.dumps(c, ensure_ascii=False) for c in categories) + "\n]"
+    path.write_text(text, encoding='utf-8')
+    return str(path)
+
+
+class TestValidation:
+    """Тесты потоковой проверки файла каталога."""
+
+    def setup_method(self):
+        Category.category_count = 0
+        Category.product_count = 0
+
+    @pytest.mark.parametrize("record, codes", [
+        (GOOD, []),
+        (dict(GOOD, quantity=0), ['zero_quantity']),
+        (dict(GOOD, price=0), ['non_positive_price']),
+        (dict(GOOD, price="100"), ['bad_type']),
+        (dict(GOOD, quantity=True), ['bad_type']),
+        (dict(GOOD, type="car"), ['unknown_type']),
+        (dict(GOOD, type="lawn_grass"), ['missing_field'] * 3),
+        ("не объект", ['not_object']),
+    ])
+    def test_check_record(self, record, codes):
+        """Тест правил проверки записи товара."""
+        assert [code for code, _ in check_record(record)] == codes
+
+    def test_validate_catalog(self, tmp_path):
+        """Тест отчета с позициями ошибок."""
+        report = validate_catalog(_write(tmp_path / "catalog.json", CATALOG), chunk_size=16)
+
+        assert not report.ok
+        assert (report.categories, report.records, report.error_count) == (3, 5, 4)
+        assert [(i.line, i.category, i.record, i.code) for i in report.issues] == [
+            (2, 0, 1, 'zero_quantity'),
+            (3, 1, 1, 'non_positive_price'),
+            (3, 1, 2, 'missing_field'),
+            (4, 2, None, 'missing_field'),
+        ]
+        assert report.to_dict()['invalid_records'] == 3
+        assert "строка 2, категория 0, товар 1" in str(report)
+
+    def test_max_issues(self, tmp_path):
+        """Тест ограничения числа хранимых ошибок."""
+        bad = {"name": "К", "description": "О", "products": [dict(GOOD, quantity=0)] * 50}
+        path = _write(tmp_path / "catalog.json", [bad])
+
+        report = validate_catalog(path, max_issues=5)
+
+        assert report.error_count == 50
+        assert len(report.issues) == 5
+        assert str(report).endswith("... и еще 45")
+
+    def test_syntax_error(self, tmp_path):
+        """Тест синтаксической ошибки в середине файла."""
+        path = tmp_path / "broken.json"
+        path.write_text('[\n{"name": "К", "description": "О", "products": []},\n{"name": oops}\n]',
+                        encoding='utf-8')
+
+        report = validate_catalog(str(path))
+
+        assert report.categories == 1
+        assert [(i.line, i.category, i.code) for i in report.issues] == [(3, 1, 'syntax')]
+
+    def test_early_syntax_error_in_large_file(self, tmp_path):
+        """Тест, что синтаксическая ошибка в начале большого файла не читает его целиком."""
+        category = json.dumps({"name": "К", "description": "О", "products": [GOOD] * 2000}, ensure_ascii=False)
+        path = tmp_path / "broken.json"
+        with open(path, 'w', encoding='utf-8') as file:
+            file.write('[\n{"name": "К", "description": "О" "products": []}')
+            for _ in range(200):
+                file.write(',\n' + category)
+            file.write(']')
+
+        tracemalloc.start()
+        try:
+            report = validate_catalog(str(path))
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+        assert os.path.getsize(path) > 10 * 1024 * 1024
+        assert [(i.line, i.category, i.code) for i in report.issues] == [(2, 0, 'syntax')]
+        # Буфер чтения файла (1 МиБ) и одна порция текста
+        assert peak < 3 * 1024 * 1024
+
+    @pytest.mark.parametrize("options", [{}, {"silent": True}, {"lazy": True}])
+    def test_load_skip_invalid(self, tmp_path, options, capsys):
+        """Тест загрузки с пропуском некорректных записей."""
+        path = _write(tmp_path / "catalog.json", CATALOG)
+        with pytest.raises(ZeroQuantityError):
+            load_data_from_json(path, **options)
+        Category.product_count = 0
+
+        report = ValidationReport()
+        categories = load_data_from_json(path, skip_invalid=True, report=report, **options)
+        capsys.readouterr()
+
+        assert [c.name for c in categories] == ["К1", "К2"]
+        assert [p.name for c in categories for p in c.get_products_list()] == ["Т1", "Тел"]
+        assert isinstance(categories[1].get_products_list()[0], Smartphone)
+        assert Category.product_count == 2
+        assert report.error_count == 4
+        assert load_data_from_json(path, skip_invalid=True, silent=True)[0].name == "К1"